@@ -0,0 +1,86 @@
+import hmac
+from typing import Optional
+from fastapi import APIRouter, Depends, Header, HTTPException
+from fastapi.responses import PlainTextResponse
+from app.core.config import settings
+from app.manager import cache_manager, cache_metrics, single_flight, invalidation_bus
+from app.manager.metrics import render_exposition
+
+
+async def require_admin_token(authorization: Optional[str] = Header(None)) -> None:
+    """Only serve admin endpoints to callers presenting ADMIN_TOKEN as a bearer token"""
+    if not settings.ADMIN_TOKEN:
+        raise HTTPException(status_code=404, detail="Not Found")
+    scheme, _, token = (authorization or "").partition(" ")
+    if scheme.lower() != "bearer" or not hmac.compare_digest(
+            token.encode(), settings.ADMIN_TOKEN.encode()):
+        raise HTTPException(status_code=401, detail="Invalid admin token",
+                            headers={"WWW-Authenticate": "Bearer"})
+
+
+router = APIRouter(dependencies=[Depends(require_admin_token)])
+
+
+@router.get("/cache")
+async def cache_stats():
+    """Report cache effectiveness per namespace and tier for this worker"""
+    return {
+        "cache": await cache_manager.astats(),
+        "redis": await cache_manager.redis_info(),
+        "single_flight": single_flight.stats(),
+        "invalidation": invalidation_bus.stats(),
+    }
+
+
+@router.get("/metrics", response_class=PlainTextResponse)
+async def metrics():
+    """Expose this worker's cache metrics in the Prometheus text format"""
+    stats = await cache_manager.astats()
+    memory, breaker = stats["memory"], stats["redis_breaker"]
+    flights = single_flight.stats()
+    messages = invalidation_bus.stats()
+
+    extra = {
+        "memory_cache_max_bytes": (
+            "gauge", "Byte budget of the in-process cache.", memory["max_bytes"]),
+        "memory_cache_max_entries": (
+            "gauge", "Entry limit of the in-process cache.", memory["max_entries"]),
+        "memory_cache_rejections_total": (
+            "counter", "Values too large for the in-process cache.", memory["rejections"]),
+        "redis_breaker_open": (
+            "gauge", "1 while Redis calls are skipped by the circuit breaker.",
+            int(breaker["state"] != "closed")),
+        "redis_breaker_opened_total": (
+            "counter", "Times the Redis circuit breaker opened.", breaker["opened"]),
+        "redis_breaker_skipped_total": (
+            "counter", "Redis calls skipped while the breaker was open.", breaker["skipped"]),
+        "single_flight_executions_total": (
+            "counter", "Operations run by this worker.", flights["executions"]),
+        "single_flight_coalesced_total": (
+            "counter", "Calls that joined an operation in flight in this worker.",
+            flights["coalesced"]),
+        "single_flight_remote_hits_total": (
+            "counter", "Calls answered by another worker's result.", flights["remote_hits"]),
+        "single_flight_in_flight": (
+            "gauge", "Operations currently in flight.", flights["in_flight"]),
+        "invalidation_published_total": (
+            "counter", "Invalidation messages published.", messages["published"]),
+        "invalidation_received_total": (
+            "counter", "Invalidation messages received from other workers.",
+            messages["received"]),
+    }
+    if stats["disk"]:
+        disk = stats["disk"]
+        extra.update({
+            "disk_cache_bytes": (
+                "gauge", "Payload bytes stored in the disk cache.", disk["bytes"] or 0),
+            "disk_cache_max_bytes": (
+                "gauge", "Byte budget of the disk cache.", disk["max_bytes"]),
+            "disk_cache_entries": (
+                "gauge", "Entries stored in the disk cache.", disk["entries"] or 0),
+            "disk_cache_errors_total": (
+                "counter", "Failed disk cache operations.", disk["errors"]),
+        })
+    return PlainTextResponse(
+        render_exposition(cache_metrics.metrics(), extra),
+        media_type="text/plain; version=0.0.4; charset=utf-8")
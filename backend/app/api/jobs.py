@@ -39,6 +39,8 @@ async def upload_job(
 
     try:
         return await job_engine.from_file(file)
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error processing job description: {str(e)}")
         raise HTTPException(
@@ -59,6 +61,8 @@ async def process_job_url(
         )
     try:
         return await job_engine.from_url(url_request.url)
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error processing job description: {str(e)}")
         raise HTTPException(
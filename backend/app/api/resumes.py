@@ -31,6 +31,8 @@ async def upload_resume(
 
     try:
         return await resume_engine.from_file(file)
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error processing resume: {str(e)}")
         raise HTTPException(
@@ -51,6 +53,8 @@ async def process_resume_url(
         )
     try:
         return await resume_engine.from_url(url_request.url)
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error processing resume: {str(e)}")
         raise HTTPException(
@@ -0,0 +1,276 @@
+import math
+import re
+from collections import Counter
+from typing import Callable, Optional
+from loguru import logger
+from app.core.config import settings
+
+
+# Paragraphs matching any of these are legal or site boilerplate that says
+# nothing about the role or the candidate
+BOILERPLATE_PATTERNS = [
+    re.compile(pattern, re.IGNORECASE) for pattern in (
+        r"equal (employment )?opportunity employer",
+        r"without regard to (race|color|religion|sex|gender|age|national origin)",
+        r"reasonable accommodations?",
+        r"\be-verify\b",
+        r"\bwe use cookies\b",
+        r"\bcookie (policy|settings|preferences)\b",
+        r"\baccept (all )?cookies\b",
+        r"\bprivacy policy\b",
+        r"\ball rights reserved\b",
+    )
+]
+
+# Paragraphs longer than this are kept even if they mention boilerplate,
+# since badly wrapped PDFs can put a whole posting in one paragraph
+MAX_BOILERPLATE_PARAGRAPH = 600
+
+# Share of a paragraph's characters that must sit in sentences matching a
+# boilerplate pattern, so a paragraph that merely mentions one is kept
+MIN_BOILERPLATE_SHARE = 0.6
+
+SENTENCE_BREAK = re.compile(r"(?<=[.!?])\s+")
+
+PAGE_NUMBER_LINE = re.compile(
+    r"^(?P<label>page\s*)?(?P<number>\d+)(?P<total>\s*(of|/)\s*\d+)?$", re.IGNORECASE)
+
+
+class TextCompactor:
+    """🗜️ Shrinks extracted document text before it is sent to the LLM
+
+    Applied between text extraction and resume/job parsing:
+    - 🧹 Collapses runs of whitespace and blank lines
+    - 📑 Drops page numbers and headers/footers repeated across pages
+    - 🚫 Removes boilerplate such as EEO statements and cookie banners,
+      from job postings only, since a resume can legitimately describe
+      work on privacy policies or accommodation tooling
+    - 🎯 Trims the result to a token budget at paragraph boundaries
+
+    Headers, footers and page numbers are only looked for in the first and
+    last few lines of each page, so repeated job titles or section headings
+    in the body, and years on a line of their own, are left alone.
+
+    Fewer input tokens lowers both the latency and the cost of every parse.
+    """
+
+    def __init__(self, token_budget: int = settings.LLM_INPUT_TOKEN_BUDGET, edge_lines: int = 2, min_page_share: float = 0.5):
+        """🏗️ Initialize the compactor
+
+        Args:
+            token_budget: Maximum tokens of document text to keep (0 disables)
+            edge_lines: Lines at the top and bottom of a page that may be
+                a header, footer or page number
+            min_page_share: Share of pages (and at least two) that must carry
+                a line in the same edge position for it to count as a header
+                or footer
+        """
+        self.token_budget = token_budget
+        self.edge_lines = edge_lines
+        self.min_page_share = min_page_share
+        self._token_counter: Optional[Callable[[str], int]] = None
+
+    def _count_tokens(self, text: str) -> int:
+        """🔢 Count tokens with tiktoken, or estimate four characters per token"""
+        if self._token_counter is None:
+            try:
+                import tiktoken
+
+                encoding = tiktoken.get_encoding("cl100k_base")
+                self._token_counter = lambda value: len(
+                    encoding.encode(value, disallowed_special=()))
+            except Exception as e:
+                logger.warning(
+                    f"tiktoken unavailable, estimating token counts: {str(e)}")
+                self._token_counter = lambda value: len(value) // 4 + 1
+        return self._token_counter(text)
+
+    @classmethod
+    def normalize_whitespace(cls, text: str) -> str:
+        """🧹 Collapse spaces, strip lines and squeeze blank lines"""
+        text = text.replace("\u00a0", " ").replace("\u200b", "")
+        text = re.sub(r"[ \t\f\v]+", " ", text)
+        lines = [line.strip() for line in text.splitlines()]
+        return re.sub(r"\n{3,}", "\n\n", "\n".join(lines)).strip()
+
+    @classmethod
+    def split_pages(cls, text: str, page_starts: Optional[list[int]] = None) -> list[str]:
+        """📄 Cut extracted text back into pages at their start offsets"""
+        if not page_starts:
+            return [text]
+        ends = page_starts[1:] + [len(text)]
+        return [text[start:end] for start, end in zip(page_starts, ends)]
+
+    def _edge_positions(self, lines: list[str]) -> dict[int, int]:
+        """🔝 Map the first and last non-empty lines of a page to their edge position
+
+        Positions count from the top (0, 1, ...) or from the bottom
+        (-1, -2, ...), so a running header is matched in the same slot on
+        every page.
+        """
+        filled = [index for index, line in enumerate(lines) if line]
+        positions = {index: -1 - position
+                     for position, index in enumerate(reversed(filled[-self.edge_lines:]))}
+        positions.update({index: position
+                          for position, index in enumerate(filled[:self.edge_lines])})
+        return positions
+
+    @classmethod
+    def _is_page_number(cls, line: str, page_count: int) -> bool:
+        """🔢 Whether a line is a page number such as ``3``, ``Page 3`` or ``3 of 7``
+
+        A bare number only counts if it could be a page of this document,
+        so a year such as 2019 on a line of its own is kept.
+        """
+        match = PAGE_NUMBER_LINE.match(line)
+        if not match:
+            return False
+        return bool(match.group("label") or match.group("total")) or int(match.group("number")) <= page_count
+
+    def drop_repeated_lines(self, pages: list[str]) -> list[str]:
+        """📑 Remove page numbers and headers and footers repeated across pages
+
+        Only the first and last ``edge_lines`` lines of each page are
+        candidates. Page numbers there are dropped; a short line found in
+        the same edge position on enough pages is kept only the first time.
+
+        Args:
+            pages: Whitespace-normalized text of each page
+
+        Returns:
+            The pages without their running headers, footers and numbers
+        """
+        page_lines = [page.split("\n") for page in pages]
+        edges = [self._edge_positions(lines) for lines in page_lines]
+
+        pages_with_line = Counter()
+        for lines, positions in zip(page_lines, edges):
+            pages_with_line.update({
+                (position, lines[index]) for index, position in positions.items()
+                if 3 < len(lines[index]) <= 100})
+        min_pages = max(2, math.ceil(len(pages) * self.min_page_share))
+
+        seen = set()
+        compacted = []
+        for lines, positions in zip(page_lines, edges):
+            dropped = set()
+            for index, position in positions.items():
+                line = lines[index]
+                if self._is_page_number(line, len(pages)):
+                    dropped.add(index)
+                    continue
+                key = (position, line)
+                if pages_with_line[key] >= min_pages:
+                    if key in seen:
+                        dropped.add(index)
+                    seen.add(key)
+            kept = [line for index, line in enumerate(lines) if index not in dropped]
+            compacted.append(re.sub(r"\n{3,}", "\n\n", "\n".join(kept)).strip())
+        return compacted
+
+    @classmethod
+    def _is_boilerplate(cls, paragraph: str) -> bool:
+        """🔍 Whether a short paragraph consists mostly of boilerplate sentences"""
+        if not paragraph or len(paragraph) > MAX_BOILERPLATE_PARAGRAPH:
+            return False
+        matched = sum(
+            len(sentence) for sentence in SENTENCE_BREAK.split(paragraph)
+            if any(pattern.search(sentence) for pattern in BOILERPLATE_PATTERNS))
+        return matched >= MIN_BOILERPLATE_SHARE * len(paragraph)
+
+    @classmethod
+    def drop_boilerplate(cls, text: str) -> str:
+        """🚫 Remove short paragraphs made up mostly of legal or website boilerplate"""
+        paragraphs = text.split("\n\n")
+        return "\n\n".join(
+            paragraph for paragraph in paragraphs if not cls._is_boilerplate(paragraph))
+
+    def enforce_budget(self, text: str) -> str:
+        """🎯 Keep whole paragraphs from the start until the token budget is spent"""
+        if not self.token_budget or self._count_tokens(text) <= self.token_budget:
+            return text
+
+        kept = []
+        used = 0
+        for paragraph in text.split("\n\n"):
+            cost = self._count_tokens(paragraph)
+            if used + cost > self.token_budget:
+                # Fill the remainder with the start of the paragraph that overflows
+                remaining = self.token_budget - used
+                if remaining > 0:
+                    kept.append(paragraph[:remaining * 4].rsplit(" ", 1)[0])
+                break
+            kept.append(paragraph)
+            used += cost
+
+        logger.info(
+            f"Trimmed document text to the {self.token_budget} token budget")
+        return "\n\n".join(kept)
+
+    def clean(self, text: str, page_starts: Optional[list[int]] = None, remove_boilerplate: bool = False) -> str:
+        """🧹 Run every compaction step except the token budget
+
+        Args:
+            text: Extracted document text
+            page_starts: Offset of each page in the text, if known
+            remove_boilerplate: Whether to drop boilerplate paragraphs,
+                for job postings
+
+        Returns:
+            Compacted text, not yet trimmed to the budget
+        """
+        pages = [self.normalize_whitespace(page)
+                 for page in self.split_pages(text, page_starts)]
+        pages = self.drop_repeated_lines(pages)
+        text = "\n\n".join(page for page in pages if page)
+        return self.drop_boilerplate(text) if remove_boilerplate else text
+
+    def compact(self, text: str, page_starts: Optional[list[int]] = None, remove_boilerplate: bool = False) -> str:
+        """🗜️ Run every compaction step and return the text for the LLM
+
+        Args:
+            text: Extracted document text
+            page_starts: Offset of each page in the text, if known
+            remove_boilerplate: Whether to drop boilerplate paragraphs,
+                for job postings
+
+        Returns:
+            Compacted text within the token budget
+        """
+        original_length = len(text)
+        text = self.enforce_budget(self.clean(text, page_starts, remove_boilerplate))
+        logger.info(
+            f"Compacted document text from {original_length} to {len(text)} characters")
+        return text
+
+    def compact_document(self, document, remove_boilerplate: bool = False) -> str:
+        """🗜️ Compact a DocumentChunk, recording any text cut by the budget
+
+        Tokens dropped to fit LLM_INPUT_TOKEN_BUDGET are logged and stored
+        in ``document.metadata.truncated_tokens``, so a cut document is
+        never parsed silently.
+
+        Args:
+            document: DocumentChunk with the extracted text and page offsets
+            remove_boilerplate: Whether to drop boilerplate paragraphs,
+                for job postings
+
+        Returns:
+            Compacted text within the token budget
+        """
+        text = self.clean(
+            document.raw_text, document.metadata.page_starts, remove_boilerplate)
+        tokens = self._count_tokens(text) if self.token_budget else 0
+        if tokens > self.token_budget:
+            document.metadata.truncated_tokens = tokens - self.token_budget
+            logger.warning(
+                f"{document.file_name} has {tokens} tokens after compaction, "
+                f"cutting it to the {self.token_budget} token budget")
+        text = self.enforce_budget(text)
+        logger.info(
+            f"Compacted {document.file_name} from {len(document.raw_text)} to {len(text)} characters")
+        return text
+
+
+# Create a singleton instance for global use
+text_compactor = TextCompactor()
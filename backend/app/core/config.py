@@ -13,10 +13,14 @@ class Settings:
 
     # File upload settings
     MAX_UPLOAD_SIZE: int = 10 * 1024 * 1024  # 10 MB limit
+    UPLOAD_CHUNK_SIZE: int = 1024 * 1024  # Read uploads 1 MB at a time
     ALLOWED_EXTENSIONS: list = ["pdf", "doc", "docx"]
 
     # Storage settings
     UPLOAD_DIR: str = "uploads"
+    # Directory owned by the app for local state such as the disk cache;
+    # mount a volume here so it survives restarts
+    DATA_DIR: str = os.getenv("DATA_DIR", "data")
 
     # MongoDB settings
     MONGODB_URL: str = os.getenv("MONGODB_URL", "mongodb://localhost:27017")
@@ -24,6 +28,122 @@ class Settings:
 
     REDIS_URL: str = os.getenv("REDIS_URL", "redis://localhost:6379/0")
     REDIS_TTL: int = int(os.getenv("REDIS_TTL", "86400"))  # 24 hours default
+    # Every cache key is prefixed with this, so deployments sharing a Redis
+    # can clear their own entries without touching each other's
+    CACHE_KEY_PREFIX: str = os.getenv("CACHE_KEY_PREFIX", "tirenohire")
+    CACHE_SCAN_COUNT: int = int(os.getenv("CACHE_SCAN_COUNT", "1000"))
+    CACHE_UNLINK_BATCH: int = int(os.getenv("CACHE_UNLINK_BATCH", "500"))
+    # Cache writes are broadcast so other workers drop their in-process copies
+    CACHE_INVALIDATION_ENABLED: bool = os.getenv(
+        "CACHE_INVALIDATION_ENABLED", "true").lower() == "true"
+    REDIS_MAX_CONNECTIONS: int = int(os.getenv("REDIS_MAX_CONNECTIONS", "50"))
+    REDIS_SOCKET_TIMEOUT: float = float(
+        os.getenv("REDIS_SOCKET_TIMEOUT", "1.0"))
+    REDIS_CONNECT_TIMEOUT: float = float(
+        os.getenv("REDIS_CONNECT_TIMEOUT", "1.0"))
+    # After this many consecutive connection errors or timeouts Redis is
+    # skipped for the cooldown (doubling while it stays down)
+    REDIS_BREAKER_FAILURE_THRESHOLD: int = int(
+        os.getenv("REDIS_BREAKER_FAILURE_THRESHOLD", "5"))
+    REDIS_BREAKER_COOLDOWN: float = float(
+        os.getenv("REDIS_BREAKER_COOLDOWN", "10"))
+    REDIS_BREAKER_MAX_COOLDOWN: float = float(
+        os.getenv("REDIS_BREAKER_MAX_COOLDOWN", "120"))
+
+    # Outbound HTTP settings
+    HTTP_CONNECT_TIMEOUT: float = float(os.getenv("HTTP_CONNECT_TIMEOUT", "10"))
+    HTTP_READ_TIMEOUT: float = float(os.getenv("HTTP_READ_TIMEOUT", "30"))
+    HTTP_POOL_SIZE: int = int(os.getenv("HTTP_POOL_SIZE", "100"))
+    HTTP_POOL_SIZE_PER_HOST: int = int(os.getenv("HTTP_POOL_SIZE_PER_HOST", "10"))
+    HTTP_KEEPALIVE_TIMEOUT: float = float(os.getenv("HTTP_KEEPALIVE_TIMEOUT", "30"))
+    HTTP_CHUNK_SIZE: int = 64 * 1024
+
+    # Document extraction settings (0 workers extracts in a thread instead)
+    EXTRACTION_POOL_SIZE: int = int(os.getenv("EXTRACTION_POOL_SIZE", "2"))
+    EXTRACTION_QUEUE_SIZE: int = int(os.getenv("EXTRACTION_QUEUE_SIZE", "32"))
+    EXTRACTION_TASK_TIMEOUT: float = float(
+        os.getenv("EXTRACTION_TASK_TIMEOUT", "60"))
+    EXTRACTION_MAX_TASKS_PER_CHILD: int = int(
+        os.getenv("EXTRACTION_MAX_TASKS_PER_CHILD", "100"))
+
+    # PDFs with at least PDF_PARALLEL_MIN_PAGES pages are split across the
+    # extraction pool in batches of PDF_PAGES_PER_TASK pages
+    PDF_MAX_PAGES: int = int(os.getenv("PDF_MAX_PAGES", "200"))
+    PDF_PAGE_TIMEOUT: float = float(os.getenv("PDF_PAGE_TIMEOUT", "10"))
+    PDF_PARALLEL_MIN_PAGES: int = int(os.getenv("PDF_PARALLEL_MIN_PAGES", "8"))
+    PDF_PAGES_PER_TASK: int = int(os.getenv("PDF_PAGES_PER_TASK", "4"))
+
+    # HTML text shorter than this falls back from trafilatura to Unstructured
+    HTML_MIN_TEXT_LENGTH: int = int(os.getenv("HTML_MIN_TEXT_LENGTH", "200"))
+
+    # Document text sent to the LLM parsers is compacted to at most this
+    # many tokens (0 disables the limit); roomy enough for 20+ page CVs,
+    # and any cut is logged and recorded in the chunk's metadata
+    LLM_INPUT_TOKEN_BUDGET: int = int(
+        os.getenv("LLM_INPUT_TOKEN_BUDGET", "16000"))
+
+    # In-process cache tier: LRU bounded by entry count and bytes, values
+    # above MEMORY_CACHE_MAX_ITEM_BYTES are left to Redis only
+    MEMORY_CACHE_MAX_ENTRIES: int = int(
+        os.getenv("MEMORY_CACHE_MAX_ENTRIES", "10000"))
+    MEMORY_CACHE_MAX_BYTES: int = int(
+        os.getenv("MEMORY_CACHE_MAX_BYTES", str(256 * 1024 * 1024)))
+    MEMORY_CACHE_MAX_ITEM_BYTES: int = int(
+        os.getenv("MEMORY_CACHE_MAX_ITEM_BYTES", str(4 * 1024 * 1024)))
+    MEMORY_CACHE_SWEEP_INTERVAL: float = float(
+        os.getenv("MEMORY_CACHE_SWEEP_INTERVAL", "60"))
+    # Values read from Redis are kept in process memory for this long
+    MEMORY_CACHE_PROMOTION_TTL: int = int(
+        os.getenv("MEMORY_CACHE_PROMOTION_TTL", "300"))
+
+    # On-disk cache tier (SQLite), shared by the workers on a host and used
+    # whenever Redis is unset or unreachable. On by default, in DATA_DIR;
+    # set DISK_CACHE_PATH to an empty string to turn it off.
+    DISK_CACHE_PATH: str = os.getenv(
+        "DISK_CACHE_PATH", os.path.join(DATA_DIR, "cache.sqlite3"))
+    DISK_CACHE_MAX_BYTES: int = int(
+        os.getenv("DISK_CACHE_MAX_BYTES", str(1024 * 1024 * 1024)))
+    DISK_CACHE_MAX_ITEM_BYTES: int = int(
+        os.getenv("DISK_CACHE_MAX_ITEM_BYTES", str(32 * 1024 * 1024)))
+    # Entries written to disk while a configured Redis is down live at most
+    # this long, since invalidations made through Redis never reach them
+    DISK_CACHE_FALLBACK_TTL: int = int(
+        os.getenv("DISK_CACHE_FALLBACK_TTL", "3600"))
+
+    # Cached values encoded above this many bytes are compressed (0 disables)
+    CACHE_COMPRESSION_THRESHOLD: int = int(
+        os.getenv("CACHE_COMPRESSION_THRESHOLD", "1024"))
+    CACHE_COMPRESSION_LEVEL: int = int(
+        os.getenv("CACHE_COMPRESSION_LEVEL", "3"))
+
+    # Identical fetch/parse work is coalesced; followers on other workers
+    # wait for the leader's result for up to SINGLE_FLIGHT_WAIT_TIMEOUT.
+    # The leader renews its lease every third of SINGLE_FLIGHT_LEASE_TTL
+    # while it works, so the TTL only bounds how long a dead leader blocks.
+    SINGLE_FLIGHT_LEASE_TTL: int = int(
+        os.getenv("SINGLE_FLIGHT_LEASE_TTL", "120"))
+    SINGLE_FLIGHT_WAIT_TIMEOUT: float = float(
+        os.getenv("SINGLE_FLIGHT_WAIT_TIMEOUT", "120"))
+    SINGLE_FLIGHT_POLL_INTERVAL: float = float(
+        os.getenv("SINGLE_FLIGHT_POLL_INTERVAL", "0.5"))
+
+    # Failing URLs are skipped for a reason-specific, exponentially growing
+    # TTL; hosts are backed off after HOST_FAILURE_THRESHOLD failures in a row
+    NEGATIVE_CACHE_ENABLED: bool = os.getenv(
+        "NEGATIVE_CACHE_ENABLED", "true").lower() == "true"
+    NEGATIVE_CACHE_MAX_TTL: int = int(
+        os.getenv("NEGATIVE_CACHE_MAX_TTL", "86400"))
+    HOST_FAILURE_THRESHOLD: int = int(os.getenv("HOST_FAILURE_THRESHOLD", "3"))
+    HOST_BACKOFF_BASE: int = int(os.getenv("HOST_BACKOFF_BASE", "30"))
+    HOST_BACKOFF_MAX: int = int(os.getenv("HOST_BACKOFF_MAX", "900"))
+
+    # Cached URL content older than this is still served, but revalidated
+    # in the background with a conditional request
+    URL_CONTENT_SOFT_TTL: int = int(os.getenv("URL_CONTENT_SOFT_TTL", "3600"))
+
+    # Bearer token for the /api/admin cache and metrics endpoints; they
+    # answer 404 while it is unset
+    ADMIN_TOKEN: Optional[str] = os.getenv("ADMIN_TOKEN") or None
 
     # Cache settings
     CACHE_URL_CONTENT: bool = True
@@ -1,22 +1,22 @@
-from langchain_community.document_loaders import (
-    PyPDFLoader,
-    Docx2txtLoader,
-    UnstructuredHTMLLoader,
-    TextLoader,
-    BSHTMLLoader,
-    UnstructuredURLLoader,
-)
-from langchain.document_loaders.base import BaseLoader
-from langchain.text_splitter import RecursiveCharacterTextSplitter
+import asyncio
 import hashlib
-import tempfile
-import os
-import requests
+import math
+import time
+from typing import Any, Awaitable, Callable, Optional
 from fastapi import UploadFile, HTTPException
 from loguru import logger
 from pydantic import BaseModel, HttpUrl
 from app.core.config import settings
-from app.manager import cache_manager
+from app.manager import cache_manager, cache_metrics, cached, CacheNamespace
+from app.core.http_client import FetchError, http_fetcher
+from app.core.negative_cache import negative_cache
+from app.core.extraction import (
+    DocumentFormat,
+    UnsupportedFormatError,
+    extraction_executor,
+    extractor_version,
+    sniff_format,
+)
 
 
 class DocumentChunk(BaseModel):
@@ -28,11 +28,14 @@ class DocumentChunk(BaseModel):
     class Metadata(BaseModel):
         """📊 Document processing statistics and metrics
 
-        Tracks the number of pages in the original document and how many
-        chunks it was split into during processing.
+        Tracks the number of pages in the original document, how many
+        chunks it spans, where each page starts in the raw text, and how
+        many tokens were cut to fit the LLM input budget.
         """
         page_count: int
         chunk_count: int
+        page_starts: list[int] = []
+        truncated_tokens: int = 0
 
     content_hash: str
     raw_text: str
@@ -40,6 +43,35 @@ class DocumentChunk(BaseModel):
     metadata: Metadata
 
 
+class IngestedUpload(BaseModel):
+    """📥 An upload that has been hashed and size-checked but not yet parsed
+
+    Keeps a handle on the UploadFile's spooled file so extraction can read
+    it in place instead of working on another in-memory copy.
+    """
+    content_hash: str
+    file_name: str
+    content_type: str
+    size: int
+    file: Any  # binary file object (the UploadFile's SpooledTemporaryFile)
+
+
+class FetchedDocument(BaseModel):
+    """🌐 Raw bytes of a URL document, downloaded or served from cache"""
+    url: str
+    content: bytes
+    content_type: str
+    content_hash: str
+
+
+# Called with a URL's new document when background revalidation finds it changed
+ChangeCallback = Callable[[FetchedDocument], Awaitable[Any]]
+
+# Size of the chunks reported in DocumentChunk metadata
+CHUNK_SIZE = 4000
+CHUNK_OVERLAP = 200
+
+
 class ContentProcessor:
     """🔄 Processes various content types into structured document chunks
 
@@ -48,50 +80,15 @@ class ContentProcessor:
     for further processing by language models.
     """
 
-    def __init__(self):
-        """🏗️ Initialize the content processor with text splitting configuration
-
-        Sets up the text splitter with appropriate chunk size and overlap settings
-        for optimal processing of documents into manageable pieces.
-        """
-        self.text_splitter = RecursiveCharacterTextSplitter(
-            chunk_size=4000,
-            chunk_overlap=200,
-            length_function=len,
-            separators=["\n\n", "\n", " ", ""]
-        )
-
-    @classmethod
-    def _write_to_temp_file(cls, content: bytes, suffix: str) -> str:
-        """💾 Helper to write content bytes to a temporary file
-
-            Creates a temporary file with the specified suffix and writes the
-            provided content to it, returning the file path for further processing.
-        """
-        with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as temp_file:
-            temp_file.write(content)
-            temp_path = temp_file.name
-        return temp_path
+    # Background revalidations in flight by URL, shared by every instance
+    _revalidations: dict[str, asyncio.Task] = {}
 
     @classmethod
-    def _get_loader_for_file(cls, file_name: str) -> BaseLoader:
-        """🔍 Determine the appropriate document loader based on file extension
-
-        Maps file extensions to their corresponding LangChain document loaders
-        to ensure proper parsing of different document formats.
-        """
-        if file_name.endswith(".pdf"):
-            return PyPDFLoader
-        elif file_name.endswith(".docx") or file_name.endswith(".doc"):
-            return Docx2txtLoader
-        elif file_name.lower().endswith('.txt'):
-            return TextLoader
-        elif file_name.endswith(".html"):
-            return UnstructuredHTMLLoader
-        elif file_name.endswith(".bshtml"):
-            return BSHTMLLoader
-        else:
-            raise ValueError(f"Unsupported file format: {file_name}")
+    def _count_chunks(cls, text: str) -> int:
+        """🧮 Count the CHUNK_SIZE chunks, overlapping by CHUNK_OVERLAP, a text spans"""
+        if not text:
+            return 0
+        return max(1, math.ceil((len(text) - CHUNK_OVERLAP) / (CHUNK_SIZE - CHUNK_OVERLAP)))
 
     @classmethod
     def _compute_hash(cls, content: bytes) -> str:
@@ -102,54 +99,120 @@ class ContentProcessor:
         """
         return hashlib.sha256(content).hexdigest()
 
-    async def process_file(self, file: UploadFile) -> DocumentChunk:
-        """📁 Process an uploaded file into a structured document chunk
+    async def ingest_file(self, file: UploadFile) -> IngestedUpload:
+        """📥 Stream an upload in chunks, hashing it and enforcing the size limit
 
-        Handles the file upload, creates a temporary local copy, extracts text
-        using the appropriate loader, splits into chunks, and returns a
-        standardized document representation with metadata.
-        """
-        logger.info(f"Processing file: {file.filename}")
+        Reads the spooled upload piece by piece, updating the SHA-256 as it
+        goes, and rejects it with 413 as soon as it passes MAX_UPLOAD_SIZE,
+        so an oversized upload is never held in memory as a whole.
 
-        content = await file.read()
-        content_hash = self._compute_hash(content)
+        Raises:
+            HTTPException: 413 if the upload is larger than MAX_UPLOAD_SIZE
+        """
+        limit = settings.MAX_UPLOAD_SIZE
+        if file.size is not None and file.size > limit:
+            raise HTTPException(
+                status_code=413,
+                detail=f"File is too large ({file.size} bytes, limit {limit})")
+
+        hasher = hashlib.sha256()
+        size = 0
+        await file.seek(0)
+        while chunk := await file.read(settings.UPLOAD_CHUNK_SIZE):
+            size += len(chunk)
+            if size > limit:
+                raise HTTPException(
+                    status_code=413,
+                    detail=f"File exceeds the {limit} byte upload limit")
+            hasher.update(chunk)
+        await file.seek(0)
+
+        return IngestedUpload(
+            content_hash=hasher.hexdigest(),
+            file_name=file.filename,
+            content_type=file.content_type or "",
+            size=size,
+            file=file.file,
+        )
 
-        temp_path = self._write_to_temp_file(
-            content,
-            os.path.splitext(file.filename)[1]
+    async def _extract_document(self, source, document_format: DocumentFormat, content_hash: str, file_name: str) -> DocumentChunk:
+        """🧩 Extract a document, going through the extraction cache"""
+        extracted = await self._extract_text(source, document_format, content_hash)
+        return DocumentChunk(
+            content_hash=content_hash,
+            raw_text=extracted["text"],
+            file_name=file_name,
+            metadata=DocumentChunk.Metadata(
+                page_count=extracted["page_count"],
+                chunk_count=extracted["chunk_count"],
+                page_starts=extracted.get("page_starts", [])
+            )
         )
 
+    @cached(CacheNamespace.EXTRACTED,
+            key=lambda self, source, document_format, content_hash:
+                f"{extractor_version(document_format)}:{content_hash}",
+            ttl=settings.REDIS_TTL,
+            enabled=lambda: settings.CACHE_EXTRACTED_TEXT)
+    async def _extract_text(self, source, document_format: DocumentFormat, content_hash: str) -> dict[str, Any]:
+        """🧩 Extract a document's text and count its pages and chunks
+
+        Every entry point (uploads, URLs and raw text) shares one
+        content-addressed cache keyed by the raw-content hash plus the
+        extractor version, so the same document is only parsed once across
+        all workers, and upgrading an extractor invalidates its old text.
+        Pages are joined with blank lines and the offset where each starts
+        is kept, so compaction can still tell page edges apart.
+        """
+        documents = await extraction_executor.extract(source, document_format)
+        logger.info(f"Loaded {len(documents)} document pages/sections")
+
+        pages = [document.page_content for document in documents
+                 if document.page_content.strip()]
+        page_starts = []
+        offset = 0
+        for page in pages:
+            page_starts.append(offset)
+            offset += len(page) + 2
+        raw_text = "\n\n".join(pages)
+
+        logger.info(
+            f"Document processed successfully, extracted {len(raw_text)} characters")
+
+        return {
+            "text": raw_text,
+            "page_count": len(documents),
+            "chunk_count": self._count_chunks(raw_text),
+            "page_starts": page_starts
+        }
+
+    async def process_upload(self, upload: IngestedUpload) -> DocumentChunk:
+        """📁 Extract an ingested upload into a structured document chunk
+
+        Sniffs the format and extracts text straight from the UploadFile's
+        spooled file, without writing a temporary copy, unless the same
+        content has already been extracted.
+
+        Raises:
+            HTTPException: 415 for unsupported formats
+        """
         try:
-            loader = self._get_loader_for_file(file.filename)(temp_path)
-            documents = loader.load()
-
-            logger.info(f"Loaded {len(documents)} document pages/sections")
-
-            # Split documents into chunks
-            chunks = self.text_splitter.split_documents(documents)
-            raw_text = "\n\n".join(chunk.page_content for chunk in chunks)
+            document_format = sniff_format(
+                upload.file, upload.content_type, upload.file_name)
+        except UnsupportedFormatError as e:
+            raise HTTPException(status_code=415, detail=str(e))
+        return await self._extract_document(
+            upload.file, document_format, upload.content_hash, upload.file_name)
 
-            logger.info(
-                f"Document processed successfully, extracted {len(raw_text)} characters")
-
-            metadata = DocumentChunk.Metadata(
-                page_count=len(documents),
-                chunk_count=len(chunks)
-            )
+    async def process_file(self, file: UploadFile) -> DocumentChunk:
+        """📁 Process an uploaded file into a structured document chunk
 
-            return DocumentChunk(
-                content_hash=content_hash,
-                raw_text=raw_text,
-                file_name=file.filename,
-                metadata=metadata
-            )
-        finally:
-            # Ensure file cleanup happens even if an error occurs
-            try:
-                os.unlink(temp_path)
-            except Exception as e:
-                logger.warning(
-                    f"Failed to delete temporary file {temp_path}: {str(e)}")
+        Streams the upload through ingest_file for hashing and size checks,
+        then extracts it with process_upload.
+        """
+        logger.info(f"Processing file: {file.filename}")
+        upload = await self.ingest_file(file)
+        return await self.process_upload(upload)
 
     async def process_text(self, text: str) -> DocumentChunk:
         """✏️ Convert raw text input into a structured document chunk
@@ -159,133 +222,213 @@ class ContentProcessor:
         Useful for processing text that's not from a file.
         """
         logger.info("Processing raw text input")
-        content_hash = self._compute_hash(text.encode('utf-8'))
+        content = text.encode('utf-8')
+        content_hash = self._compute_hash(content)
+        return await self._extract_document(
+            content, DocumentFormat.TXT, content_hash, "text_input")
 
-        document = [{"page_content": text, "metadata": {}}]
-        chunks = self.text_splitter.split_documents(document)
-        processed_text = "\n\n".join(chunk.page_content for chunk in chunks)
+    async def cached_url_hash(self, url: HttpUrl) -> Optional[str]:
+        """🔑 Return the content hash last seen for a URL, if cached
 
-        return DocumentChunk(
-            content_hash=content_hash,
-            raw_text=processed_text,
-            file_name="text_input",
-            metadata=DocumentChunk.Metadata(
-                page_count=1,
-                chunk_count=len(chunks)
+        Lets callers look up parse results for a URL without pulling the
+        document bytes out of the cache or touching the network.
+        """
+        if not settings.CACHE_URL_CONTENT:
+            return None
+        return await cache_manager.aget_url_content_hash(str(url))
+
+    async def _download(self, url: str, cached_metadata: Optional[dict] = None) -> Optional[FetchedDocument]:
+        """🌐 Download a URL and cache its bytes and validators
+
+        URLs and hosts that failed recently are rejected by the negative
+        cache before any network call. With the metadata of a cached copy
+        the request is conditional on its ETag / Last-Modified.
+
+        Returns:
+            The downloaded document, or None if the cached copy is unchanged
+
+        Raises:
+            HTTPException: If the download fails or the body is too large,
+                or the URL or its host is backed off after recent failures
+        """
+        cached_metadata = cached_metadata or {}
+        has_failures = await negative_cache.check(url)
+        try:
+            fetch_result = await http_fetcher.fetch(
+                url, cached_metadata.get("etag"), cached_metadata.get("last_modified"))
+        except FetchError as e:
+            await negative_cache.record_failure(url, e)
+            raise
+        if has_failures:
+            await negative_cache.record_success(url)
+
+        if fetch_result.not_modified:
+            return None
+
+        content_hash = cache_manager.hash_content(fetch_result.content)
+
+        if settings.CACHE_URL_CONTENT:
+            await cache_manager.acache_url_content(
+                url,
+                fetch_result.content,
+                fetch_result.content_type,
+                settings.REDIS_TTL,
+                fetch_result.validators
             )
+
+        return FetchedDocument(
+            url=url,
+            content=fetch_result.content,
+            content_type=fetch_result.content_type,
+            content_hash=content_hash
         )
 
-    async def process_url(self, url: HttpUrl) -> DocumentChunk:
-        """🌐 Extract and process content from a URL into a document chunk
+    async def fetch_url(self, url: HttpUrl, on_change: Optional[ChangeCallback] = None) -> FetchedDocument:
+        """📥 Get the raw bytes of a URL, from the cache or a single download
 
-        Fetches content from a web URL, detects the content type, processes it with
-        the appropriate loader based on file type (PDF, DOCX, HTML), and returns
-        a standardized document representation with metadata.
-        """
-        logger.info(f"Processing URL: {url}")
+        Cached raw content is reused instead of being downloaded again, and
+        revalidated in the background once older than URL_CONTENT_SOFT_TTL;
+        otherwise the URL is fetched once through the shared connection
+        pool and cached for later requests. A URL whose document was found
+        unsupported or too large is rejected before its cached copy is
+        sniffed and extracted again.
 
-        try:
-            # Check cache first if enabled
-            if settings.CACHE_URL_CONTENT:
-                cached_data = cache_manager.get_url_content(url)
-                if cached_data:
-                    logger.info(f"Cache hit for URL {url}")
-                    content = cached_data["content"]
-                    content_type = cached_data["metadata"]["content_type"]
-
-                    # If we also cached the extracted text, use it
-                    content_hash = cached_data["metadata"]["hash"]
-                    extracted_key = f"extracted:{content_hash}"
-                    cached_text = cache_manager.get(extracted_key)
-
-                    if cached_text and settings.CACHE_EXTRACTED_TEXT:
-                        logger.info(f"Using cached extracted text for {url}")
-                        return DocumentChunk(
-                            content_hash=content_hash,
-                            raw_text=cached_text,
-                            file_name=url,
-                            metadata=DocumentChunk.Metadata(
-                                page_count=cached_data["metadata"].get(
-                                    "page_count", 1),
-                                chunk_count=cached_data["metadata"].get(
-                                    "chunk_count", 1)
-                            )
-                        )
-
-            # If not cached, proceed with fetching and processing
-            response = requests.head(url, allow_redirects=True, timeout=10)
-            content_type = response.headers.get('Content-Type', '')
-
-            # Fetch the actual content
-            file_response = requests.get(url, timeout=30)
-            file_response.raise_for_status()
-            content = file_response.content
-
-            # Cache the raw content if caching is enabled
-            content_hash = cache_manager.hash_content(content)
-            if settings.CACHE_URL_CONTENT:
-                cache_manager.cache_url_content(
-                    url,
-                    content,
-                    content_type,
-                    settings.REDIS_TTL
+        Args:
+            url: URL of the document
+            on_change: Called with the new document if a background
+                revalidation of the cached copy finds it changed
+
+        Raises:
+            HTTPException: If the download fails or the body is too large,
+                or the URL or its host is backed off after recent failures
+        """
+        url = str(url)
+
+        if settings.CACHE_URL_CONTENT:
+            await negative_cache.check_content(url)
+            cached_data = await cache_manager.aget_url_content(url)
+            if cached_data:
+                logger.info(f"Cache hit for URL {url}")
+                self._schedule_revalidation(
+                    url, cached_data["metadata"], on_change)
+                return FetchedDocument(
+                    url=url,
+                    content=cached_data["content"],
+                    content_type=cached_data["metadata"]["content_type"],
+                    content_hash=cached_data["metadata"]["hash"]
                 )
 
-            # Process based on content type
-            documents = []
-            if 'application/pdf' in content_type:
-                temp_path = self._write_to_temp_file(content, '.pdf')
-                loader = PyPDFLoader(temp_path)
-                documents = loader.load()
-                os.unlink(temp_path)
-            elif 'application/vnd.openxmlformats-officedocument.wordprocessingml.document' in content_type:
-                temp_path = self._write_to_temp_file(content, '.docx')
-                loader = Docx2txtLoader(temp_path)
-                documents = loader.load()
-                os.unlink(temp_path)
-            else:
-                loader = UnstructuredURLLoader(
-                    urls=[url], continue_on_failure=True)
-                documents = loader.load()
-
-            # Split documents into chunks
-            chunks = self.text_splitter.split_documents(documents)
-            processed_text = "\n\n".join(
-                chunk.page_content for chunk in chunks)
-
-            # Cache the extracted text if caching is enabled
-            if settings.CACHE_EXTRACTED_TEXT:
-                extracted_key = f"extracted:{content_hash}"
-                cache_manager.set(
-                    extracted_key, processed_text, settings.REDIS_TTL)
-
-            logger.info(
-                f"Document processed successfully, extracted {len(processed_text)} characters")
-
-            metadata = DocumentChunk.Metadata(
-                page_count=len(documents),
-                chunk_count=len(chunks)
-            )
+        return await self._download(url)
 
-            # Update the cache metadata with additional information
-            if settings.CACHE_URL_CONTENT:
-                meta_key = f"meta:{content_hash}"
-                cached_meta = cache_manager.get(meta_key) or {}
-                cached_meta.update({
-                    "page_count": len(documents),
-                    "chunk_count": len(chunks),
-                    "text_length": len(processed_text)
-                })
-                cache_manager.set(meta_key, cached_meta, settings.REDIS_TTL)
-
-            return DocumentChunk(
-                content_hash=content_hash,
-                raw_text=processed_text,
-                file_name=url,
-                metadata=metadata
-            )
+    async def revalidate_if_stale(self, url: HttpUrl, content_hash: str, on_change: Optional[ChangeCallback] = None) -> None:
+        """⏳ Revalidate a cached URL in the background once it is stale
+
+        Callers serving a cached result call this and return at once; a
+        stale copy is revalidated by a background task.
+
+        Args:
+            url: URL whose cached content was used
+            content_hash: Hash of the cached content
+            on_change: Called with the new document if the content changed,
+                to re-extract and re-parse it
+        """
+        metadata = await cache_manager.aget(f"meta:{content_hash}")
+        if metadata:
+            self._schedule_revalidation(str(url), metadata, on_change)
 
+    def _schedule_revalidation(self, url: str, metadata: dict, on_change: Optional[ChangeCallback] = None) -> None:
+        """🗓️ Start a background revalidation if the cached copy is past its soft TTL
+
+        A URL already being revalidated by this worker is skipped without
+        a round trip for the lease.
+        """
+        age = time.time() - metadata.get("cached_at", 0)
+        if age < settings.URL_CONTENT_SOFT_TTL or url in self._revalidations:
+            return
+
+        cache_metrics.record_stale(f"url:{cache_manager.hash_content(url)}")
+
+        task = asyncio.create_task(self._revalidate(url, metadata, on_change))
+        # Keep a reference so the task is not garbage collected mid-flight
+        self._revalidations[url] = task
+        task.add_done_callback(lambda _: self._revalidations.pop(url, None))
+
+    async def _revalidate(self, url: str, metadata: dict, on_change: Optional[ChangeCallback]) -> None:
+        """🔁 Conditionally refetch a stale URL and refresh or replace its cache entry
+
+        A lease, renewed while the work runs, ensures only one worker
+        revalidates a URL at a time. An unchanged document costs a 304 and
+        just refreshes the cached metadata and TTLs, without rewriting the
+        content; a changed one is cached and handed to on_change. Failures are logged and the stale copy keeps being served.
+        """
+        lease_name = f"revalidate:{cache_manager.hash_content(url)}"
+        lease_token = await cache_manager.acquire_lease(
+            lease_name, settings.SINGLE_FLIGHT_LEASE_TTL)
+        if lease_token is None:
+            return
+
+        async with cache_manager.hold_lease(lease_name, lease_token, settings.SINGLE_FLIGHT_LEASE_TTL):
+            try:
+                fetched = await self._download(url, metadata)
+                if fetched is None:
+                    refreshed = await cache_manager.arefresh_url_content(
+                        url, metadata, settings.REDIS_TTL)
+                    logger.info(
+                        f"Revalidated {url}: not modified"
+                        f"{'' if refreshed else ', but its cached copy has expired'}")
+                    return
+
+                if fetched.content_hash == metadata.get("hash"):
+                    logger.info(f"Revalidated {url}: content unchanged")
+                    return
+
+                logger.info(f"Revalidated {url}: content changed, reprocessing")
+                if on_change:
+                    await on_change(fetched)
+            except Exception as e:
+                logger.warning(f"Failed to revalidate {url}: {str(e)}")
+
+    async def process_fetched(self, fetched: FetchedDocument) -> DocumentChunk:
+        """🧩 Extract a fetched URL document into a document chunk
+
+        Sniffs the format from the response headers and magic bytes and hands
+        the bytes already in hand to the matching extractor (PDF, DOCX, HTML
+        or plain text), unless the same content has already been extracted.
+
+        Raises:
+            HTTPException: 415 for unsupported formats, 500 on extraction errors
+        """
+        url = fetched.url
+        try:
+            # Pick the extractor from headers and magic bytes, not a second request
+            document_format = sniff_format(
+                fetched.content, fetched.content_type, url)
+            logger.info(f"Detected {document_format.value} content for {url}")
+            return await self._extract_document(
+                fetched.content, document_format, fetched.content_hash, url)
+
+        except HTTPException:
+            raise
+        except UnsupportedFormatError as e:
+            logger.error(f"Error processing URL {url}: {str(e)}")
+            error = HTTPException(status_code=415, detail=str(e))
+            await negative_cache.record_failure(url, error)
+            raise error
         except Exception as e:
             logger.error(f"Error processing URL {url}: {str(e)}")
             raise HTTPException(
                 status_code=500, detail=f"Failed to process URL: {str(e)}")
+
+    async def process_url(self, url: HttpUrl) -> DocumentChunk:
+        """🌐 Extract and process content from a URL into a document chunk
+
+        Fetches the URL once (or serves it from cache) with fetch_url and
+        extracts it with process_fetched.
+        """
+        logger.info(f"Processing URL: {url}")
+        try:
+            fetched = await self.fetch_url(url)
+        except HTTPException as e:
+            logger.error(f"Error processing URL {url}: {e.detail}")
+            raise
+        return await self.process_fetched(fetched)
@@ -0,0 +1,8 @@
+from .formats import DocumentFormat, UnsupportedFormatError, sniff_format
+from .registry import ExtractorRegistry, extractor_registry
+from .extractors import extract_documents, extractor_version
+from .executor import ExtractionExecutor, extraction_executor
+
+__all__ = ["DocumentFormat", "UnsupportedFormatError", "sniff_format",
+           "ExtractorRegistry", "extractor_registry", "extract_documents",
+           "extractor_version", "ExtractionExecutor", "extraction_executor"]
@@ -0,0 +1,227 @@
+import asyncio
+from contextlib import contextmanager
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Optional
+from fastapi import HTTPException
+from langchain_core.documents import Document
+from loguru import logger
+from app.core.config import settings
+from .extractors import Source, extract_documents
+from .formats import DocumentFormat
+
+
+class ExtractionExecutor:
+    """⚙️ Runs CPU-bound document extraction off the event loop
+
+    PDF, DOCX and HTML parsing is handed to a process pool so a large upload
+    no longer blocks every other request on the worker:
+    - 👷 Configurable pool size, with workers recycled after N tasks
+    - 📥 Bounded queue that rejects new work with 503 when saturated
+    - ⏱️ Per-task timeout surfaced as 504; a timed-out task keeps its queue
+      slot until the worker really finishes, since it cannot be killed
+    - 📚 Long PDFs split into page batches that run in parallel
+
+    With a pool size of 0 (and for plain text, which is trivial to decode)
+    extraction runs in a thread instead, which still keeps the loop free.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = settings.EXTRACTION_POOL_SIZE,
+        max_queue: int = settings.EXTRACTION_QUEUE_SIZE,
+        task_timeout: float = settings.EXTRACTION_TASK_TIMEOUT,
+        max_tasks_per_child: int = settings.EXTRACTION_MAX_TASKS_PER_CHILD,
+    ):
+        """🏗️ Configure the executor; the pool itself starts on first use
+
+        Args:
+            max_workers: Number of extraction processes (0 disables the pool)
+            max_queue: Tasks allowed to wait once all workers are busy
+            task_timeout: Seconds to wait for a single extraction
+            max_tasks_per_child: Tasks a worker runs before being replaced
+        """
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self.task_timeout = task_timeout
+        self.max_tasks_per_child = max_tasks_per_child
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._in_flight = 0
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        """👷 Return the process pool, starting it on first use"""
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                max_tasks_per_child=self.max_tasks_per_child or None,
+            )
+            logger.info(
+                f"Started extraction pool with {self.max_workers} workers")
+        return self._pool
+
+    def _reset_pool(self) -> None:
+        """♻️ Drop a broken pool so the next task starts a fresh one"""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+    @contextmanager
+    def _queue_slot(self):
+        """🚦 Hold a slot in the bounded extraction queue for one document
+
+        Yields a list that _submit fills with the document's tasks. Tasks
+        still running on exit (after a timeout) keep the slot taken until
+        they finish, so the queue never admits work onto busy workers.
+
+        Raises:
+            HTTPException: 503 when every worker and queue slot is taken
+        """
+        if self._in_flight >= self.max_workers + self.max_queue:
+            raise HTTPException(
+                status_code=503,
+                detail="Document extraction queue is full, please retry shortly")
+
+        self._in_flight += 1
+        tasks: list[asyncio.Future] = []
+        try:
+            yield tasks
+        finally:
+            self._release_when_done(tasks)
+
+    def _release_when_done(self, tasks: list[asyncio.Future]) -> None:
+        """🔓 Free a queue slot once every task of its document has finished"""
+        running = [task for task in tasks if not task.done()]
+        if not running:
+            self._in_flight -= 1
+            return
+
+        logger.warning(
+            f"{len(running)} timed-out extraction task(s) still running, holding their queue slot")
+        remaining = len(running)
+
+        def on_done(task: asyncio.Future) -> None:
+            nonlocal remaining
+            if not task.cancelled():
+                task.exception()  # retrieved, nobody awaits it any more
+            remaining -= 1
+            if remaining == 0:
+                self._in_flight -= 1
+
+        for task in running:
+            task.add_done_callback(on_done)
+
+    async def _submit(self, tasks: list[asyncio.Future], pool: Optional[ProcessPoolExecutor], func, *args):
+        """⏱️ Run a task on the pool and wait for it with the task timeout
+
+        A pool of None runs the task on the loop's default thread executor.
+        On timeout the task is dropped if it has not started yet; a running
+        one cannot be interrupted and is left to finish in the background.
+
+        Args:
+            tasks: Tasks of the current document, from _queue_slot
+            pool: Process pool, or None for a thread
+            func: Picklable function to run
+            *args: Arguments for func
+        """
+        loop = asyncio.get_running_loop()
+        pending = None
+        try:
+            if pool is None:
+                task = loop.run_in_executor(None, func, *args)
+            else:
+                pending = pool.submit(func, *args)
+                task = asyncio.wrap_future(pending)
+            tasks.append(task)
+
+            # Shielded, so a timeout doesn't mark the task done while it runs
+            return await asyncio.wait_for(asyncio.shield(task), timeout=self.task_timeout)
+        except asyncio.TimeoutError:
+            if pending is not None:
+                pending.cancel()
+            logger.error(
+                f"Document extraction timed out after {self.task_timeout}s")
+            raise HTTPException(
+                status_code=504, detail="Document extraction timed out")
+        except BrokenProcessPool:
+            logger.error("Extraction pool broke, restarting it")
+            self._reset_pool()
+            raise HTTPException(
+                status_code=500, detail="Document extraction worker crashed")
+
+    async def _extract_pdf(self, tasks: list[asyncio.Future], content: bytes) -> list[Document]:
+        """📚 Extract a PDF, spreading long documents across the pool by page
+
+        One worker opens the PDF, counts its pages and extracts it outright
+        when it is shorter than PDF_PARALLEL_MIN_PAGES. Longer ones it splits
+        into standalone PDFs of PDF_PAGES_PER_TASK pages that are extracted
+        concurrently and reassembled in page order, so wall-clock time scales
+        with the number of workers while each batch only ships and parses its
+        own pages.
+        Pages beyond PDF_MAX_PAGES are dropped and every page is bounded by
+        PDF_PAGE_TIMEOUT.
+        """
+        # Imported lazily like the other extractors, see ExtractorRegistry
+        from .pdf import extract_or_split_pdf, extract_pdf_pages
+
+        # Counting, and for short PDFs extracting, happens in one worker,
+        # so the PDF is never parsed in this process
+        pool = self._get_pool()
+        step = settings.PDF_PAGES_PER_TASK
+        page_count, documents, parts = await self._submit(
+            tasks, pool, extract_or_split_pdf, content, settings.PDF_PARALLEL_MIN_PAGES,
+            step, settings.PDF_MAX_PAGES, settings.PDF_PAGE_TIMEOUT)
+        if page_count > settings.PDF_MAX_PAGES:
+            logger.warning(
+                f"PDF has {page_count} pages, extracting only the first {settings.PDF_MAX_PAGES}")
+            page_count = settings.PDF_MAX_PAGES
+        if not parts:
+            return documents
+
+        batches = await asyncio.gather(*(
+            self._submit(
+                tasks, pool, extract_pdf_pages, part, 0, step, settings.PDF_PAGE_TIMEOUT)
+            for part in parts
+        ))
+        logger.info(
+            f"Extracted {page_count} PDF pages in {len(batches)} parallel batches")
+
+        documents = [document for batch in batches for document in batch]
+        for index, document in enumerate(documents):
+            document.metadata["page"] = index
+        return documents
+
+    async def extract(self, source: Source, document_format: DocumentFormat) -> list[Document]:
+        """📥 Extract a document without blocking the event loop
+
+        Args:
+            source: Raw bytes or a readable binary file object
+            document_format: Format of the source
+
+        Returns:
+            Extracted LangChain documents
+        """
+        with self._queue_slot() as tasks:
+            if self.max_workers <= 0 or document_format == DocumentFormat.TXT:
+                return await self._submit(tasks, None, extract_documents, source, document_format)
+
+            # File objects cannot cross the process boundary, so send the bytes
+            if not isinstance(source, (bytes, bytearray)):
+                source.seek(0)
+                source = source.read()
+            content = bytes(source)
+
+            if document_format == DocumentFormat.PDF:
+                return await self._extract_pdf(tasks, content)
+            return await self._submit(
+                tasks, self._get_pool(), extract_documents, content, document_format)
+
+    def shutdown(self) -> None:
+        """👋 Stop the pool and cancel queued extractions"""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+            logger.info("Extraction pool shut down")
+
+
+# Create a singleton instance for global use
+extraction_executor = ExtractionExecutor()
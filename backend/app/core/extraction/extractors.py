@@ -0,0 +1,50 @@
+import io
+from typing import BinaryIO, Union
+from langchain_core.documents import Document
+from .formats import DocumentFormat
+from .registry import extractor_registry
+
+Source = Union[bytes, BinaryIO]
+
+
+def as_stream(source: Source) -> BinaryIO:
+    """🔄 Wrap raw bytes in a stream, or rewind an existing file object
+
+    Extractors accept either bytes already in memory (URL downloads) or the
+    spooled file behind an UploadFile, so no extra disk copy is made.
+    """
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return io.BytesIO(source)
+    source.seek(0)
+    return source
+
+
+# Bump a format's version whenever its extractor output changes, so text
+# cached by the previous extractor is no longer served.
+EXTRACTOR_VERSIONS: dict[DocumentFormat, int] = {
+    DocumentFormat.PDF: 2,
+    DocumentFormat.DOCX: 3,
+    DocumentFormat.TXT: 2,
+    DocumentFormat.HTML: 3,
+}
+
+
+def extractor_version(document_format: DocumentFormat) -> str:
+    """🏷️ Return the cache tag for the extractor of a format, e.g. ``pdf-v1``"""
+    return f"{document_format.value}-v{EXTRACTOR_VERSIONS[document_format]}"
+
+
+def extract_documents(source: Source, document_format: DocumentFormat) -> list[Document]:
+    """📥 Extract text from an in-memory buffer or file object
+
+    The extractor for the format is imported on first use, so a worker
+    only pays for the parsing libraries of the formats it actually sees.
+
+    Args:
+        source: Raw bytes or a readable binary file object
+        document_format: Format of the source, as returned by sniff_format
+
+    Returns:
+        Extracted LangChain documents (one per page for PDFs)
+    """
+    return extractor_registry.get(document_format)(source)
@@ -0,0 +1,140 @@
+import io
+import os
+import zipfile
+from enum import Enum
+from typing import BinaryIO, Union
+
+
+class UnsupportedFormatError(ValueError):
+    """🚫 Raised when a payload is not in a format the pipeline can extract"""
+
+
+class DocumentFormat(str, Enum):
+    """🏷️ Document formats the content pipeline knows how to extract"""
+    PDF = "pdf"
+    DOCX = "docx"
+    TXT = "txt"
+    HTML = "html"
+
+
+# Bytes inspected when looking for magic numbers and HTML markers
+SNIFF_WINDOW = 2048
+
+_CONTENT_TYPE_FORMATS = {
+    "application/pdf": DocumentFormat.PDF,
+    "application/x-pdf": DocumentFormat.PDF,
+    "application/vnd.openxmlformats-officedocument.wordprocessingml.document": DocumentFormat.DOCX,
+    "text/html": DocumentFormat.HTML,
+    "application/xhtml+xml": DocumentFormat.HTML,
+    "text/plain": DocumentFormat.TXT,
+}
+
+_EXTENSION_FORMATS = {
+    ".pdf": DocumentFormat.PDF,
+    ".docx": DocumentFormat.DOCX,
+    ".txt": DocumentFormat.TXT,
+    ".html": DocumentFormat.HTML,
+    ".htm": DocumentFormat.HTML,
+    ".bshtml": DocumentFormat.HTML,
+}
+
+_HTML_MARKERS = (b"<!doctype html", b"<html", b"<head", b"<body")
+
+# OLE compound files: legacy Word .doc (and .xls/.ppt), which python-docx can't read
+_OLE_MAGIC = b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1"
+
+
+def _is_docx(content: Union[bytes, BinaryIO]) -> bool:
+    """📦 Check whether a ZIP payload is a Word document
+
+    OOXML documents are ZIP archives with a ``word/`` part, which tells
+    them apart from XLSX/PPTX or arbitrary archives.
+    """
+    archive_source = io.BytesIO(content) if isinstance(
+        content, (bytes, bytearray)) else content
+    try:
+        with zipfile.ZipFile(archive_source) as archive:
+            return any(name.startswith("word/") for name in archive.namelist())
+    except zipfile.BadZipFile:
+        return False
+    finally:
+        archive_source.seek(0)
+
+
+def _sniff_magic(head: bytes, content: Union[bytes, BinaryIO]):
+    """🔮 Detect the format from the leading bytes of the payload
+
+    Returns None when the bytes carry no recognisable signature.
+    """
+    if b"%PDF-" in head[:1024]:
+        return DocumentFormat.PDF
+    if head.startswith(b"PK\x03\x04"):
+        return DocumentFormat.DOCX if _is_docx(content) else None
+
+    lowered = head.lstrip(b"\xef\xbb\xbf \t\r\n").lower()
+    if any(marker in lowered for marker in _HTML_MARKERS):
+        return DocumentFormat.HTML
+    return None
+
+
+def _is_text(head: bytes) -> bool:
+    """✏️ Check whether the payload decodes as UTF-8 text"""
+    if b"\x00" in head:
+        return False
+    try:
+        head.decode("utf-8")
+        return True
+    except UnicodeDecodeError as e:
+        # A multi-byte character cut off at the window edge is still text
+        return e.start >= len(head) - 3
+
+
+def sniff_format(content: Union[bytes, BinaryIO], content_type: str = "", file_name: str = "") -> DocumentFormat:
+    """🔍 Pick the document format for a payload
+
+    Magic bytes win over the declared Content-Type, because job boards and
+    CDNs routinely serve PDFs as ``application/octet-stream`` or HTML error
+    pages with a ``.pdf`` URL. The declared type and the file extension are
+    used next, and plain UTF-8 text is the last resort.
+
+    Args:
+        content: Raw document bytes, or a seekable binary file object
+            which is left rewound
+        content_type: Content-Type header value, if any
+        file_name: File name or URL path, if any
+
+    Returns:
+        Detected DocumentFormat
+
+    Raises:
+        UnsupportedFormatError: If the payload is not a supported format
+    """
+    if isinstance(content, (bytes, bytearray)):
+        head = bytes(content[:SNIFF_WINDOW])
+    else:
+        content.seek(0)
+        head = content.read(SNIFF_WINDOW)
+        content.seek(0)
+
+    if head.startswith(_OLE_MAGIC):
+        raise UnsupportedFormatError(
+            "Legacy Word (.doc) and other OLE documents are not supported, "
+            "please convert to DOCX or PDF")
+
+    detected = _sniff_magic(head, content)
+    if detected:
+        return detected
+
+    mime = content_type.split(";")[0].strip().lower()
+    if mime in _CONTENT_TYPE_FORMATS:
+        return _CONTENT_TYPE_FORMATS[mime]
+
+    extension = os.path.splitext(file_name.split("?")[0])[1].lower()
+    if extension in _EXTENSION_FORMATS:
+        return _EXTENSION_FORMATS[extension]
+
+    if _is_text(head):
+        return DocumentFormat.TXT
+
+    raise UnsupportedFormatError(
+        f"Unsupported document format (content type: {content_type or 'unknown'})")
@@ -0,0 +1,35 @@
+import io
+import trafilatura
+from langchain_core.documents import Document
+from loguru import logger
+from app.core.config import settings
+from .extractors import Source, as_stream
+
+
+def extract_html(source: Source) -> list[Document]:
+    """🌐 Extract the main content of an HTML page
+
+    Uses trafilatura to pull the boilerplate-stripped main text (job
+    description, not navigation and footers). Unstructured, which is far
+    slower, is only used when that yields less than HTML_MIN_TEXT_LENGTH
+    characters, e.g. on pages trafilatura cannot find a main block in.
+    """
+    html = as_stream(source).read()
+    text = trafilatura.extract(
+        html,
+        include_comments=False,
+        include_tables=True,
+        favor_recall=True,
+    ) or ""
+
+    if len(text) < settings.HTML_MIN_TEXT_LENGTH:
+        logger.info(
+            f"trafilatura returned {len(text)} characters, falling back to Unstructured")
+        # Imported here: Unstructured costs seconds of import time and is
+        # only needed for the rare pages trafilatura cannot handle
+        from unstructured.partition.html import partition_html
+
+        elements = partition_html(file=io.BytesIO(html))
+        text = "\n\n".join(str(element) for element in elements)
+
+    return [Document(page_content=text, metadata={})]
@@ -0,0 +1,137 @@
+import io
+import signal
+import threading
+from langchain_core.documents import Document
+from loguru import logger
+from pypdf import PdfReader, PdfWriter
+from app.core.config import settings
+from .extractors import Source, as_stream
+
+
+class PageTimeout(Exception):
+    """⏱️ Raised inside a worker when a single PDF page takes too long"""
+
+
+def _raise_page_timeout(signum, frame):
+    raise PageTimeout()
+
+
+def split_pdf(source: Source, pages_per_part: int, max_pages: int) -> list[bytes]:
+    """✂️ Split the first ``max_pages`` pages of a PDF into standalone PDFs
+
+    Each part carries only its own pages plus the fonts and images they
+    reference (shared resources are copied into every part that uses
+    them), so a batch sent to a worker is a fraction of the whole file.
+
+    Args:
+        source: Raw PDF bytes or a readable binary file object
+        pages_per_part: Pages in each part; the last one may be shorter
+        max_pages: Pages beyond this are left out
+
+    Returns:
+        The parts as PDF bytes, in page order
+    """
+    reader = PdfReader(as_stream(source))
+    return _split_pages(reader, pages_per_part, min(len(reader.pages), max_pages))
+
+
+def _split_pages(reader: PdfReader, pages_per_part: int, page_count: int) -> list[bytes]:
+    """✂️ Write the first ``page_count`` pages of a parsed PDF as parts"""
+    parts = []
+    for start in range(0, page_count, pages_per_part):
+        writer = PdfWriter()
+        for index in range(start, min(start + pages_per_part, page_count)):
+            writer.add_page(reader.pages[index])
+        buffer = io.BytesIO()
+        writer.write(buffer)
+        parts.append(buffer.getvalue())
+    return parts
+
+
+def extract_or_split_pdf(
+    source: Source,
+    min_split_pages: int,
+    pages_per_part: int,
+    max_pages: int,
+    page_timeout: float = 0,
+) -> tuple[int, list[Document], list[bytes]]:
+    """📚 Extract a short PDF, or split a long one for parallel extraction
+
+    Runs in a pool worker, so the PDF is parsed once there and the web
+    process never has to open it just to count its pages.
+
+    Args:
+        source: Raw PDF bytes or a readable binary file object
+        min_split_pages: PDFs with at least this many pages are split
+        pages_per_part: Pages in each part of a split PDF
+        max_pages: Pages beyond this are left out
+        page_timeout: Seconds allowed per extracted page (0 disables the timer)
+
+    Returns:
+        The PDF's total page count, then either its documents (short PDFs)
+        or its parts as PDF bytes in page order (long PDFs); the other
+        list is empty
+    """
+    reader = PdfReader(as_stream(source))
+    total_pages = len(reader.pages)
+    page_count = min(total_pages, max_pages)
+    if page_count < min_split_pages:
+        return total_pages, _extract_pages(reader, 0, page_count, page_timeout), []
+    return total_pages, [], _split_pages(reader, pages_per_part, page_count)
+
+
+def extract_pdf_pages(source: Source, start: int, end: int, page_timeout: float = 0) -> list[Document]:
+    """📕 Extract pages ``start`` to ``end`` (exclusive) of a PDF
+
+    When running on the main thread of a process (i.e. inside a pool
+    worker) each page is bounded by a SIGALRM timer, so one pathological
+    page yields empty text instead of hanging the whole extraction.
+
+    Args:
+        source: Raw PDF bytes or a readable binary file object
+        start: Index of the first page to extract
+        end: Index one past the last page to extract
+        page_timeout: Seconds allowed per page (0 disables the timer)
+
+    Returns:
+        One document per page, with the page index in its metadata
+    """
+    return _extract_pages(PdfReader(as_stream(source)), start, end, page_timeout)
+
+
+def _extract_pages(reader: PdfReader, start: int, end: int, page_timeout: float) -> list[Document]:
+    """📕 Extract a page range of a parsed PDF, see extract_pdf_pages"""
+    use_timer = (
+        page_timeout > 0
+        and hasattr(signal, "setitimer")
+        and threading.current_thread() is threading.main_thread()
+    )
+    previous_handler = signal.signal(
+        signal.SIGALRM, _raise_page_timeout) if use_timer else None
+
+    documents = []
+    try:
+        for index in range(start, min(end, len(reader.pages))):
+            try:
+                if use_timer:
+                    signal.setitimer(signal.ITIMER_REAL, page_timeout)
+                text = reader.pages[index].extract_text() or ""
+            except PageTimeout:
+                logger.warning(
+                    f"PDF page {index} took longer than {page_timeout}s, skipping it")
+                text = ""
+            finally:
+                if use_timer:
+                    signal.setitimer(signal.ITIMER_REAL, 0)
+            documents.append(
+                Document(page_content=text, metadata={"page": index}))
+    finally:
+        if use_timer:
+            signal.signal(signal.SIGALRM, previous_handler)
+    return documents
+
+
+def extract_pdf(source: Source) -> list[Document]:
+    """📕 Extract one document per PDF page, up to PDF_MAX_PAGES pages"""
+    return extract_pdf_pages(
+        source, 0, settings.PDF_MAX_PAGES, settings.PDF_PAGE_TIMEOUT)
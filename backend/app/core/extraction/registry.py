@@ -0,0 +1,66 @@
+import importlib
+import time
+from typing import Callable
+from loguru import logger
+from .formats import DocumentFormat
+
+
+class ExtractorRegistry:
+    """🗂️ Maps document formats to extractors imported on first use
+
+    Extractors are registered as ``"module:function"`` strings, so parsing
+    libraries (pypdf, python-docx, trafilatura, ...) are only imported by
+    workers that actually receive a document of that format, instead of
+    by every worker at boot.
+    """
+
+    def __init__(self):
+        """🏗️ Initialize an empty registry"""
+        self._targets: dict[DocumentFormat, str] = {}
+        self._loaded: dict[DocumentFormat, Callable] = {}
+
+    def register(self, document_format: DocumentFormat, target: str) -> None:
+        """📝 Register the extractor for a format
+
+        Args:
+            document_format: Format the extractor handles
+            target: Import path of the extractor, as ``"module:function"``
+        """
+        self._targets[document_format] = target
+        self._loaded.pop(document_format, None)
+
+    def get(self, document_format: DocumentFormat) -> Callable:
+        """🔍 Return the extractor for a format, importing it if needed
+
+        Raises:
+            ValueError: If no extractor is registered for the format
+        """
+        extractor = self._loaded.get(document_format)
+        if extractor is not None:
+            return extractor
+
+        target = self._targets.get(document_format)
+        if target is None:
+            raise ValueError(
+                f"No extractor registered for {document_format.value}")
+
+        module_name, function_name = target.split(":")
+        start_time = time.perf_counter()
+        extractor = getattr(importlib.import_module(module_name), function_name)
+        logger.info(
+            f"Loaded {document_format.value} extractor {target} in "
+            f"{(time.perf_counter() - start_time) * 1000:.0f} ms")
+
+        self._loaded[document_format] = extractor
+        return extractor
+
+    def loaded_formats(self) -> list[DocumentFormat]:
+        """📋 List the formats whose extractors have been imported so far"""
+        return list(self._loaded)
+
+
+extractor_registry = ExtractorRegistry()
+extractor_registry.register(DocumentFormat.PDF, "app.core.extraction.pdf:extract_pdf")
+extractor_registry.register(DocumentFormat.DOCX, "app.core.extraction.word:extract_docx")
+extractor_registry.register(DocumentFormat.TXT, "app.core.extraction.text:extract_txt")
+extractor_registry.register(DocumentFormat.HTML, "app.core.extraction.html:extract_html")
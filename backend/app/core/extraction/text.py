@@ -0,0 +1,8 @@
+from langchain_core.documents import Document
+from .extractors import Source, as_stream
+
+
+def extract_txt(source: Source) -> list[Document]:
+    """📄 Decode plain text, replacing invalid UTF-8 sequences"""
+    text = as_stream(source).read().decode("utf-8", errors="replace")
+    return [Document(page_content=text, metadata={})]
@@ -0,0 +1,19 @@
+import docx
+from docx.table import Table
+from langchain_core.documents import Document
+from .extractors import Source, as_stream
+
+
+def extract_docx(source: Source) -> list[Document]:
+    """📘 Extract paragraph and table text from a Word document, in reading order"""
+    document = docx.Document(as_stream(source))
+    parts = []
+    # Paragraphs and tables interleaved as they appear in the body
+    for block in document.iter_inner_content():
+        if isinstance(block, Table):
+            for row in block.rows:
+                parts.append("\t".join(cell.text for cell in row.cells))
+        else:
+            parts.append(block.text)
+    text = "\n".join(part for part in parts if part.strip())
+    return [Document(page_content=text, metadata={})]
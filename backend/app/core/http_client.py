@@ -0,0 +1,220 @@
+import asyncio
+from typing import Optional
+import aiohttp
+from fastapi import HTTPException
+from loguru import logger
+from pydantic import BaseModel
+from app.core.config import settings
+
+
+class FetchResult(BaseModel):
+    """📦 Body and headers of a completed HTTP fetch
+
+    Holds the fully read response body together with the response
+    metadata needed by the content pipeline (final URL and content type).
+    """
+    url: str
+    status: int
+    content_type: str
+    headers: dict[str, str]
+    content: bytes
+
+    @property
+    def not_modified(self) -> bool:
+        """🔁 Whether a conditional request found the cached copy still current"""
+        return self.status == 304
+
+    @property
+    def validators(self) -> dict[str, str]:
+        """🏷️ ETag and Last-Modified of the response, for later conditional requests"""
+        return {
+            name: self.headers[header]
+            for name, header in (("etag", "etag"), ("last_modified", "last-modified"))
+            if header in self.headers
+        }
+
+
+class FetchError(HTTPException):
+    """❌ A URL could not be downloaded
+
+    An HTTPException (so API handlers treat it like any other) that also
+    records why the fetch failed, which lets the negative cache tell a
+    dead link from a slow or rate-limiting host.
+    """
+
+    def __init__(self, status_code: int, detail: str, reason: str,
+                 upstream_status: Optional[int] = None, retry_after: Optional[float] = None):
+        """🏗️ Build the error
+
+        Args:
+            status_code: Status returned to our client
+            detail: Error message
+            reason: One of not_found, client_error, rate_limited,
+                server_error, timeout, connection or too_large
+            upstream_status: HTTP status returned by the remote server, if any
+            retry_after: Seconds from the remote Retry-After header, if any
+        """
+        super().__init__(status_code=status_code, detail=detail)
+        self.reason = reason
+        self.upstream_status = upstream_status
+        self.retry_after = retry_after
+
+
+def _upstream_reason(status: int) -> str:
+    """🏷️ Classify an HTTP error status returned by a remote server"""
+    if status in (404, 410):
+        return "not_found"
+    if status == 429:
+        return "rate_limited"
+    if status >= 500:
+        return "server_error"
+    return "client_error"
+
+
+def _retry_after(value: Optional[str]) -> Optional[float]:
+    """⏳ Parse a Retry-After header given in seconds"""
+    try:
+        return float(value) if value else None
+    except ValueError:
+        return None
+
+
+class HttpFetcher:
+    """🌐 Shared, pooled async HTTP client for outbound document fetches
+
+    Wraps a single long-lived aiohttp session so every URL ingestion reuses
+    keep-alive connections instead of opening a new socket per request:
+    - 🔌 Global and per-host connection limits
+    - ⏱️ Separate connect and read timeouts
+    - 📏 Streaming body reads capped at MAX_UPLOAD_SIZE
+
+    The session is created lazily on first use so it is bound to the
+    running event loop of the worker, and closed from the app lifespan.
+    """
+
+    def __init__(self, max_size: int = settings.MAX_UPLOAD_SIZE):
+        """🏗️ Initialize the fetcher without opening any connections
+
+        Args:
+            max_size: Maximum response body size in bytes
+        """
+        self.max_size = max_size
+        self._session: Optional[aiohttp.ClientSession] = None
+        self.headers = {
+            'User-Agent': 'Mozilla/5.0 (compatible; TireNoHire/1.0)',
+            'Accept': 'text/html,application/xhtml+xml,application/pdf,'
+                      'application/vnd.openxmlformats-officedocument.wordprocessingml.document,'
+                      '*/*;q=0.8',
+        }
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """🔌 Return the shared session, creating it on first use
+
+        Builds the connection pool from the HTTP settings. A closed session
+        (e.g. after a lifespan restart in tests) is transparently replaced.
+        """
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=settings.HTTP_POOL_SIZE,
+                limit_per_host=settings.HTTP_POOL_SIZE_PER_HOST,
+                keepalive_timeout=settings.HTTP_KEEPALIVE_TIMEOUT,
+                ttl_dns_cache=300,
+            )
+            timeout = aiohttp.ClientTimeout(
+                total=None,
+                connect=settings.HTTP_CONNECT_TIMEOUT,
+                sock_read=settings.HTTP_READ_TIMEOUT,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=timeout,
+                headers=self.headers,
+            )
+            logger.info(
+                f"Opened HTTP connection pool (limit={settings.HTTP_POOL_SIZE}, "
+                f"per_host={settings.HTTP_POOL_SIZE_PER_HOST})")
+        return self._session
+
+    async def _read_body(self, response: aiohttp.ClientResponse) -> bytes:
+        """📏 Stream the response body, aborting once it exceeds the size limit
+
+        Rejects early on an oversized Content-Length and otherwise counts
+        bytes chunk by chunk, so a lying or missing header cannot make the
+        worker buffer an unbounded body.
+        """
+        declared = response.content_length
+        if declared is not None and declared > self.max_size:
+            raise FetchError(
+                status_code=413,
+                detail=f"Remote document is too large ({declared} bytes, limit {self.max_size})",
+                reason="too_large")
+
+        body = bytearray()
+        async for chunk in response.content.iter_chunked(settings.HTTP_CHUNK_SIZE):
+            body.extend(chunk)
+            if len(body) > self.max_size:
+                raise FetchError(
+                    status_code=413,
+                    detail=f"Remote document exceeds the {self.max_size} byte limit",
+                    reason="too_large")
+        return bytes(body)
+
+    async def fetch(self, url: str, etag: Optional[str] = None, last_modified: Optional[str] = None) -> FetchResult:
+        """📥 Download a URL through the shared connection pool
+
+        With an ETag or Last-Modified value the request is conditional, and
+        an unchanged document comes back as a bodiless 304 result.
+
+        Args:
+            url: URL to download
+            etag: ETag of the cached copy, sent as If-None-Match
+            last_modified: Last-Modified of the cached copy, sent as If-Modified-Since
+
+        Returns:
+            FetchResult with the body and response metadata
+
+        Raises:
+            FetchError: 413 if the body is too large, 504 on timeouts,
+                502 on connection errors or non-success status codes
+        """
+        headers = {}
+        if etag:
+            headers['If-None-Match'] = etag
+        if last_modified:
+            headers['If-Modified-Since'] = last_modified
+
+        try:
+            async with self._get_session().get(str(url), allow_redirects=True, headers=headers) as response:
+                if response.status >= 400:
+                    raise FetchError(
+                        status_code=502,
+                        detail=f"Upstream returned HTTP {response.status} for {url}",
+                        reason=_upstream_reason(response.status),
+                        upstream_status=response.status,
+                        retry_after=_retry_after(response.headers.get('Retry-After')))
+
+                content = b"" if response.status == 304 else await self._read_body(response)
+                return FetchResult(
+                    url=str(response.url),
+                    status=response.status,
+                    content_type=response.headers.get('Content-Type', ''),
+                    headers={k.lower(): v for k, v in response.headers.items()},
+                    content=content,
+                )
+        except asyncio.TimeoutError:
+            raise FetchError(
+                status_code=504, detail=f"Timed out fetching {url}", reason="timeout")
+        except aiohttp.ClientError as e:
+            raise FetchError(
+                status_code=502, detail=f"Failed to fetch {url}: {str(e)}", reason="connection")
+
+    async def close(self) -> None:
+        """👋 Close the shared session and release pooled connections"""
+        if self._session and not self._session.closed:
+            await self._session.close()
+            logger.info("Closed HTTP connection pool")
+        self._session = None
+
+
+# Create a singleton instance for global use
+http_fetcher = HttpFetcher()
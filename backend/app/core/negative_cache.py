@@ -0,0 +1,218 @@
+import time
+from typing import Optional
+from urllib.parse import urlsplit
+from fastapi import HTTPException
+from loguru import logger
+from app.core.config import settings
+from app.core.http_client import FetchError
+from app.manager import cache_manager, CacheNamespace
+
+
+# Seconds a URL is skipped after its first failure, per failure reason.
+# Every further consecutive failure doubles the wait.
+FAILURE_TTLS: dict[str, int] = {
+    "not_found": 3600,
+    "client_error": 900,
+    "rate_limited": 60,
+    "server_error": 60,
+    "timeout": 120,
+    "connection": 300,
+    "too_large": 6 * 3600,
+    "unsupported": 6 * 3600,
+}
+
+# Failures that say something about the whole host, not just one URL
+HOST_FAILURE_REASONS = {"rate_limited", "server_error", "timeout", "connection"}
+
+# Failures caused by the document itself, which a cached copy would repeat
+CONTENT_FAILURE_REASONS = {"unsupported", "too_large"}
+
+
+def failure_reason(error: HTTPException) -> str:
+    """🏷️ Classify a failed fetch or extraction for the negative cache"""
+    if isinstance(error, FetchError):
+        return error.reason
+    if error.status_code == 415:
+        return "unsupported"
+    if error.status_code == 413:
+        return "too_large"
+    if error.status_code == 504:
+        return "timeout"
+    return "server_error"
+
+
+class NegativeCache:
+    """🚫 Remembers failing URLs and hosts so they are not retried right away
+
+    Checked before any network call for a URL:
+    - 🔗 A URL that failed is skipped for a reason-specific TTL (a 404 for
+      an hour, a 503 for a minute) that doubles with every consecutive failure
+    - 🌍 A host with repeated timeouts, connection errors, 5xx or 429 answers
+      is backed off as a whole, so a bulk import does not wait out the
+      timeout once per dead link on the same board
+    - ✅ A successful fetch clears both records
+
+    Records live in the shared cache, so every worker honours them.
+    """
+
+    def __init__(
+        self,
+        max_ttl: int = settings.NEGATIVE_CACHE_MAX_TTL,
+        host_failure_threshold: int = settings.HOST_FAILURE_THRESHOLD,
+        host_backoff: int = settings.HOST_BACKOFF_BASE,
+        max_host_backoff: int = settings.HOST_BACKOFF_MAX,
+    ):
+        """🏗️ Initialize the negative cache
+
+        Args:
+            max_ttl: Upper bound in seconds for skipping a single URL
+            host_failure_threshold: Consecutive host-level failures before
+                the whole host is backed off
+            host_backoff: Seconds of the first host backoff
+            max_host_backoff: Upper bound in seconds for a host backoff
+        """
+        self.max_ttl = max_ttl
+        self.host_failure_threshold = host_failure_threshold
+        self.host_backoff = host_backoff
+        self.max_host_backoff = max_host_backoff
+
+    @classmethod
+    def _url_key(cls, url: str) -> str:
+        return f"{CacheNamespace.FAILURE.value}:url:{cache_manager.hash_content(url)}"
+
+    @classmethod
+    def _host_key(cls, url: str) -> str:
+        return f"{CacheNamespace.FAILURE.value}:host:{urlsplit(url).netloc.lower()}"
+
+    async def check(self, url: str) -> bool:
+        """🔍 Raise if the URL or its host is still backed off
+
+        Args:
+            url: URL about to be fetched
+
+        Returns:
+            True if there are expired failure records to clear after a
+            successful fetch, False if the URL and host have a clean record
+
+        Raises:
+            HTTPException: The URL's last error, or 503 for a backed-off
+                host, with a Retry-After header
+        """
+        if not settings.NEGATIVE_CACHE_ENABLED:
+            return False
+
+        url_key, host_key = self._url_key(url), self._host_key(url)
+        records = await cache_manager.aget_many([url_key, host_key])
+        now = time.time()
+
+        self._raise_for_url_record(url, records.get(url_key), now)
+
+        host_record = records.get(host_key)
+        if host_record and host_record.get("until", 0) > now:
+            retry_after = int(host_record["until"] - now) + 1
+            logger.info(
+                f"Skipping {url}: host backed off after {host_record['failures']} failures")
+            raise HTTPException(
+                status_code=503,
+                detail=f"{urlsplit(url).netloc} is failing, retry in {retry_after}s",
+                headers={"Retry-After": str(retry_after)})
+
+        return bool(records)
+
+    async def check_content(self, url: str) -> None:
+        """🔍 Raise if the URL's document itself failed recently
+
+        Checked before serving a URL's cached bytes: a document that was
+        unsupported or too large would fail the same way again, while a
+        network failure says nothing about the copy already in the cache.
+
+        Args:
+            url: URL whose cached content is about to be used
+
+        Raises:
+            HTTPException: The URL's last error, with a Retry-After header
+        """
+        if not settings.NEGATIVE_CACHE_ENABLED:
+            return
+
+        record = await cache_manager.aget(self._url_key(url))
+        if record and record["reason"] in CONTENT_FAILURE_REASONS:
+            self._raise_for_url_record(url, record, time.time())
+
+    @classmethod
+    def _raise_for_url_record(cls, url: str, record: Optional[dict], now: float) -> None:
+        """⛔ Raise the cached error of a URL that is still backed off"""
+        if not record or record["until"] <= now:
+            return
+        retry_after = int(record["until"] - now) + 1
+        logger.info(
+            f"Skipping {url}: failed {record['failures']} time(s) "
+            f"({record['reason']}), retry in {retry_after}s")
+        raise HTTPException(
+            status_code=record["status_code"],
+            detail=f"{record['detail']} (cached failure, retry in {retry_after}s)",
+            headers={"Retry-After": str(retry_after)})
+
+    async def record_failure(self, url: str, error: HTTPException) -> None:
+        """📝 Remember a failed fetch or extraction of a URL
+
+        Args:
+            url: URL that failed
+            error: Error raised for it
+        """
+        if not settings.NEGATIVE_CACHE_ENABLED:
+            return
+
+        reason = failure_reason(error)
+        url_key, host_key = self._url_key(url), self._host_key(url)
+        previous = await cache_manager.aget_many([url_key, host_key])
+
+        failures = previous.get(url_key, {}).get("failures", 0) + 1
+        ttl = min(FAILURE_TTLS[reason] * 2 ** (failures - 1), self.max_ttl)
+        retry_after = getattr(error, "retry_after", None)
+        if retry_after:
+            ttl = max(ttl, min(int(retry_after), self.max_ttl))
+
+        # Kept for twice the backoff so the next failure escalates it
+        await cache_manager.aset(url_key, {
+            "reason": reason,
+            "status_code": error.status_code,
+            "detail": str(error.detail),
+            "failures": failures,
+            "until": time.time() + ttl,
+        }, ttl * 2)
+        logger.warning(
+            f"Caching failure of {url} ({reason}) for {ttl}s after {failures} failure(s)")
+
+        if reason in HOST_FAILURE_REASONS:
+            await self._record_host_failure(url, host_key, previous.get(host_key))
+
+    async def _record_host_failure(self, url: str, host_key: str, previous: Optional[dict]) -> None:
+        """🌍 Count a host-level failure and back the host off past the threshold"""
+        failures = (previous or {}).get("failures", 0) + 1
+        record = {"failures": failures, "until": 0}
+        ttl = self.max_host_backoff
+
+        if failures >= self.host_failure_threshold:
+            backoff = min(
+                self.host_backoff * 2 ** (failures - self.host_failure_threshold),
+                self.max_host_backoff)
+            record["until"] = time.time() + backoff
+            ttl = backoff * 2
+            logger.warning(
+                f"Backing off {urlsplit(url).netloc} for {backoff}s after {failures} failures")
+
+        await cache_manager.aset(host_key, record, ttl)
+
+    async def record_success(self, url: str) -> None:
+        """✅ Clear the failure records of a URL and its host
+
+        Args:
+            url: URL that was fetched successfully
+        """
+        await cache_manager.adelete(self._url_key(url))
+        await cache_manager.adelete(self._host_key(url))
+
+
+# Create a singleton instance for global use
+negative_cache = NegativeCache()
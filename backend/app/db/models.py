@@ -27,13 +27,16 @@ class BaseDocument(Document):
     async def save_document(self):
         """💾 Save document with automatic timestamp update
 
-        Updates the 'updated_at' field to the current time before saving.
+        Saves through DBManager, which updates the 'updated_at' field and
+        invalidates the document's cached copies in every worker.
 
         Returns:
             The saved document instance
         """
-        self.updated_at = datetime.now()
-        return await self.save()
+        # Imported here because DBManager imports these models
+        from app.manager.db import db_manager
+
+        return await db_manager.save_document(self)
 
 
 class ResumeDB(BaseDocument):
@@ -157,8 +160,9 @@ class MatchAnalysisDB(Document):
         ]
 
     async def save_document(self):
-        self.updated_at = datetime.now()
-        return await self.save()
+        from app.manager.db import db_manager
+
+        return await db_manager.save_document(self)
 
     @property
     def cache_key(self) -> str:
@@ -1,10 +1,13 @@
 from fastapi import UploadFile
-from app.core.content_processor import ContentProcessor, DocumentChunk
+from app.core.content_processor import ContentProcessor, DocumentChunk, FetchedDocument
+from app.core.compaction import text_compactor
 from app.services.jobs import JobDescriptionExtractor, JobData
 from app.db import JobDB
+from app.core.config import settings
+from app.manager import cache_manager, single_flight
 from loguru import logger
 from typing import Literal, Optional
-from pydantic import HttpUrl
+from pydantic import HttpUrl, ValidationError
 
 
 SourceType = Literal["text", "file", "link"]
@@ -71,19 +74,21 @@ class JobEngine:
         jdb.parsed_data = job_data
         return jdb
 
-    async def _parse_job_data(self, text: str) -> JobData:
+    async def _parse_job_data(self, document_chunk: DocumentChunk) -> JobData:
         """📝 Extract structured data from job description text
 
-        Takes raw text content and transforms it into structured job data
-        using the job extractor service.
+        Takes the extracted document and transforms it into structured job
+        data using the job extractor service. The text is compacted first so
+        boilerplate and repeated headers do not cost LLM tokens.
 
         Args:
-            text: Raw text content from the job description document
+            document_chunk: Processed job document with raw text and metadata
 
         Returns:
             Structured JobData object with parsed information
         """
-        job_data = await self.job_extractor.parse_job_description(text)
+        job_data = await self.job_extractor.parse_job_description(
+            text_compactor.compact_document(document_chunk, remove_boilerplate=True))
         return job_data
 
     @classmethod
@@ -102,6 +107,55 @@ class JobEngine:
         existing_job = await JobDB.find_one({"content_hash": content_hash})
         return existing_job
 
+    @classmethod
+    async def _cache_parsed_job(cls, content_hash: str, job_data: JobData) -> None:
+        """💾 Store parsed job data in the cache under its raw-content hash"""
+        if settings.CACHE_PARSED_DATA:
+            await cache_manager.aset(
+                f"parsed:job:{content_hash}",
+                job_data.model_dump(mode="json"),
+                settings.REDIS_TTL)
+
+    async def _find_parsed_job(self, content_hash: str, include_db: bool = True) -> Optional[JobData]:
+        """⚡ Look up already parsed job data by raw-content hash
+
+        Checks process memory, then Redis, then MongoDB, so a re-submitted
+        document is answered before any text extraction or LLM parsing.
+        Cached data is validated back into JobData; an entry that no longer
+        fits the model is dropped and treated as a miss.
+
+        Args:
+            content_hash: Hash of the raw document content
+            include_db: Whether to fall back to MongoDB on a cache miss
+
+        Returns:
+            Parsed job data, or None if this content has not been parsed yet
+        """
+        cache_key = f"parsed:job:{content_hash}"
+        if settings.CACHE_PARSED_DATA:
+            cached = await cache_manager.aget(cache_key)
+            if cached:
+                try:
+                    job_data = JobData.model_validate(cached)
+                    logger.info(f"Cache hit: Found parsed job with hash {content_hash}")
+                    return job_data
+                except ValidationError as e:
+                    logger.warning(
+                        f"Dropping stale parsed job with hash {content_hash}: {str(e)}")
+                    await cache_manager.adelete(cache_key)
+
+        if not include_db:
+            return None
+
+        existing_job = await self._find_from_db(content_hash)
+        if existing_job and existing_job.parsed_data:
+            logger.info(
+                f"Cache hit: Found existing job with hash {content_hash}")
+            await self._cache_parsed_job(content_hash, existing_job.parsed_data)
+            return existing_job.parsed_data
+
+        return None
+
     async def _save_job(self, content_hash: str, job_data: JobData, source: SourceType, source_url: Optional[HttpUrl] = None):
         """💾 Save a new job to the database
 
@@ -125,10 +179,10 @@ class JobEngine:
     async def _process_document_chunk(self, document_chunk: DocumentChunk, source: SourceType, source_url: Optional[HttpUrl] = None) -> JobData:
         """🔄 Process a document chunk into job data
 
-        Common processing logic for both file and URL sources:
-        - 🔍 Checks for existing processed version in database
-        - 🧠 Extracts structured data if needed
-        - 💾 Saves or updates the database record
+        Common processing logic for both file and URL sources, called
+        once _find_parsed_job has missed for the content hash:
+        - 🧠 Extracts structured data
+        - 💾 Caches it and saves the database record
 
         Args:
             document_chunk: Processed document with raw text and metadata
@@ -136,34 +190,63 @@ class JobEngine:
             source_url: URL source if applicable
 
         Returns:
-            Structured job data as a dictionary
+            Structured job data
         """
-        existing_job = await self._find_from_db(document_chunk.content_hash)
-        if existing_job and existing_job.parsed_data:
-            logger.info(
-                f"Cache hit: Found existing job with hash {document_chunk.content_hash}"
-            )
-            return existing_job.parsed_data
+        job_data = await self._parse_job_data(document_chunk)
+        await self._cache_parsed_job(document_chunk.content_hash, job_data)
+        await self._save_job(document_chunk.content_hash, job_data, source, source_url)
+        return job_data
 
-        job_data = await self._parse_job_data(document_chunk.raw_text)
+    async def _find_parsed_url(self, url: HttpUrl):
+        """⚡ Look up parsed job data for a URL through the cache only
 
-        if existing_job:
-            existing_job = self.convert_job_data_to_db(
-                existing_job,
-                job_data,
-                source,
-                source_url)
-            await existing_job.save_document()
-            logger.info(f"Updated existing job {existing_job.id}")
-        else:
-            await self._save_job(document_chunk.content_hash, job_data, source, source_url)
+        Used by requests waiting on another worker's parse of the same URL.
+        """
+        known_hash = await self.content_processor.cached_url_hash(url)
+        if not known_hash:
+            return None
+        return await self._find_parsed_job(known_hash, include_db=False)
 
-        return job_data
+    async def _process_url(self, url: HttpUrl, known_hash: Optional[str] = None, fetched: Optional[FetchedDocument] = None):
+        """🌐 Fetch (unless already fetched), extract and parse a URL document
+
+        Args:
+            url: URL of the document
+            known_hash: Content hash already checked against the parse cache
+            fetched: Document already downloaded, e.g. by a revalidation
+
+        Returns:
+            Structured job data
+        """
+        if fetched is None:
+            fetched = await self.content_processor.fetch_url(
+                url, self._reparse_on_change(url))
+        if fetched.content_hash != known_hash:
+            parsed = await self._find_parsed_job(fetched.content_hash)
+            if parsed:
+                return parsed
+
+        document_chunk = await self.content_processor.process_fetched(fetched)
+        return await self._process_document_chunk(document_chunk, "link", url)
+
+    async def _coalesce_url(self, url: HttpUrl, process):
+        """🤝 Run URL processing once across concurrent requests and workers"""
+        return await single_flight.do(
+            f"job:url:{cache_manager.hash_content(str(url))}",
+            process,
+            lambda: self._find_parsed_url(url))
+
+    def _reparse_on_change(self, url: HttpUrl):
+        """🔁 Callback that re-parses a URL whose revalidation found new content"""
+        return lambda fetched: self._coalesce_url(
+            url, lambda: self._process_url(url, fetched=fetched))
 
     async def from_file(self, file: UploadFile):
         """📄 Process a job description from an uploaded file
 
         Handles the complete job processing workflow:
+        - 🔐 Hashes the upload and returns known results before extraction
+        - 🤝 Coalesces concurrent uploads of the same content into one parse
         - 📥 Processes the uploaded file into text
         - Delegates to common processing logic
 
@@ -171,32 +254,55 @@ class JobEngine:
             file: Uploaded job description file (PDF, DOCX, etc.)
 
         Returns:
-            Structured job data as a dictionary
+            Structured JobData
         """
-        document_chunk = await self.content_processor.process_file(file)
-        return await self._process_document_chunk(document_chunk, "file")
+        upload = await self.content_processor.ingest_file(file)
+        parsed = await self._find_parsed_job(upload.content_hash)
+        if parsed:
+            return parsed
+
+        async def process():
+            document_chunk = await self.content_processor.process_upload(upload)
+            return await self._process_document_chunk(document_chunk, "file")
+
+        return await single_flight.do(
+            f"job:content:{upload.content_hash}",
+            process,
+            lambda: self._find_parsed_job(upload.content_hash, include_db=False))
 
     async def from_url(self, url: HttpUrl):
         """📄 Process a job description from a URL
 
         Handles the complete job processing workflow for URLs:
-        - 🔍 Processes the URL into text
+        - 🔐 Returns known results for the URL's cached content hash, and
+          revalidates stale content in the background (re-parsing on change)
+        - 🤝 Coalesces concurrent imports of the same URL into one fetch and parse
+        - 🔍 Fetches the URL and checks the hash again before extraction
         - Delegates to common processing logic
 
         Args:
             url: URL of the job description document or web page
 
         Returns:
-            Structured job data as a dictionary
+            Structured JobData
         """
-        document_chunk = await self.content_processor.process_url(url)
-        return await self._process_document_chunk(document_chunk, "link", url)
+        known_hash = await self.content_processor.cached_url_hash(url)
+        if known_hash:
+            parsed = await self._find_parsed_job(known_hash)
+            if parsed:
+                await self.content_processor.revalidate_if_stale(
+                    url, known_hash, self._reparse_on_change(url))
+                return parsed
+
+        return await self._coalesce_url(
+            url, lambda: self._process_url(url, known_hash))
 
     async def from_text(self, text: str, title: str = "Job Description"):
         """📝 Process a job description from raw text
 
         Handles direct text input for job descriptions:
         - Converts the text to a document chunk
+        - 🤝 Coalesces concurrent submissions of the same text into one parse
         - Delegates to common processing logic
 
         Args:
@@ -204,17 +310,27 @@ class JobEngine:
             title: Title for the job (used as filename)
 
         Returns:
-            Structured job data as a dictionary
+            Structured JobData
         """
         from hashlib import sha256
         content_hash = sha256(text.encode('utf-8')).hexdigest()
-        raw_chunk = await self.content_processor.process_text(text)
+        parsed = await self._find_parsed_job(content_hash)
+        if parsed:
+            return parsed
+
+        async def process():
+            raw_chunk = await self.content_processor.process_text(text)
+
+            document_chunk = DocumentChunk(
+                content_hash=content_hash,
+                raw_text=raw_chunk.raw_text,
+                file_name=title,
+                metadata=raw_chunk.metadata
+            )
 
-        document_chunk = DocumentChunk(
-            content_hash=content_hash,
-            raw_text=raw_chunk.raw_text,
-            file_name=title,
-            metadata=raw_chunk.metadata
-        )
+            return await self._process_document_chunk(document_chunk, "text")
 
-        return await self._process_document_chunk(document_chunk, "text")
+        return await single_flight.do(
+            f"job:content:{content_hash}",
+            process,
+            lambda: self._find_parsed_job(content_hash, include_db=False))
@@ -1,9 +1,12 @@
 from fastapi import UploadFile
 from typing import Literal, Optional
-from app.core.content_processor import ContentProcessor, DocumentChunk
+from app.core.content_processor import ContentProcessor, DocumentChunk, FetchedDocument
+from app.core.compaction import text_compactor
 from app.services.resume import ResumeExtractor, ResumeData
 from app.db import ResumeDB
-from pydantic import HttpUrl
+from app.core.config import settings
+from app.manager import cache_manager, single_flight
+from pydantic import HttpUrl, ValidationError
 from loguru import logger
 
 
@@ -32,19 +35,21 @@ class ResumeEngine:
         self.content_processor = ContentProcessor()
         self.resume_extractor = ResumeExtractor()
 
-    async def _parse_resume_data(self, text: str):
+    async def _parse_resume_data(self, document_chunk: DocumentChunk):
         """📝 Extract structured data from resume text
 
-        Takes raw text content and transforms it into structured resume data
-        using the resume extractor service.
+        Takes the extracted document and transforms it into structured resume
+        data using the resume extractor service. The text is compacted first
+        so repeated headers and page numbers do not cost LLM tokens.
 
         Args:
-            text: Raw text content from the resume document
+            document_chunk: Processed resume document with raw text and metadata
 
         Returns:
             Structured ResumeData object with parsed information
         """
-        resume_data = await self.resume_extractor.parse_resume(text)
+        resume_data = await self.resume_extractor.parse_resume(
+            text_compactor.compact_document(document_chunk))
         return resume_data
 
     @classmethod
@@ -63,6 +68,56 @@ class ResumeEngine:
         existing_resume = await ResumeDB.find_one({"content_hash": content_hash})
         return existing_resume
 
+    @classmethod
+    async def _cache_parsed_resume(cls, content_hash: str, resume_data: ResumeData) -> None:
+        """💾 Store parsed resume data in the cache under its raw-content hash"""
+        if settings.CACHE_PARSED_DATA:
+            await cache_manager.aset(
+                f"parsed:resume:{content_hash}",
+                resume_data.model_dump(mode="json"),
+                settings.REDIS_TTL)
+
+    async def _find_parsed_resume(self, content_hash: str, include_db: bool = True) -> Optional[ResumeData]:
+        """⚡ Look up already parsed resume data by raw-content hash
+
+        Checks process memory, then Redis, then MongoDB, so a re-uploaded
+        resume is answered before any text extraction or LLM parsing.
+        Cached data is validated back into ResumeData; an entry that no
+        longer fits the model is dropped and treated as a miss.
+
+        Args:
+            content_hash: Hash of the raw resume content
+            include_db: Whether to fall back to MongoDB on a cache miss
+
+        Returns:
+            Parsed resume data, or None if this content has not been parsed yet
+        """
+        cache_key = f"parsed:resume:{content_hash}"
+        if settings.CACHE_PARSED_DATA:
+            cached = await cache_manager.aget(cache_key)
+            if cached:
+                try:
+                    resume_data = ResumeData.model_validate(cached)
+                    logger.info(
+                        f"Cache hit: Found parsed resume with hash {content_hash}")
+                    return resume_data
+                except ValidationError as e:
+                    logger.warning(
+                        f"Dropping stale parsed resume with hash {content_hash}: {str(e)}")
+                    await cache_manager.adelete(cache_key)
+
+        if not include_db:
+            return None
+
+        existing_resume = await self._find_from_db(content_hash)
+        if existing_resume and existing_resume.parsed_data:
+            logger.info(
+                f"Cache hit: Found existing resume with hash {content_hash}")
+            await self._cache_parsed_resume(content_hash, existing_resume.parsed_data)
+            return existing_resume.parsed_data
+
+        return None
+
     @classmethod
     async def _save_resume(cls, document_chunk: DocumentChunk, resume_data: ResumeData, source: SourceType, source_url: Optional[HttpUrl] = None):
         """💾 Save a new resume to the database
@@ -88,41 +143,72 @@ class ResumeEngine:
     async def _process_document_chunk(self, document_chunk: DocumentChunk, source: SourceType, source_url: Optional[HttpUrl] = None):
         """🔄 Process a document chunk into resume data
 
-        Common processing logic for both file and URL sources:
-        - 🔍 Checks for existing processed version in database
-        - 🧠 Extracts structured data if needed
-        - 💾 Saves or updates the database record
+        Common processing logic for both file and URL sources, called
+        once _find_parsed_resume has missed for the content hash:
+        - 🧠 Extracts structured data
+        - 💾 Caches it and saves the database record
 
         Args:
             document_chunk: Processed document with raw text and metadata
 
         Returns:
-            Structured resume data as a dictionary
+            Structured resume data
         """
-        existing_resume = await self._find_from_db(document_chunk.content_hash)
-        if existing_resume and existing_resume.parsed_data:
-            logger.info(
-                f"Cache hit: Found existing resume with hash {document_chunk.content_hash}")
-            return existing_resume.parsed_data
+        resume_data = await self._parse_resume_data(document_chunk)
+        await self._cache_parsed_resume(document_chunk.content_hash, resume_data)
+        await self._save_resume(document_chunk, resume_data, source, source_url)
+        return resume_data
+
+    async def _find_parsed_url(self, url: HttpUrl):
+        """⚡ Look up parsed resume data for a URL through the cache only
 
-        resume_data = await self._parse_resume_data(document_chunk.raw_text)
+        Used by requests waiting on another worker's parse of the same URL.
+        """
+        known_hash = await self.content_processor.cached_url_hash(url)
+        if not known_hash:
+            return None
+        return await self._find_parsed_resume(known_hash, include_db=False)
 
-        if existing_resume:
-            existing_resume.name = document_chunk.file_name
-            existing_resume.text_content = document_chunk.raw_text
-            existing_resume.parsed_data = resume_data.model_dump()
-            existing_resume.status = "ready"
-            await existing_resume.save_document()
-            logger.info(f"Updated existing resume {existing_resume.id}")
-        else:
-            await self._save_resume(document_chunk, resume_data, source, source_url)
+    async def _process_url(self, url: HttpUrl, known_hash: Optional[str] = None, fetched: Optional[FetchedDocument] = None):
+        """🌐 Fetch (unless already fetched), extract and parse a URL document
 
-        return resume_data.model_dump()
+        Args:
+            url: URL of the document
+            known_hash: Content hash already checked against the parse cache
+            fetched: Document already downloaded, e.g. by a revalidation
+
+        Returns:
+            Structured resume data
+        """
+        if fetched is None:
+            fetched = await self.content_processor.fetch_url(
+                url, self._reparse_on_change(url))
+        if fetched.content_hash != known_hash:
+            parsed = await self._find_parsed_resume(fetched.content_hash)
+            if parsed:
+                return parsed
+
+        document_chunk = await self.content_processor.process_fetched(fetched)
+        return await self._process_document_chunk(document_chunk, "url", url)
+
+    async def _coalesce_url(self, url: HttpUrl, process):
+        """🤝 Run URL processing once across concurrent requests and workers"""
+        return await single_flight.do(
+            f"resume:url:{cache_manager.hash_content(str(url))}",
+            process,
+            lambda: self._find_parsed_url(url))
+
+    def _reparse_on_change(self, url: HttpUrl):
+        """🔁 Callback that re-parses a URL whose revalidation found new content"""
+        return lambda fetched: self._coalesce_url(
+            url, lambda: self._process_url(url, fetched=fetched))
 
     async def from_file(self, file: UploadFile):
         """📄 Process a resume from an uploaded file
 
         Handles the complete resume processing workflow:
+        - 🔐 Hashes the upload and returns known results before extraction
+        - 🤝 Coalesces concurrent uploads of the same content into one parse
         - 📥 Processes the uploaded file into text
         - Delegates to common processing logic
 
@@ -130,23 +216,45 @@ class ResumeEngine:
             file: Uploaded resume file (PDF, DOCX, etc.)
 
         Returns:
-            Structured resume data as a dictionary
+            Structured ResumeData
         """
-        document_chunk = await self.content_processor.process_file(file)
-        return await self._process_document_chunk(document_chunk, "file", None)
+        upload = await self.content_processor.ingest_file(file)
+        parsed = await self._find_parsed_resume(upload.content_hash)
+        if parsed:
+            return parsed
+
+        async def process():
+            document_chunk = await self.content_processor.process_upload(upload)
+            return await self._process_document_chunk(document_chunk, "file", None)
+
+        return await single_flight.do(
+            f"resume:content:{upload.content_hash}",
+            process,
+            lambda: self._find_parsed_resume(upload.content_hash, include_db=False))
 
     async def from_url(self, url: HttpUrl):
         """📄 Process a resume from a URL
 
         Handles the complete resume processing workflow for URLs:
-        - 🔍 Processes the URL into text
+        - 🔐 Returns known results for the URL's cached content hash, and
+          revalidates stale content in the background (re-parsing on change)
+        - 🤝 Coalesces concurrent imports of the same URL into one fetch and parse
+        - 🔍 Fetches the URL and checks the hash again before extraction
         - Delegates to common processing logic
 
         Args:
             url: URL of the resume document
 
         Returns:
-            Structured resume data as a dictionary
+            Structured ResumeData
         """
-        document_chunk = await self.content_processor.process_url()
-        return await self._process_document_chunk(document_chunk, "url", url)
+        known_hash = await self.content_processor.cached_url_hash(url)
+        if known_hash:
+            parsed = await self._find_parsed_resume(known_hash)
+            if parsed:
+                await self.content_processor.revalidate_if_stale(
+                    url, known_hash, self._reparse_on_change(url))
+                return parsed
+
+        return await self._coalesce_url(
+            url, lambda: self._process_url(url, known_hash))
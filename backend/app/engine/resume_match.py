@@ -5,6 +5,7 @@ from app.services.analyzer.models import MatchAnalysis
 from .resume import ResumeEngine
 from .jobs import JobEngine
 from app.db import MatchAnalysisDB, ResumeDB, JobDB
+from app.manager import cached, CacheNamespace, ModelCodec
 from fastapi import HTTPException
 from loguru import logger
 
@@ -33,10 +34,14 @@ class ResumeMatchEngine:
         self.match_analyzer = MatchAnalyzer()
         logger.info("Match Engine initialized")
 
+    @cached(CacheNamespace.MATCH,
+            key=lambda self, resume_id, job_id: f"{resume_id}:{job_id}",
+            codec=ModelCodec(MatchAnalysis))
     async def _check_cache(self, resume_id: UUID, job_id: UUID) -> Optional[MatchAnalysis]:
         """🔍 Check if a match analysis is already cached
 
-        Looks up previous analyses to avoid redundant processing.
+        Looks up previous analyses to avoid redundant processing. Found
+        analyses are memoized, so repeat lookups skip the database.
 
         Args:
             resume_id: ID of the resume
@@ -61,21 +66,18 @@ class ResumeMatchEngine:
                     job_id=existing_match.job_id,
                     overall_score=existing_match.overall_score,
                     summary=existing_match.summary,
-                    key_strengths=existing_match.get("key_strengths", []),
-                    key_gaps=existing_match.get("key_gaps", []),
+                    key_strengths=existing_match.key_strengths or [],
+                    key_gaps=existing_match.key_gaps or [],
                     section_scores=existing_match.section_scores,
                     skill_matches=existing_match.skill_matches,
                     experience_matches=existing_match.experience_matches,
                     education_matches=existing_match.education_matches,
                     keyword_matches=existing_match.keyword_matches,
                     improvement_suggestions=existing_match.improvement_suggestions,
-                    ats_optimization_tips=existing_match.get(
-                        "ats_optimization_tips", []),
-                    interview_preparation=existing_match.get(
-                        "interview_preparation", []),
-                    career_path_alignment=existing_match.get(
-                        "career_path_alignment", ""),
-                    competitiveness=existing_match.get("competitiveness", ""),
+                    ats_optimization_tips=existing_match.ats_optimization_tips or [],
+                    interview_preparation=existing_match.interview_preparation or [],
+                    career_path_alignment=existing_match.career_path_alignment or "",
+                    competitiveness=existing_match.competitiveness or "",
                     created_at=existing_match.created_at
                 )
 
@@ -251,8 +253,9 @@ class ResumeMatchEngine:
                 f"Analyzing match between resume {resume_id} and job {job_id}")
             match_analysis = await self.match_analyzer.analyze_match(resume_data, analysis_job_data)
 
-            # Save for future use
+            # Save for future use, replacing any memoized older analysis
             await self._save_match_analysis(match_analysis)
+            await self._check_cache.invalidate(resume_id, job_id)
 
             return match_analysis
 
@@ -5,14 +5,22 @@ from loguru import logger
 import time
 from contextlib import asynccontextmanager
 from app.db import connect_to_mongo, close_mongo_connection
+from app.core.http_client import http_fetcher
+from app.core.extraction import extraction_executor
+from app.manager import cache_manager, invalidation_bus
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Startup
     await connect_to_mongo()
+    await invalidation_bus.start()
     yield
     # Shutdown
+    await http_fetcher.close()
+    extraction_executor.shutdown()
+    await invalidation_bus.stop()
+    await cache_manager.close()
     await close_mongo_connection()
 
 
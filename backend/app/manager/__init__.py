@@ -1,3 +1,8 @@
-from .cache_manager import cache_manager
+from .cache_manager import cache_manager, CacheNamespace
+from .single_flight import single_flight
+from .invalidation import invalidation_bus
+from .memoize import cached, ModelCodec, ResultCodec
+from .metrics import cache_metrics
 
-__all__ = ["cache_manager"]
\ No newline at end of file
+__all__ = ["cache_manager", "CacheNamespace", "single_flight", "invalidation_bus",
+           "cached", "ModelCodec", "ResultCodec", "cache_metrics"]
\ No newline at end of file
@@ -1,18 +1,111 @@
+import asyncio
+import contextlib
 import hashlib
 import json
 import time
-from typing import Any, Optional, Dict, Union, TypeVar, Generic
+import uuid
+from enum import Enum
+from typing import Any, Optional, Dict, List, Tuple, Union, TypeVar
 from loguru import logger
 import redis
+import redis.asyncio as aioredis
 from app.core.config import settings
+from .circuit_breaker import redis_breaker
+from .codecs import build_value_codec
+from .disk_cache import DiskCache
+from .invalidation import invalidation_bus
+from .memory_cache import MemoryCache
+from .metrics import cache_metrics
 
 T = TypeVar('T')
 
 
+class CacheNamespace(str, Enum):
+    """
+    First segment of every cache key, used to invalidate one kind of entry.
+    """
+    URL = "url"                       # URL -> content hash
+    META = "meta"                     # downloaded document metadata
+    CONTENT = "content"               # downloaded document bytes
+    EXTRACTED = "extracted"           # extracted document text
+    PARSED = "parsed"                 # parsed job and resume data
+    MATCH = "match"                   # resume-to-job match analyses
+    DOCUMENT = "document"             # database documents looked up by id
+    LINKEDIN_PAGE = "linkedin_page"   # scraped LinkedIn search pages
+    LEASE = "lease"                   # single-flight leader leases
+    FAILURE = "failure"               # negative cache of failing URLs and hosts
+
+
+# Resolves url -> content hash -> (metadata, content) inside Redis, so a
+# cached URL is read in one round trip. KEYS[1] is the url key, ARGV holds
+# the meta and content key prefixes. The mapping is a short JSON string
+# (json or orjson tag, never compressed), so cjson can read it.
+#
+# Limitation: the meta and content keys are only known once the mapping is
+# read, so they are built inside the script instead of being declared in
+# KEYS. That works on a single Redis (or a replicated primary) but not on
+# Redis Cluster, where undeclared keys may live on another shard; hash tags
+# can't help because content keys are shared by every URL with that content.
+URL_CONTENT_SCRIPT = """
+local mapping = redis.call('GET', KEYS[1])
+if not mapping then
+    return false
+end
+local content_hash = cjson.decode(string.sub(mapping, 2))
+return {
+    mapping,
+    redis.call('GET', ARGV[1] .. content_hash),
+    redis.call('GET', ARGV[2] .. content_hash)
+}
+"""
+
+# Deletes a lease only if it is still held by the caller's token, so a
+# leader whose lease expired cannot release the next leader's lease.
+RELEASE_LEASE_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+# Extends a lease only if it is still held by the caller's token (ARGV[2]
+# is the new TTL in milliseconds), so a leader that lost its lease cannot
+# extend the next leader's.
+RENEW_LEASE_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('PEXPIRE', KEYS[1], ARGV[2])
+end
+return 0
+"""
+
+
 class CacheManager:
     """
     Manages caching with both in-memory and Redis options.
     Optimized for storing document content from URLs.
+
+    The async methods (aget, aset, ...) use a pooled redis.asyncio client
+    and are what request handlers should call, so a Redis round trip never
+    blocks the event loop. The sync methods remain for scripts and other
+    code running outside the loop.
+
+    Reads are two-level: process memory (L1) is checked first and misses
+    fall through to Redis (L2), whose hits are promoted into L1 with a short
+    TTL. Every entry is a single Redis key whose value starts with a codec
+    tag, so one GET (or one MGET for many keys) is enough.
+
+    Redis keys are ``<CACHE_KEY_PREFIX>:<namespace>:...``, so one deployment
+    can clear or invalidate its own entries in a shared Redis without
+    touching anyone else's keys.
+
+    Every Redis call goes through a circuit breaker: when Redis is down or
+    timing out, calls are skipped for a cooldown and the cache serves from
+    process memory alone until a probe finds Redis healthy again.
+
+    A SQLite file (DISK_CACHE_PATH) can back the cache as a local L2 shared
+    by the workers on a host. It takes over whenever Redis is unset, open
+    in the breaker or failing, so a single-host deployment keeps its cache
+    across restarts without running Redis.
     """
 
     def __init__(self, ttl: int = 3600):
@@ -22,13 +115,51 @@ class CacheManager:
         Args:
             ttl: Default time-to-live for cache entries in seconds
         """
-        self._memory_cache: Dict[str, Dict[str, Any]] = {}
+        self._memory_cache = MemoryCache(
+            max_entries=settings.MEMORY_CACHE_MAX_ENTRIES,
+            max_bytes=settings.MEMORY_CACHE_MAX_BYTES,
+            max_item_bytes=settings.MEMORY_CACHE_MAX_ITEM_BYTES,
+            sweep_interval=settings.MEMORY_CACHE_SWEEP_INTERVAL,
+            on_evict=lambda key, reason: cache_metrics.record_eviction(
+                "memory", key, reason),
+        )
         self._default_ttl = ttl
+        self._key_prefix = f"{settings.CACHE_KEY_PREFIX}:"
+        self._breaker = redis_breaker
+        invalidation_bus.subscribe("cache", self._evict_local)
+        self._codec = build_value_codec(
+            settings.CACHE_COMPRESSION_THRESHOLD, settings.CACHE_COMPRESSION_LEVEL)
+
+        self._disk = None
+        if settings.DISK_CACHE_PATH:
+            self._disk = DiskCache(
+                settings.DISK_CACHE_PATH,
+                max_bytes=settings.DISK_CACHE_MAX_BYTES,
+                max_item_bytes=settings.DISK_CACHE_MAX_ITEM_BYTES,
+            )
 
         self._redis = None
+        self._aredis = None
         if settings.REDIS_URL:
+            redis_options = {
+                "max_connections": settings.REDIS_MAX_CONNECTIONS,
+                "socket_timeout": settings.REDIS_SOCKET_TIMEOUT,
+                "socket_connect_timeout": settings.REDIS_CONNECT_TIMEOUT,
+            }
             try:
-                self._redis = redis.from_url(settings.REDIS_URL)
+                self._redis = redis.Redis(connection_pool=redis.ConnectionPool.from_url(
+                    settings.REDIS_URL, **redis_options))
+                # Connections are opened lazily on the loop that first uses them
+                self._aredis = aioredis.Redis(connection_pool=aioredis.ConnectionPool.from_url(
+                    settings.REDIS_URL, **redis_options))
+                self._url_content_script = self._redis.register_script(
+                    URL_CONTENT_SCRIPT)
+                self._aurl_content_script = self._aredis.register_script(
+                    URL_CONTENT_SCRIPT)
+                self._arelease_lease_script = self._aredis.register_script(
+                    RELEASE_LEASE_SCRIPT)
+                self._arenew_lease_script = self._aredis.register_script(
+                    RENEW_LEASE_SCRIPT)
                 logger.info(f"Connected to Redis at {settings.REDIS_URL}")
             except Exception as e:
                 logger.error(f"Failed to connect to Redis: {str(e)}")
@@ -36,7 +167,113 @@ class CacheManager:
         logger.info(
             f"Initialized Cache Manager with default TTL of {ttl} seconds")
 
-    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+    def _redis_key(self, key: str) -> str:
+        """
+        Map a cache key to the key it is stored under in Redis and on disk.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Redis or disk key
+        """
+        return f"{self._key_prefix}{key}"
+
+    def _use_redis(self, client) -> bool:
+        """
+        Decide whether to make a Redis call.
+
+        While the circuit breaker is open after repeated connection errors
+        or timeouts, calls are skipped and only process memory is used, so
+        an outage does not add a socket timeout to every request.
+
+        Args:
+            client: Redis client about to be used, or None without Redis
+
+        Returns:
+            True to make the call, which must then report to the breaker
+        """
+        return client is not None and self._breaker.allow()
+
+    def _redis_failed(self, error: Exception, action: str) -> None:
+        """
+        Log a failed Redis call and report it to the circuit breaker.
+
+        Args:
+            error: Exception the call raised
+            action: What the call was doing, for the log message
+        """
+        logger.error(f"Error {action}: {str(error)}")
+        self._breaker.record_failure(error)
+
+    def _evict_local(self, keys: List[str], patterns: List[str]) -> None:
+        """
+        Evict keys invalidated by another worker from the memory cache.
+
+        Args:
+            keys: Exact cache keys
+            patterns: Glob patterns over cache keys
+        """
+        for key in keys:
+            self._memory_cache.delete(key)
+        for pattern in patterns:
+            self._memory_cache.delete_matching(pattern)
+
+    @staticmethod
+    def _publish_in(client, keys: List[str], patterns: Optional[List[str]] = None):
+        """
+        Queue an invalidation for other workers' memory caches.
+
+        Given a pipeline, the PUBLISH rides along with the write in the same
+        round trip; given the sync client it is sent right away, and given
+        the async client the caller awaits the returned coroutine.
+
+        Args:
+            client: Redis pipeline, sync or async client to publish with
+            keys: Cache keys that were written or deleted
+            patterns: Glob patterns that were invalidated
+
+        Returns:
+            The client's PUBLISH result, or None if invalidation is disabled
+        """
+        if settings.CACHE_INVALIDATION_ENABLED:
+            return client.publish(invalidation_bus.channel,
+                                  invalidation_bus.encode("cache", keys, patterns))
+
+    def _encode(self, value: Any) -> bytes:
+        """
+        Serialize a value for Redis with the configured codec.
+
+        The payload starts with a codec tag, so a single GET is enough to
+        decode it, and entries written by older codecs still decode.
+
+        Args:
+            value: Value to serialize
+
+        Returns:
+            Tagged payload
+        """
+        return self._codec.encode(value)
+
+    def _decode(self, payload: Optional[bytes]) -> Optional[Any]:
+        """
+        Deserialize a tagged payload read from Redis.
+
+        Args:
+            payload: Raw Redis value, or None for a missing key
+
+        Returns:
+            Decoded value, or None if missing or undecodable
+        """
+        if payload is None:
+            return None
+        try:
+            return self._codec.decode(payload)
+        except Exception as e:
+            logger.error(f"Error decoding cached value: {str(e)}")
+            return None
+
+    def set(self, key: str, value: Any, ttl: Optional[int] = None, memory_ttl: Optional[int] = None) -> None:
         """
         Set a value in the cache (memory and Redis if available).
 
@@ -44,68 +281,295 @@ class CacheManager:
             key: Cache key
             value: Value to cache
             ttl: Time-to-live in seconds
+            memory_ttl: Time-to-live in process memory, if shorter than ttl
         """
-        # Set in memory cache
-        expiry = time.time() + (ttl or self._default_ttl)
-        self._memory_cache[key] = {
-            "value": value,
-            "expiry": expiry
-        }
+        self.set_many({key: value}, ttl, memory_ttl)
 
-        # Set in Redis if available
-        if self._redis:
+    async def aset(self, key: str, value: Any, ttl: Optional[int] = None, memory_ttl: Optional[int] = None) -> None:
+        """
+        Set a value in the cache without blocking the event loop.
+
+        Args:
+            key: Cache key
+            value: Value to cache
+            ttl: Time-to-live in seconds
+            memory_ttl: Time-to-live in process memory, if shorter than ttl
+        """
+        await self.aset_many({key: value}, ttl, memory_ttl)
+
+    def set_many(self, entries: Dict[str, Any], ttl: Optional[int] = None, memory_ttl: Optional[int] = None) -> None:
+        """
+        Set several values, writing them to Redis in one pipelined round trip.
+
+        Args:
+            entries: Mapping of cache key to value
+            ttl: Time-to-live in seconds
+            memory_ttl: Time-to-live in process memory, if shorter than ttl
+        """
+        ttl = ttl or self._default_ttl
+        for key, value in entries.items():
+            self._memory_cache.set(key, value, min(memory_ttl or ttl, ttl))
+
+        if self._use_redis(self._redis):
+            try:
+                started = time.perf_counter()
+                pipeline = self._redis.pipeline(transaction=False)
+                for key, value in entries.items():
+                    payload = self._encode(value)
+                    pipeline.set(self._redis_key(key), payload, ex=ttl)
+                    cache_metrics.record_write("redis", key, len(payload))
+                self._publish_in(pipeline, list(entries))
+                pipeline.execute()
+                cache_metrics.observe(
+                    "set", "redis", entries, time.perf_counter() - started)
+                self._breaker.record_success()
+                return
+            except Exception as e:
+                self._redis_failed(e, "setting value in Redis")
+
+        if self._disk:
+            self._disk_set(entries, ttl)
+
+    async def aset_many(self, entries: Dict[str, Any], ttl: Optional[int] = None, memory_ttl: Optional[int] = None) -> None:
+        """
+        Set several values in one pipelined round trip without blocking the event loop.
+
+        Args:
+            entries: Mapping of cache key to value
+            ttl: Time-to-live in seconds
+            memory_ttl: Time-to-live in process memory, if shorter than ttl
+        """
+        ttl = ttl or self._default_ttl
+        for key, value in entries.items():
+            self._memory_cache.set(key, value, min(memory_ttl or ttl, ttl))
+
+        if self._use_redis(self._aredis):
             try:
-                # Serialize value based on type
-                if isinstance(value, bytes):
-                    # Store binary data directly
-                    self._redis.set(f"bin:{key}", value,
-                                    ex=(ttl or self._default_ttl))
-                else:
-                    # Serialize other types to JSON
-                    serialized = json.dumps(value)
-                    self._redis.set(f"json:{key}", serialized, ex=(
-                        ttl or self._default_ttl))
+                started = time.perf_counter()
+                pipeline = self._aredis.pipeline(transaction=False)
+                for key, value in entries.items():
+                    payload = self._encode(value)
+                    pipeline.set(self._redis_key(key), payload, ex=ttl)
+                    cache_metrics.record_write("redis", key, len(payload))
+                self._publish_in(pipeline, list(entries))
+                await pipeline.execute()
+                cache_metrics.observe(
+                    "set", "redis", entries, time.perf_counter() - started)
+                self._breaker.record_success()
+                return
             except Exception as e:
-                logger.error(f"Error setting value in Redis: {str(e)}")
+                self._redis_failed(e, "setting value in Redis")
+
+        if self._disk:
+            await asyncio.to_thread(self._disk_set, entries, ttl)
 
     def get(self, key: str, use_redis: bool = True) -> Optional[Any]:
         """
-        Get a value from the cache, trying Redis first if enabled.
+        Get a value from the cache, checking process memory before Redis.
+
+        Args:
+            key: Cache key
+            use_redis: Whether to fall through to Redis (or the disk tier) on a memory miss
+
+        Returns:
+            Cached value or None if not found or expired
+        """
+        return self.get_many([key], use_redis).get(key)
+
+    async def aget(self, key: str, use_redis: bool = True) -> Optional[Any]:
+        """
+        Get a value from the cache without blocking the event loop.
 
         Args:
             key: Cache key
-            use_redis: Whether to try Redis before memory cache
+            use_redis: Whether to fall through to Redis (or the disk tier) on a memory miss
 
         Returns:
             Cached value or None if not found or expired
         """
-        # Try Redis first if enabled
-        if use_redis and self._redis:
+        return (await self.aget_many([key], use_redis)).get(key)
+
+    def _get_from_memory(self, keys: List[str]) -> Tuple[Dict[str, Any], List[str]]:
+        """
+        Read keys from the memory cache (L1).
+
+        Args:
+            keys: Requested cache keys
+
+        Returns:
+            Tuple of (values found in memory, keys still missing)
+        """
+        started = time.perf_counter()
+        found = {}
+        missing = []
+        for key in keys:
+            value = self._memory_cache.get(key)
+            if value is None:
+                missing.append(key)
+            else:
+                found[key] = value
+        cache_metrics.observe("get", "memory", keys, time.perf_counter() - started)
+        self._record_lookup("memory", keys, found)
+        return found, missing
+
+    @staticmethod
+    def _record_lookup(tier: str, keys: List[str], found: Dict[str, Any]) -> None:
+        """
+        Count the hits and misses of a lookup in the cache metrics.
+
+        Args:
+            tier: Tier that was read, "memory" or "redis"
+            keys: Keys that were looked up in the tier
+            found: Values found so far, keyed by cache key
+        """
+        cache_metrics.record_lookup(
+            tier,
+            hits=[key for key in keys if key in found],
+            misses=[key for key in keys if key not in found])
+
+    def _promote(self, keys: List[str], payloads: List[Optional[bytes]], found: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Decode L2 (Redis or disk) hits and copy them into the memory cache (L1).
+
+        Promoted entries get the short MEMORY_CACHE_PROMOTION_TTL, which
+        bounds how long a worker can serve a value another worker changed.
+
+        Args:
+            keys: Keys that were read from L2
+            payloads: Raw L2 values, in key order
+            found: Values found so far, updated in place
+
+        Returns:
+            The updated mapping of found values
+        """
+        for key, payload in zip(keys, payloads):
+            value = self._decode(payload)
+            if value is not None:
+                found[key] = value
+                self._memory_cache.set(
+                    key, value, min(settings.MEMORY_CACHE_PROMOTION_TTL, self._default_ttl))
+        return found
+
+    def _disk_set(self, entries: Dict[str, Any], ttl: int) -> None:
+        """
+        Write entries to the disk tier, used when Redis is unset or down.
+
+        With Redis configured, the entries are only a stopgap that Redis
+        invalidations cannot reach, so their TTL is capped at
+        DISK_CACHE_FALLBACK_TTL.
+
+        Args:
+            entries: Mapping of cache key to value
+            ttl: Time-to-live in seconds
+        """
+        if settings.REDIS_URL:
+            ttl = min(ttl, settings.DISK_CACHE_FALLBACK_TTL)
+        started = time.perf_counter()
+        payloads = {key: self._encode(value) for key, value in entries.items()}
+        self._disk.set_many(
+            {self._redis_key(key): payload for key, payload in payloads.items()}, ttl)
+        for key, payload in payloads.items():
+            cache_metrics.record_write("disk", key, len(payload))
+        cache_metrics.observe("set", "disk", entries, time.perf_counter() - started)
+
+    def _disk_read(self, keys: List[str]) -> Dict[str, bytes]:
+        """
+        Read raw payloads from the disk tier.
+
+        Args:
+            keys: Cache keys
+
+        Returns:
+            Mapping of each cache key found to its payload
+        """
+        payloads = self._disk.get_many([self._redis_key(key) for key in keys])
+        return {key: payloads[self._redis_key(key)]
+                for key in keys if self._redis_key(key) in payloads}
+
+    def _disk_get(self, keys: List[str], found: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Read keys from the disk tier and promote hits into memory.
+
+        Args:
+            keys: Keys missing from memory
+            found: Values found so far, updated in place
+
+        Returns:
+            The updated mapping of found values
+        """
+        started = time.perf_counter()
+        payloads = self._disk_read(keys)
+        cache_metrics.observe("get", "disk", keys, time.perf_counter() - started)
+        self._promote(keys, [payloads.get(key) for key in keys], found)
+        self._record_lookup("disk", keys, found)
+        return found
+
+    def get_many(self, keys: List[str], use_redis: bool = True) -> Dict[str, Any]:
+        """
+        Get several values, reading memory misses from Redis with a single MGET.
+
+        Args:
+            keys: Cache keys
+            use_redis: Whether to fall through to Redis (or the disk tier) on a memory miss
+
+        Returns:
+            Mapping of each key that was found to its value
+        """
+        found, missing = self._get_from_memory(keys)
+        if not (use_redis and missing):
+            return found
+
+        if self._use_redis(self._redis):
             try:
-                # Try to get as binary data first
-                binary_data = self._redis.get(f"bin:{key}")
-                if binary_data:
-                    return binary_data
-
-                # Try to get as JSON data
-                json_data = self._redis.get(f"json:{key}")
-                if json_data:
-                    return json.loads(json_data)
+                started = time.perf_counter()
+                payloads = self._redis.mget(
+                    [self._redis_key(key) for key in missing])
+                cache_metrics.observe(
+                    "get", "redis", missing, time.perf_counter() - started)
+                self._promote(missing, payloads, found)
+                self._record_lookup("redis", missing, found)
+                self._breaker.record_success()
+                return found
             except Exception as e:
-                logger.error(f"Error getting value from Redis: {str(e)}")
+                self._redis_failed(e, "getting value from Redis")
 
-        # Fall back to memory cache
-        entry = self._memory_cache.get(key)
+        if self._disk:
+            self._disk_get(missing, found)
+        return found
 
-        if not entry:
-            return None
+    async def aget_many(self, keys: List[str], use_redis: bool = True) -> Dict[str, Any]:
+        """
+        Get several values without blocking the event loop, reading memory
+        misses from Redis with a single MGET.
 
-        # Check if entry has expired
-        if entry["expiry"] < time.time():
-            del self._memory_cache[key]
-            return None
+        Args:
+            keys: Cache keys
+            use_redis: Whether to fall through to Redis (or the disk tier) on a memory miss
+
+        Returns:
+            Mapping of each key that was found to its value
+        """
+        found, missing = self._get_from_memory(keys)
+        if not (use_redis and missing):
+            return found
 
-        return entry["value"]
+        if self._use_redis(self._aredis):
+            try:
+                started = time.perf_counter()
+                payloads = await self._aredis.mget(
+                    [self._redis_key(key) for key in missing])
+                cache_metrics.observe(
+                    "get", "redis", missing, time.perf_counter() - started)
+                self._promote(missing, payloads, found)
+                self._record_lookup("redis", missing, found)
+                self._breaker.record_success()
+                return found
+            except Exception as e:
+                self._redis_failed(e, "getting value from Redis")
+
+        if self._disk:
+            await asyncio.to_thread(self._disk_get, missing, found)
+        return found
 
     def delete(self, key: str) -> None:
         """
@@ -114,33 +578,347 @@ class CacheManager:
         Args:
             key: Cache key
         """
-        # Delete from memory cache
-        if key in self._memory_cache:
-            del self._memory_cache[key]
+        # Delete from memory and disk caches
+        self._memory_cache.delete(key)
+        if self._disk:
+            self._disk.delete_many([self._redis_key(key)])
 
         # Delete from Redis if available
-        if self._redis:
+        if self._use_redis(self._redis):
             try:
-                self._redis.delete(f"bin:{key}")
-                self._redis.delete(f"json:{key}")
+                pipeline = self._redis.pipeline(transaction=False)
+                pipeline.delete(self._redis_key(key))
+                self._publish_in(pipeline, [key])
+                pipeline.execute()
+                self._breaker.record_success()
             except Exception as e:
-                logger.error(f"Error deleting value from Redis: {str(e)}")
+                self._redis_failed(e, "deleting value from Redis")
 
-    def clear(self) -> None:
-        """Clear all cache entries from memory cache and Redis."""
-        # Clear memory cache
-        self._memory_cache.clear()
+    async def adelete(self, key: str) -> None:
+        """
+        Delete a value from the cache without blocking the event loop.
 
-        # Clear Redis cache if available (only our keys)
-        if self._redis:
+        Args:
+            key: Cache key
+        """
+        self._memory_cache.delete(key)
+        if self._disk:
+            await asyncio.to_thread(self._disk.delete_many, [self._redis_key(key)])
+
+        if self._use_redis(self._aredis):
+            try:
+                pipeline = self._aredis.pipeline(transaction=False)
+                pipeline.delete(self._redis_key(key))
+                self._publish_in(pipeline, [key])
+                await pipeline.execute()
+                self._breaker.record_success()
+            except Exception as e:
+                self._redis_failed(e, "deleting value from Redis")
+
+    def _invalidation_pattern(self, namespace: Optional[Union[CacheNamespace, str]], pattern: str) -> str:
+        """
+        Build the key pattern, without the deployment prefix, to invalidate.
+
+        Args:
+            namespace: Namespace to limit the pattern to, or None for all
+            pattern: Glob pattern for the rest of the key
+
+        Returns:
+            Glob pattern over cache keys
+        """
+        if namespace is None:
+            return pattern
+        return f"{CacheNamespace(namespace).value}:{pattern}"
+
+    def invalidate(self, namespace: Optional[Union[CacheNamespace, str]] = None, pattern: str = "*") -> int:
+        """
+        Delete this deployment's entries in a namespace from memory and Redis.
+
+        Redis keys are found with incremental SCAN and removed with batched
+        UNLINK, which frees memory in the background, so a large namespace
+        never blocks the shared Redis the way KEYS and DEL would.
+
+        Args:
+            namespace: Namespace to invalidate, or None for every namespace
+            pattern: Glob pattern for the key after the namespace
+
+        Returns:
+            Number of Redis keys removed
+        """
+        key_pattern = self._invalidation_pattern(namespace, pattern)
+        self._memory_cache.delete_matching(key_pattern)
+        if self._disk:
+            self._disk.delete_matching(self._redis_key(key_pattern))
+
+        removed = 0
+        if self._use_redis(self._redis):
+            try:
+                batch = []
+                for redis_key in self._redis.scan_iter(
+                        match=self._redis_key(key_pattern), count=settings.CACHE_SCAN_COUNT):
+                    batch.append(redis_key)
+                    if len(batch) >= settings.CACHE_UNLINK_BATCH:
+                        removed += self._redis.unlink(*batch)
+                        batch = []
+                if batch:
+                    removed += self._redis.unlink(*batch)
+                self._publish_in(self._redis, [], [key_pattern])
+                self._breaker.record_success()
+            except Exception as e:
+                self._redis_failed(e, "invalidating Redis cache")
+
+        cache_metrics.record_eviction(
+            "redis", key_pattern, "invalidated", removed)
+        logger.info(f"Invalidated {removed} cache keys matching {key_pattern}")
+        return removed
+
+    async def ainvalidate(self, namespace: Optional[Union[CacheNamespace, str]] = None, pattern: str = "*") -> int:
+        """
+        Delete entries in a namespace without blocking the event loop.
+
+        Args:
+            namespace: Namespace to invalidate, or None for every namespace
+            pattern: Glob pattern for the key after the namespace
+
+        Returns:
+            Number of Redis keys removed
+        """
+        key_pattern = self._invalidation_pattern(namespace, pattern)
+        self._memory_cache.delete_matching(key_pattern)
+        if self._disk:
+            await asyncio.to_thread(self._disk.delete_matching, self._redis_key(key_pattern))
+
+        removed = 0
+        if self._use_redis(self._aredis):
             try:
-                # Delete keys that match our patterns
-                for pattern in ["bin:*", "json:*"]:
-                    keys = self._redis.keys(pattern)
-                    if keys:
-                        self._redis.delete(*keys)
+                batch = []
+                async for redis_key in self._aredis.scan_iter(
+                        match=self._redis_key(key_pattern), count=settings.CACHE_SCAN_COUNT):
+                    batch.append(redis_key)
+                    if len(batch) >= settings.CACHE_UNLINK_BATCH:
+                        removed += await self._aredis.unlink(*batch)
+                        batch = []
+                if batch:
+                    removed += await self._aredis.unlink(*batch)
+                publish = self._publish_in(self._aredis, [], [key_pattern])
+                if publish is not None:
+                    await publish
+                self._breaker.record_success()
             except Exception as e:
-                logger.error(f"Error clearing Redis cache: {str(e)}")
+                self._redis_failed(e, "invalidating Redis cache")
+
+        cache_metrics.record_eviction(
+            "redis", key_pattern, "invalidated", removed)
+        logger.info(f"Invalidated {removed} cache keys matching {key_pattern}")
+        return removed
+
+    def clear(self) -> None:
+        """Clear all of this deployment's cache entries from memory and Redis."""
+        self.invalidate()
+
+    async def aclear(self) -> None:
+        """Clear all of this deployment's cache entries without blocking the event loop."""
+        await self.ainvalidate()
+
+    async def acquire_lease(self, name: str, ttl: int) -> Optional[str]:
+        """
+        Try to take a cross-worker lease with SET NX.
+
+        Without Redis, when Redis fails or while its circuit breaker is
+        open, the lease is granted so the caller simply does the work itself.
+
+        Args:
+            name: Lease name
+            ttl: Seconds before the lease expires on its own
+
+        Returns:
+            Token to release the lease with, or None if another worker holds it
+        """
+        token = uuid.uuid4().hex
+        if not self._use_redis(self._aredis):
+            return token
+        try:
+            acquired = await self._aredis.set(
+                self._redis_key(f"{CacheNamespace.LEASE.value}:{name}"), token, nx=True, ex=ttl)
+            self._breaker.record_success()
+            return token if acquired else None
+        except Exception as e:
+            self._redis_failed(e, "acquiring lease in Redis")
+            return token
+
+    async def release_lease(self, name: str, token: str) -> None:
+        """
+        Release a lease taken with acquire_lease, if it is still ours.
+
+        Args:
+            name: Lease name
+            token: Token returned by acquire_lease
+        """
+        if not self._use_redis(self._aredis):
+            return
+        try:
+            await self._arelease_lease_script(
+                keys=[self._redis_key(f"{CacheNamespace.LEASE.value}:{name}")], args=[token])
+            self._breaker.record_success()
+        except Exception as e:
+            self._redis_failed(e, "releasing lease in Redis")
+
+    async def renew_lease(self, name: str, token: str, ttl: int) -> bool:
+        """
+        Reset a lease's TTL, if it is still ours.
+
+        Args:
+            name: Lease name
+            token: Token returned by acquire_lease
+            ttl: New time-to-live in seconds
+
+        Returns:
+            False if the lease expired or another worker took it; True
+            otherwise, including without Redis or on errors
+        """
+        if not self._use_redis(self._aredis):
+            return True
+        try:
+            renewed = await self._arenew_lease_script(
+                keys=[self._redis_key(f"{CacheNamespace.LEASE.value}:{name}")],
+                args=[token, int(ttl * 1000)])
+            self._breaker.record_success()
+            return bool(renewed)
+        except Exception as e:
+            self._redis_failed(e, "renewing lease in Redis")
+            return True
+
+    @contextlib.asynccontextmanager
+    async def hold_lease(self, name: str, token: str, ttl: int):
+        """
+        Keep a lease alive while the block runs, then release it.
+
+        A heartbeat renews the lease every third of its TTL, so work that
+        outlives the TTL (a slow LLM parse, a long extraction) is not taken
+        over by another worker, while a crashed holder's lease still
+        expires within one TTL.
+
+        Args:
+            name: Lease name
+            token: Token returned by acquire_lease
+            ttl: Time-to-live in seconds the lease is renewed to
+        """
+        heartbeat = asyncio.create_task(self._renew_lease_until_cancelled(name, token, ttl))
+        try:
+            yield
+        finally:
+            heartbeat.cancel()
+            await self.release_lease(name, token)
+
+    async def _renew_lease_until_cancelled(self, name: str, token: str, ttl: int) -> None:
+        """
+        Renew a lease every third of its TTL until cancelled or lost.
+
+        Args:
+            name: Lease name
+            token: Token returned by acquire_lease
+            ttl: Time-to-live in seconds the lease is renewed to
+        """
+        while True:
+            await asyncio.sleep(ttl / 3)
+            if not await self.renew_lease(name, token, ttl):
+                logger.warning(f"Lost lease {name}, another worker may repeat the work")
+                return
+
+    async def lease_held(self, name: str) -> bool:
+        """
+        Check whether any worker currently holds a lease.
+
+        Args:
+            name: Lease name
+
+        Returns:
+            True if the lease exists; False without Redis or on errors
+        """
+        if not self._use_redis(self._aredis):
+            return False
+        try:
+            held = await self._aredis.exists(
+                self._redis_key(f"{CacheNamespace.LEASE.value}:{name}"))
+            self._breaker.record_success()
+            return bool(held)
+        except Exception as e:
+            self._redis_failed(e, "checking lease in Redis")
+            return False
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Report statistics for the cache tiers.
+
+        Returns:
+            Dict with the in-process tier's totals, the disk tier's usage
+            and, per namespace and tier, hits, misses, writes, evictions,
+            stored bytes and latency
+        """
+        return self._stats(self._disk.stats() if self._disk else None)
+
+    async def astats(self) -> Dict[str, Any]:
+        """
+        Report statistics for the cache tiers without blocking the event loop.
+
+        The disk tier's totals come from a SQLite query over the whole
+        file, so that query runs in a thread.
+
+        Returns:
+            The same report as stats()
+        """
+        disk = await asyncio.to_thread(self._disk.stats) if self._disk else None
+        return self._stats(disk)
+
+    def _stats(self, disk: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Assemble the statistics report around the disk tier's usage.
+
+        Args:
+            disk: Usage reported by the disk tier, or None without one
+
+        Returns:
+            The report returned by stats()
+        """
+        cache_metrics.set_usage("memory", self._memory_cache.usage_by_prefix())
+        return {
+            "memory": self._memory_cache.stats(),
+            "disk": disk,
+            "redis_breaker": self._breaker.stats(),
+            "namespaces": cache_metrics.snapshot(),
+        }
+
+    async def redis_info(self) -> Optional[Dict[str, Any]]:
+        """
+        Report Redis server-wide memory and keyspace statistics.
+
+        These cover every client of the Redis instance, not just this
+        deployment, but show whether Redis itself is evicting keys.
+
+        Returns:
+            Dict of selected INFO fields, or None without Redis or on errors
+        """
+        if not self._use_redis(self._aredis):
+            return None
+        try:
+            info = await self._aredis.info()
+            self._breaker.record_success()
+        except Exception as e:
+            self._redis_failed(e, "reading Redis INFO")
+            return None
+        fields = ("used_memory", "maxmemory", "maxmemory_policy", "evicted_keys",
+                  "expired_keys", "keyspace_hits", "keyspace_misses")
+        return {field: info.get(field) for field in fields}
+
+    async def close(self) -> None:
+        """Stop background maintenance and release the Redis connection pools and disk cache."""
+        self._memory_cache.stop()
+        if self._disk:
+            self._disk.close()
+        if self._aredis:
+            await self._aredis.aclose()
+        if self._redis:
+            self._redis.close()
 
     def hash_content(self, content: Union[str, bytes, dict, list]) -> str:
         """
@@ -159,50 +937,160 @@ class CacheManager:
 
         return hashlib.sha256(content).hexdigest()
 
-    def cache_url_content(self, url: str, content: bytes, content_type: str, ttl: Optional[int] = None) -> str:
+    def _url_content_entries(self, url: str, content: bytes, content_type: str, validators: Optional[Dict[str, str]] = None) -> Tuple[str, Dict[str, Any]]:
         """
-        Cache content from a URL with metadata.
+        Build the cache entries that describe a downloaded URL.
 
         Args:
             url: The URL the content was downloaded from
             content: Binary content data
             content_type: MIME type of the content
-            ttl: Optional custom TTL
+            validators: ETag / Last-Modified values for conditional requests
 
         Returns:
-            Cache key that can be used to retrieve the content
+            Tuple of (content hash, mapping of cache key to value)
         """
         # Generate a hash of the content for the key
         content_hash = self.hash_content(content)
 
-        # Store URL to content hash mapping
-        url_key = f"url:{self.hash_content(url)}"
-        self.set(url_key, content_hash, ttl)
-
-        # Store content with metadata
         metadata = {
             "url": url,
             "content_type": content_type,
             "size": len(content),
             "cached_at": time.time(),
-            "hash": content_hash
+            "hash": content_hash,
+            **(validators or {})
         }
 
-        # Store metadata separately
-        meta_key = f"meta:{content_hash}"
-        self.set(meta_key, metadata, ttl)
+        return content_hash, {
+            # URL to content hash mapping
+            f"url:{self.hash_content(url)}": content_hash,
+            # Metadata stored separately from the binary content
+            f"meta:{content_hash}": metadata,
+            f"content:{content_hash}": content,
+        }
+
+    def cache_url_content(self, url: str, content: bytes, content_type: str, ttl: Optional[int] = None, validators: Optional[Dict[str, str]] = None) -> str:
+        """
+        Cache content from a URL with metadata.
+
+        Args:
+            url: The URL the content was downloaded from
+            content: Binary content data
+            content_type: MIME type of the content
+            ttl: Optional custom TTL
+            validators: ETag / Last-Modified values for conditional requests
 
-        # Store actual binary content
-        content_key = f"content:{content_hash}"
-        self.set(content_key, content, ttl)
+        Returns:
+            Cache key that can be used to retrieve the content
+        """
+        content_hash, entries = self._url_content_entries(
+            url, content, content_type, validators)
+        self.set_many(entries, ttl)
 
         logger.info(
             f"Cached {len(content)} bytes from {url} with hash {content_hash}")
         return content_hash
 
-    def get_url_content(self, url: str) -> Optional[dict[str, Any]]:
+    async def acache_url_content(self, url: str, content: bytes, content_type: str, ttl: Optional[int] = None, validators: Optional[Dict[str, str]] = None) -> str:
         """
-        Retrieve cached content for a URL.
+        Cache content from a URL with metadata without blocking the event loop.
+
+        Args:
+            url: The URL the content was downloaded from
+            content: Binary content data
+            content_type: MIME type of the content
+            ttl: Optional custom TTL
+            validators: ETag / Last-Modified values for conditional requests
+
+        Returns:
+            Cache key that can be used to retrieve the content
+        """
+        content_hash, entries = self._url_content_entries(
+            url, content, content_type, validators)
+        await self.aset_many(entries, ttl)
+
+        logger.info(
+            f"Cached {len(content)} bytes from {url} with hash {content_hash}")
+        return content_hash
+
+    def _disk_refresh(self, entries: Dict[str, Any], touched: List[str], ttl: int) -> bool:
+        """
+        Rewrite entries and extend others in the disk tier.
+
+        Args:
+            entries: Mapping of cache key to value to rewrite
+            touched: Keys whose TTL is extended as they are
+            ttl: Time-to-live in seconds
+
+        Returns:
+            True if every touched key was still cached
+        """
+        if settings.REDIS_URL:
+            ttl = min(ttl, settings.DISK_CACHE_FALLBACK_TTL)
+        if self._disk.touch_many([self._redis_key(key) for key in touched], ttl) < len(touched):
+            return False
+        self._disk_set(entries, ttl)
+        return True
+
+    async def arefresh_url_content(self, url: str, metadata: Dict[str, Any], ttl: Optional[int] = None, validators: Optional[Dict[str, str]] = None) -> bool:
+        """
+        Mark cached URL content as fresh after the origin answered 304.
+
+        Only the metadata is rewritten, with a new cached_at and validators;
+        the URL mapping and the content keep their payloads and just get a
+        new TTL. No invalidation is broadcast, since the content did not
+        change: another worker's memory copy of the metadata expires within
+        MEMORY_CACHE_PROMOTION_TTL, and at worst triggers one more 304.
+
+        Args:
+            url: The URL the content was downloaded from
+            metadata: Cached metadata of the content
+            ttl: Optional custom TTL
+            validators: ETag / Last-Modified values from the 304
+
+        Returns:
+            True if the cached content was still complete and was refreshed
+        """
+        ttl = ttl or self._default_ttl
+        content_hash = metadata["hash"]
+        meta_key = f"meta:{content_hash}"
+        touched = [f"url:{self.hash_content(url)}", f"content:{content_hash}"]
+        entries = {meta_key: {**metadata, "cached_at": time.time(), **(validators or {})}}
+
+        if self._use_redis(self._aredis):
+            try:
+                pipeline = self._aredis.pipeline(transaction=False)
+                for key in touched:
+                    pipeline.expire(self._redis_key(key), ttl)
+                payload = self._encode(entries[meta_key])
+                pipeline.set(self._redis_key(meta_key), payload, ex=ttl)
+                *extended, _ = await pipeline.execute()
+                cache_metrics.record_write("redis", meta_key, len(payload))
+                self._breaker.record_success()
+                refreshed = all(extended)
+                if refreshed:
+                    self._memory_cache.set(meta_key, entries[meta_key], ttl)
+                return refreshed
+            except Exception as e:
+                self._redis_failed(e, "refreshing URL content in Redis")
+
+        if self._disk:
+            refreshed = await asyncio.to_thread(self._disk_refresh, entries, touched, ttl)
+        else:
+            # Process memory is the only tier, so its entries are extended too
+            values = {key: self._memory_cache.get(key) for key in touched}
+            refreshed = all(value is not None for value in values.values())
+            if refreshed:
+                entries.update(values)
+        if refreshed:
+            for key, value in entries.items():
+                self._memory_cache.set(key, value, ttl)
+        return refreshed
+
+    def _url_content_from_memory(self, url: str) -> Optional[dict[str, Any]]:
+        """
+        Look up cached URL content in the memory cache only.
 
         Args:
             url: URL to retrieve content for
@@ -210,33 +1098,140 @@ class CacheManager:
         Returns:
             Dict with content and metadata, or None if not cached
         """
-        # Get content hash from URL
         url_key = f"url:{self.hash_content(url)}"
-        content_hash = self.get(url_key)
+        content_hash = self._memory_cache.get(url_key)
+        metadata = content = None
+        if content_hash:
+            metadata = self._memory_cache.get(f"meta:{content_hash}")
+            content = self._memory_cache.get(f"content:{content_hash}")
 
-        if not content_hash:
+        if not metadata or not content:
+            cache_metrics.record_lookup("memory", hits=[], misses=[url_key])
             return None
+        cache_metrics.record_lookup("memory", hits=[url_key], misses=[])
+        return {"content": content, "metadata": metadata}
 
-        # Get metadata
-        meta_key = f"meta:{content_hash}"
-        metadata = self.get(meta_key)
+    def _url_content_from_reply(self, url: str, reply: Optional[List[Optional[bytes]]], tier: str = "redis") -> Optional[dict[str, Any]]:
+        """
+        Decode the reply of the URL content script and promote it into memory.
+
+        Args:
+            url: URL the script was run for
+            reply: [mapping, metadata, content] payloads, or None on a miss
+            tier: Tier the payloads came from, for the cache metrics
 
-        if not metadata:
+        Returns:
+            Dict with content and metadata, or None if any part is missing
+        """
+        url_key = f"url:{self.hash_content(url)}"
+        if not reply:
+            cache_metrics.record_lookup(tier, hits=[], misses=[url_key])
+            return None
+        content_hash = self._decode(reply[0])
+        keys = [url_key, f"meta:{content_hash}", f"content:{content_hash}"]
+        found = self._promote(keys, reply, {})
+        if len(found) < len(keys):
+            cache_metrics.record_lookup(tier, hits=[], misses=[url_key])
             return None
+        cache_metrics.record_lookup(tier, hits=[url_key], misses=[])
+        return {"content": found[keys[2]], "metadata": found[keys[1]]}
 
-        # Get content
-        content_key = f"content:{content_hash}"
-        content = self.get(content_key)
+    def _url_content_from_disk(self, url: str) -> Optional[dict[str, Any]]:
+        """
+        Resolve the url -> hash -> metadata/content chain in the disk tier.
 
-        if not content:
-            return None
+        Args:
+            url: URL to retrieve content for
+
+        Returns:
+            Dict with content and metadata, or None if not cached
+        """
+        url_key = f"url:{self.hash_content(url)}"
+        mapping = self._disk_read([url_key]).get(url_key)
+        reply = None
+        if mapping is not None:
+            content_hash = self._decode(mapping)
+            payloads = self._disk_read(
+                [f"meta:{content_hash}", f"content:{content_hash}"])
+            reply = [mapping, payloads.get(f"meta:{content_hash}"),
+                     payloads.get(f"content:{content_hash}")]
+        return self._url_content_from_reply(url, reply, "disk")
+
+    def _url_content_script_args(self, url: str) -> Dict[str, List[str]]:
+        """
+        Build the keys and arguments for the URL content script.
+
+        Args:
+            url: URL to retrieve content for
 
-        # Return combined result
+        Returns:
+            Keyword arguments for the registered script
+        """
         return {
-            "content": content,
-            "metadata": metadata
+            "keys": [self._redis_key(f"url:{self.hash_content(url)}")],
+            "args": [self._redis_key("meta:"), self._redis_key("content:")],
         }
 
+    def get_url_content(self, url: str) -> Optional[dict[str, Any]]:
+        """
+        Retrieve cached content for a URL.
+
+        Process memory is checked first. On a miss the url -> hash ->
+        metadata/content chain is resolved by a Lua script inside Redis, so
+        a hit costs one round trip, and the result is promoted into memory.
+        Without Redis, or while it is down, the chain is read from disk.
+        The script is not Redis Cluster safe, see URL_CONTENT_SCRIPT.
+
+        Args:
+            url: URL to retrieve content for
+
+        Returns:
+            Dict with content and metadata, or None if not cached
+        """
+        cached = self._url_content_from_memory(url)
+        if cached:
+            return cached
+        if not self._use_redis(self._redis):
+            return self._url_content_from_disk(url) if self._disk else None
+
+        try:
+            started = time.perf_counter()
+            reply = self._url_content_script(**self._url_content_script_args(url))
+            cache_metrics.observe(
+                "get", "redis", ["url:"], time.perf_counter() - started)
+            self._breaker.record_success()
+            return self._url_content_from_reply(url, reply)
+        except Exception as e:
+            self._redis_failed(e, "getting URL content from Redis")
+            return self._url_content_from_disk(url) if self._disk else None
+
+    async def aget_url_content(self, url: str) -> Optional[dict[str, Any]]:
+        """
+        Retrieve cached content for a URL in one round trip without blocking the event loop.
+
+        Args:
+            url: URL to retrieve content for
+
+        Returns:
+            Dict with content and metadata, or None if not cached
+        """
+        cached = self._url_content_from_memory(url)
+        if cached:
+            return cached
+        if not self._use_redis(self._aredis):
+            return await asyncio.to_thread(self._url_content_from_disk, url) if self._disk else None
+
+        try:
+            started = time.perf_counter()
+            reply = await self._aurl_content_script(**self._url_content_script_args(url))
+            cache_metrics.observe(
+                "get", "redis", ["url:"], time.perf_counter() - started)
+            self._breaker.record_success()
+            return self._url_content_from_reply(url, reply)
+        except Exception as e:
+            self._redis_failed(e, "getting URL content from Redis")
+            return await asyncio.to_thread(self._url_content_from_disk, url) if self._disk else None
+
     def get_url_content_hash(self, url: str) -> Optional[str]:
         """
         Get the content hash for a URL without retrieving the content.
@@ -250,6 +1245,19 @@ class CacheManager:
         url_key = f"url:{self.hash_content(url)}"
         return self.get(url_key)
 
+    async def aget_url_content_hash(self, url: str) -> Optional[str]:
+        """
+        Get the content hash for a URL without blocking the event loop.
+
+        Args:
+            url: URL to check
+
+        Returns:
+            Content hash if URL is cached, None otherwise
+        """
+        url_key = f"url:{self.hash_content(url)}"
+        return await self.aget(url_key)
+
 
 # Create a singleton instance for global use
 cache_manager = CacheManager()
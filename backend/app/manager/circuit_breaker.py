@@ -0,0 +1,165 @@
+import asyncio
+import threading
+import time
+from typing import Any, Dict, Optional
+from loguru import logger
+import redis
+from app.core.config import settings
+
+# Errors that say the backend is unreachable or too slow, as opposed to a
+# bad command or an undecodable value
+OUTAGE_ERRORS = (
+    redis.exceptions.ConnectionError,
+    redis.exceptions.TimeoutError,
+    redis.exceptions.BusyLoadingError,
+    ConnectionError,
+    TimeoutError,
+    asyncio.TimeoutError,
+    OSError,
+)
+
+
+class CircuitBreaker:
+    """
+    Stops calling a backend that keeps failing, and probes it to recover.
+
+    - Closed: calls go through; consecutive outage errors are counted.
+    - Open: after failure_threshold consecutive failures, calls are skipped
+      for a cooldown and callers fall back to their local tier at once,
+      instead of each waiting out a socket timeout.
+    - Half-open: after the cooldown a single call is let through as a probe.
+      Success closes the breaker; failure reopens it with a doubled
+      cooldown, up to max_cooldown.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = settings.REDIS_BREAKER_FAILURE_THRESHOLD,
+        cooldown: float = settings.REDIS_BREAKER_COOLDOWN,
+        max_cooldown: float = settings.REDIS_BREAKER_MAX_COOLDOWN,
+    ):
+        """
+        Initialize a closed breaker.
+
+        Args:
+            name: Backend name used in log messages
+            failure_threshold: Consecutive failures that open the breaker
+            cooldown: Seconds calls are skipped after the breaker opens
+            max_cooldown: Upper bound in seconds for the doubled cooldown
+        """
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.max_cooldown = max_cooldown
+
+        self._state = self.CLOSED
+        self._failures = 0
+        self._current_cooldown = cooldown
+        self._retry_at = 0.0
+        self._probe_started: Optional[float] = None
+        self._lock = threading.Lock()
+
+        self._opened = 0
+        self._skipped = 0
+
+    @property
+    def state(self) -> str:
+        """Current state: closed, open or half_open."""
+        return self._state
+
+    def allow(self) -> bool:
+        """
+        Decide whether a call may go to the backend.
+
+        Returns:
+            True to make the call, which must then be reported with
+            record_success or record_failure; False to skip it
+        """
+        if self._state == self.CLOSED:
+            return True
+
+        now = time.monotonic()
+        with self._lock:
+            if self._state == self.OPEN and now >= self._retry_at:
+                self._state = self.HALF_OPEN
+                self._probe_started = None
+
+            if self._state == self.HALF_OPEN and (
+                self._probe_started is None
+                # A probe that never reported back must not wedge the breaker
+                or now - self._probe_started > self._current_cooldown
+            ):
+                self._probe_started = now
+                logger.info(f"Probing {self.name} after {self._current_cooldown:g}s cooldown")
+                return True
+
+            if self._state == self.CLOSED:
+                return True
+            self._skipped += 1
+            return False
+
+    def record_success(self) -> None:
+        """Report a successful call, closing the breaker if it was probing."""
+        if self._state == self.CLOSED and self._failures == 0:
+            return
+        with self._lock:
+            if self._state != self.CLOSED:
+                logger.info(f"{self.name} recovered, closing circuit breaker")
+            self._state = self.CLOSED
+            self._failures = 0
+            self._current_cooldown = self.cooldown
+            self._probe_started = None
+
+    def record_failure(self, error: BaseException) -> None:
+        """
+        Report a failed call. Only outage errors count towards opening.
+
+        Args:
+            error: Exception the call raised
+        """
+        if not isinstance(error, OUTAGE_ERRORS):
+            return
+        with self._lock:
+            if self._state == self.HALF_OPEN:
+                self._current_cooldown = min(self._current_cooldown * 2, self.max_cooldown)
+                self._open()
+                return
+
+            self._failures += 1
+            if self._state == self.CLOSED and self._failures >= self.failure_threshold:
+                self._open()
+
+    def _open(self) -> None:
+        """Open the breaker for the current cooldown; the lock must be held."""
+        self._state = self.OPEN
+        self._retry_at = time.monotonic() + self._current_cooldown
+        self._probe_started = None
+        self._opened += 1
+        logger.warning(
+            f"{self.name} unavailable after {self._failures} failures, "
+            f"skipping it for {self._current_cooldown:g}s")
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Report the breaker's state and counters.
+
+        Returns:
+            Dict with state, consecutive failures, times opened, calls
+            skipped while open, and the current cooldown
+        """
+        return {
+            "state": self._state,
+            "failures": self._failures,
+            "opened": self._opened,
+            "skipped": self._skipped,
+            "cooldown": self._current_cooldown,
+        }
+
+
+# Create a singleton instance for global use
+redis_breaker = CircuitBreaker("Redis")
@@ -0,0 +1,228 @@
+import json
+import zlib
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional
+from loguru import logger
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - depends on the environment
+    zstandard = None
+
+
+class Codec(ABC):
+    """
+    Serializes cached values of the types it accepts.
+
+    Every encoded payload starts with the codec's one-byte tag, so entries
+    written by any registered codec can be decoded after the default changes.
+    """
+
+    tag: bytes = b""
+
+    def accepts(self, value: Any) -> bool:
+        """Return True if this codec can serialize the value."""
+        return True
+
+    @abstractmethod
+    def encode(self, value: Any) -> bytes:
+        """Serialize a value, without the tag."""
+
+    @abstractmethod
+    def decode(self, body: bytes) -> Any:
+        """Deserialize a payload body, without the tag."""
+
+
+class BytesCodec(Codec):
+    """Stores raw bytes (downloaded documents) as they are."""
+
+    tag = b"b"
+
+    def accepts(self, value: Any) -> bool:
+        return isinstance(value, (bytes, bytearray))
+
+    def encode(self, value: Any) -> bytes:
+        return bytes(value)
+
+    def decode(self, body: bytes) -> Any:
+        return bytes(body)
+
+
+class JsonCodec(Codec):
+    """Standard library JSON, used when orjson is not installed."""
+
+    tag = b"j"
+
+    def encode(self, value: Any) -> bytes:
+        return json.dumps(value).encode("utf-8")
+
+    def decode(self, body: bytes) -> Any:
+        return json.loads(body)
+
+
+class OrjsonCodec(Codec):
+    """orjson, several times faster than json with more compact output."""
+
+    tag = b"o"
+
+    def encode(self, value: Any) -> bytes:
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+
+    def decode(self, body: bytes) -> Any:
+        return orjson.loads(body)
+
+
+class Compressor(ABC):
+    """
+    Compresses encoded payloads above the size threshold.
+
+    A compressed payload is the compressor's tag followed by the compressed
+    bytes of the inner, codec-tagged payload.
+    """
+
+    tag: bytes = b""
+
+    @abstractmethod
+    def compress(self, data: bytes) -> bytes:
+        """Compress an encoded payload, without the tag."""
+
+    @abstractmethod
+    def decompress(self, data: bytes) -> bytes:
+        """Decompress a payload body, without the tag."""
+
+
+class ZstdCompressor(Compressor):
+    """Zstandard, the preferred compressor."""
+
+    tag = b"z"
+
+    def __init__(self, level: int):
+        self._compressor = zstandard.ZstdCompressor(level=level)
+        self._decompressor = zstandard.ZstdDecompressor()
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def decompress(self, data: bytes) -> bytes:
+        return self._decompressor.decompress(data)
+
+
+class ZlibCompressor(Compressor):
+    """zlib, used when zstandard is not installed."""
+
+    tag = b"g"
+
+    def __init__(self, level: int):
+        self.level = level
+
+    def compress(self, data: bytes) -> bytes:
+        return zlib.compress(data, self.level)
+
+    def decompress(self, data: bytes) -> bytes:
+        return zlib.decompress(data)
+
+
+class ValueCodec:
+    """
+    Encodes cached values with the first codec that accepts them, then
+    compresses payloads above a size threshold.
+
+    Decoding dispatches on the leading tag, so values written with another
+    codec, a different threshold or before compression was enabled all
+    still decode.
+    """
+
+    def __init__(
+        self,
+        codecs: List[Codec],
+        compressor: Optional[Compressor],
+        compress_threshold: int,
+        fallbacks: Optional[List[Any]] = None,
+    ):
+        """
+        Initialize the codec pipeline.
+
+        Args:
+            codecs: Codecs in order of preference for encoding
+            compressor: Compressor for large payloads, or None to disable
+            compress_threshold: Minimum encoded size in bytes to compress
+            fallbacks: Extra codecs and compressors accepted when decoding
+        """
+        self.codecs = codecs
+        self.compressor = compressor
+        self.compress_threshold = compress_threshold
+        self._decoders: Dict[bytes, Any] = {}
+        for handler in [*codecs, *(fallbacks or []), *([compressor] if compressor else [])]:
+            self._decoders[handler.tag] = handler
+
+    def encode(self, value: Any) -> bytes:
+        """
+        Serialize and, above the threshold, compress a value.
+
+        Args:
+            value: Value to encode
+
+        Returns:
+            Tagged payload
+        """
+        codec = next(codec for codec in self.codecs if codec.accepts(value))
+        payload = codec.tag + codec.encode(value)
+
+        if self.compressor and len(payload) >= self.compress_threshold:
+            compressed = self.compressor.tag + self.compressor.compress(payload)
+            # Already compressed data such as PDFs is not worth it
+            if len(compressed) < len(payload) * 0.9:
+                return compressed
+        return payload
+
+    def decode(self, payload: bytes) -> Any:
+        """
+        Decode a tagged payload.
+
+        Args:
+            payload: Payload written by encode
+
+        Returns:
+            Decoded value, or None if the tag is unknown
+        """
+        handler = self._decoders.get(payload[:1])
+        if handler is None:
+            logger.warning(
+                f"Ignoring cached value with unknown tag {payload[:1]!r}")
+            return None
+        if isinstance(handler, Compressor):
+            return self.decode(handler.decompress(payload[1:]))
+        return handler.decode(payload[1:])
+
+
+def build_value_codec(compress_threshold: int, compression_level: int) -> ValueCodec:
+    """
+    Build the cache's codec pipeline from the libraries that are installed.
+
+    orjson and zstandard are preferred; the standard library json and zlib
+    are used when they are missing, and either can always be decoded.
+
+    Args:
+        compress_threshold: Minimum encoded size in bytes to compress
+        compression_level: Compression level for the chosen compressor
+
+    Returns:
+        Configured ValueCodec
+    """
+    fallbacks: List[Any] = [JsonCodec(), ZlibCompressor(compression_level)]
+    serializer = OrjsonCodec() if orjson else JsonCodec()
+    compressor = ZstdCompressor(compression_level) if zstandard \
+        else ZlibCompressor(compression_level)
+    if zstandard:
+        fallbacks.append(ZstdCompressor(compression_level))
+    return ValueCodec(
+        codecs=[BytesCodec(), serializer],
+        compressor=compressor if compress_threshold > 0 else None,
+        compress_threshold=compress_threshold,
+        fallbacks=fallbacks,
+    )
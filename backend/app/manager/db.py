@@ -3,7 +3,7 @@ Database manager that provides a centralized interface for all database operatio
 Handles common concerns like caching, connection management, and error handling.
 """
 
-from typing import Type, TypeVar, List, Dict, Any, Optional, Union
+from typing import Type, TypeVar, List, Dict, Any, Optional, Tuple, Union
 from beanie import Document
 from uuid import UUID
 from datetime import datetime
@@ -11,6 +11,9 @@ from pydantic import BaseModel
 from loguru import logger
 import hashlib
 import json
+from app.db.models import JobDB, MatchAnalysisDB, ResumeDB
+from .cache_manager import CacheNamespace
+from .memoize import cached, ModelCodec
 
 
 T = TypeVar('T', bound=Document)
@@ -24,7 +27,6 @@ class DBManager:
     
     def __init__(self):
         """Initialize DB Manager"""
-        self._cache = {}  # Simple in-memory cache
         logger.info("Initialized DB Manager")
     
     async def save_document(self, document: Document) -> Document:
@@ -46,7 +48,7 @@ class DBManager:
             result = await document.save()
             
             # Invalidate cache for this document type/id
-            self._invalidate_cache(document)
+            await self._invalidate_cache(document)
             
             return result
         
@@ -54,9 +56,13 @@ class DBManager:
             logger.error(f"Error saving document: {str(e)}")
             raise
     
+    @cached(CacheNamespace.DOCUMENT,
+            key=lambda self, model_class, id_value: f"{model_class.__name__}:{id_value}",
+            codec=ModelCodec({"ResumeDB": ResumeDB, "JobDB": JobDB,
+                              "MatchAnalysisDB": MatchAnalysisDB}))
     async def find_by_id(self, model_class: Type[T], id_value: Union[str, UUID]) -> Optional[T]:
         """
-        Find a document by its ID.
+        Find a document by its ID, through the shared cache.
         
         Args:
             model_class: Document class to query
@@ -66,20 +72,7 @@ class DBManager:
             Document if found, None otherwise
         """
         try:
-            # Check cache first
-            cache_key = f"{model_class.__name__}:{id_value}"
-            if cache_key in self._cache:
-                logger.info(f"Cache hit for {cache_key}")
-                return self._cache[cache_key]
-            
-            # Query the database
-            document = await model_class.get(id_value)
-            
-            # Cache the result
-            if document:
-                self._cache[cache_key] = document
-            
-            return document
+            return await model_class.get(id_value)
         
         except Exception as e:
             logger.error(f"Error finding document by ID: {str(e)}")
@@ -180,7 +173,7 @@ class DBManager:
             await document.delete()
             
             # Invalidate cache
-            self._invalidate_cache(document)
+            await self._invalidate_cache(document)
             
             return True
         
@@ -188,20 +181,14 @@ class DBManager:
             logger.error(f"Error deleting document: {str(e)}")
             raise
     
-    def _invalidate_cache(self, document: Document) -> None:
+    async def _invalidate_cache(self, document: Document) -> None:
         """
-        Invalidate cache entries related to the given document.
+        Invalidate cache entries related to the given document in every worker.
         
         Args:
             document: Document whose cache entries should be invalidated
         """
-        # Remove specific document cache
-        doc_id = str(document.id)
-        doc_type = document.__class__.__name__
-        cache_key = f"{doc_type}:{doc_id}"
-        
-        if cache_key in self._cache:
-            del self._cache[cache_key]
+        await self.find_by_id.invalidate(type(document), document.id)
     
     @staticmethod
     def _compute_hash(content: Union[str, Dict, List, bytes]) -> str:
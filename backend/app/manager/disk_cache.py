@@ -0,0 +1,248 @@
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Iterable, List, Optional
+from loguru import logger
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    value BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    expires_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_accessed_at ON entries (accessed_at);
+CREATE INDEX IF NOT EXISTS entries_expires_at ON entries (expires_at);
+"""
+
+
+class DiskCache:
+    """
+    Persistent cache tier in a SQLite file, shared by every worker on a host.
+
+    Values are stored as the tagged, compressed payloads the Redis tier
+    uses. The database runs in WAL mode, so readers in every worker proceed
+    while one writes, and busy_timeout makes concurrent writers wait for the
+    lock instead of failing. Entries carry a TTL and a last-access time;
+    when the file's payloads outgrow max_bytes the least recently used
+    entries (and anything expired) are deleted down to 90% of the budget.
+
+    All methods are blocking; async callers run them in a thread.
+    """
+
+    def __init__(self, path: str, max_bytes: int, max_item_bytes: int):
+        """
+        Initialize the tier. The database is opened on first use.
+
+        Args:
+            path: SQLite file, created with its directory if missing
+            max_bytes: Budget for the sum of stored payload sizes
+            max_item_bytes: Payloads larger than this are not stored
+        """
+        self.path = path
+        self.max_bytes = max_bytes
+        self.max_item_bytes = max_item_bytes
+
+        self._connection: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        # Bytes written since the last exact size check, by this worker
+        self._unchecked_bytes = max_bytes
+
+        self._evictions = 0
+        self._errors = 0
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database on first use; the lock must be held."""
+        if self._connection is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                # Only the app's user may read cached documents
+                os.makedirs(directory, mode=0o700, exist_ok=True)
+            connection = sqlite3.connect(
+                self.path, timeout=5, isolation_level=None, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute("PRAGMA busy_timeout=5000")
+            connection.executescript(SCHEMA)
+            self._connection = connection
+            logger.info(f"Opened disk cache at {self.path}")
+        return self._connection
+
+    def get_many(self, keys: List[str]) -> Dict[str, bytes]:
+        """
+        Read unexpired payloads and mark them as recently used.
+
+        Args:
+            keys: Cache keys
+
+        Returns:
+            Mapping of each key found to its payload
+        """
+        if not keys:
+            return {}
+        now = time.time()
+        placeholders = ",".join("?" * len(keys))
+        try:
+            with self._lock:
+                connection = self._connect()
+                rows = connection.execute(
+                    f"SELECT key, value FROM entries "
+                    f"WHERE key IN ({placeholders}) AND expires_at > ?",
+                    [*keys, now]).fetchall()
+                if rows:
+                    connection.execute(
+                        f"UPDATE entries SET accessed_at = ? "
+                        f"WHERE key IN ({','.join('?' * len(rows))})",
+                        [now, *(key for key, _ in rows)])
+            return {key: bytes(value) for key, value in rows}
+        except sqlite3.Error as e:
+            self._errors += 1
+            logger.error(f"Error reading disk cache: {str(e)}")
+            return {}
+
+    def set_many(self, entries: Dict[str, bytes], ttl: float) -> None:
+        """
+        Store payloads, evicting least recently used entries past the budget.
+
+        Args:
+            entries: Mapping of cache key to payload
+            ttl: Time-to-live in seconds
+        """
+        now = time.time()
+        rows = [(key, payload, len(payload), now + ttl, now)
+                for key, payload in entries.items() if len(payload) <= self.max_item_bytes]
+        if not rows:
+            return
+        try:
+            with self._lock:
+                connection = self._connect()
+                connection.executemany(
+                    "INSERT OR REPLACE INTO entries "
+                    "(key, value, size, expires_at, accessed_at) VALUES (?, ?, ?, ?, ?)", rows)
+                self._unchecked_bytes += sum(row[2] for row in rows)
+                # Other workers write too, so the exact total is re-read
+                # whenever this worker alone could have filled a tenth of it
+                if self._unchecked_bytes >= self.max_bytes // 10:
+                    self._evict(connection, now)
+        except sqlite3.Error as e:
+            self._errors += 1
+            logger.error(f"Error writing disk cache: {str(e)}")
+
+    def _evict(self, connection: sqlite3.Connection, now: float) -> None:
+        """Drop expired entries, then LRU entries down to 90% of the budget."""
+        self._unchecked_bytes = 0
+        self._evictions += connection.execute(
+            "DELETE FROM entries WHERE expires_at <= ?", (now,)).rowcount
+
+        total = connection.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        excess = total - int(self.max_bytes * 0.9)
+        cutoff, released = None, 0
+        for accessed_at, size in connection.execute(
+                "SELECT accessed_at, size FROM entries ORDER BY accessed_at"):
+            released += size
+            cutoff = accessed_at
+            if released >= excess:
+                break
+        removed = connection.execute(
+            "DELETE FROM entries WHERE accessed_at <= ?", (cutoff,)).rowcount
+        self._evictions += removed
+        logger.info(f"Evicted {removed} least recently used entries from disk cache")
+
+    def touch_many(self, keys: List[str], ttl: float) -> int:
+        """
+        Extend the TTL of unexpired entries without rewriting their payloads.
+
+        Args:
+            keys: Cache keys
+            ttl: New time-to-live in seconds
+
+        Returns:
+            Number of entries found and extended
+        """
+        if not keys:
+            return 0
+        now = time.time()
+        try:
+            with self._lock:
+                return self._connect().execute(
+                    f"UPDATE entries SET expires_at = ?, accessed_at = ? "
+                    f"WHERE key IN ({','.join('?' * len(keys))}) AND expires_at > ?",
+                    [now + ttl, now, *keys, now]).rowcount
+        except sqlite3.Error as e:
+            self._errors += 1
+            logger.error(f"Error extending disk cache entries: {str(e)}")
+            return 0
+
+    def delete_many(self, keys: Iterable[str]) -> None:
+        """
+        Delete entries if present.
+
+        Args:
+            keys: Cache keys
+        """
+        keys = list(keys)
+        if not keys:
+            return
+        try:
+            with self._lock:
+                self._connect().execute(
+                    f"DELETE FROM entries WHERE key IN ({','.join('?' * len(keys))})", keys)
+        except sqlite3.Error as e:
+            self._errors += 1
+            logger.error(f"Error deleting from disk cache: {str(e)}")
+
+    def delete_matching(self, pattern: str) -> int:
+        """
+        Delete every entry whose key matches a glob pattern.
+
+        Args:
+            pattern: Glob pattern, as used by Redis SCAN MATCH
+
+        Returns:
+            Number of entries removed
+        """
+        try:
+            with self._lock:
+                return self._connect().execute(
+                    "DELETE FROM entries WHERE key GLOB ?", (pattern,)).rowcount
+        except sqlite3.Error as e:
+            self._errors += 1
+            logger.error(f"Error invalidating disk cache: {str(e)}")
+            return 0
+
+    def stats(self) -> Dict[str, object]:
+        """
+        Report usage of the tier.
+
+        Returns:
+            Dict with the file path, entries, payload bytes and budget,
+            evictions and errors
+        """
+        try:
+            with self._lock:
+                entries, size = self._connect().execute(
+                    "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries").fetchone()
+        except sqlite3.Error:
+            entries, size = None, None
+        return {
+            "path": self.path,
+            "entries": entries,
+            "bytes": size,
+            "max_bytes": self.max_bytes,
+            "evictions": self._evictions,
+            "errors": self._errors,
+        }
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
@@ -0,0 +1,217 @@
+import asyncio
+import json
+import os
+import uuid
+from typing import Callable, Dict, List, Optional
+from loguru import logger
+import redis.asyncio as aioredis
+from app.core.config import settings
+from .circuit_breaker import redis_breaker
+
+# Evicts keys and glob patterns from one in-process tier
+EvictionHandler = Callable[[List[str], List[str]], None]
+
+# Seconds the listener waits for a message before polling again. Reads
+# with REDIS_SOCKET_TIMEOUT would fail on a quiet channel, so the listener
+# polls with its own timeout, and health checks ping the connection.
+LISTEN_POLL_TIMEOUT = 30
+
+
+class InvalidationBus:
+    """
+    Broadcasts cache invalidations to every worker over Redis pub/sub.
+
+    Each worker keeps its own in-process tiers, such as CacheManager's
+    memory cache. Writers publish the keys they changed on a
+    deployment-scoped channel, and every other worker's listener evicts them
+    from its local tiers, so no worker keeps serving a stale copy.
+
+    Messages carry a scope naming the tier (e.g. "cache"), the exact keys,
+    and glob patterns for bulk invalidations. If the listener loses its
+    subscription it flushes every local tier after reconnecting, since
+    messages published in between were missed.
+    """
+
+    def __init__(self, channel: str = f"{settings.CACHE_KEY_PREFIX}:invalidate"):
+        """
+        Initialize the bus. Nothing connects until start() or publish().
+
+        Args:
+            channel: Redis channel carrying invalidation messages
+        """
+        self.channel = channel
+        self._instance = uuid.uuid4().hex
+        self._handlers: Dict[str, List[EvictionHandler]] = {}
+        self._redis: Optional[aioredis.Redis] = None
+        self._listener: Optional[asyncio.Task] = None
+
+        self._published = 0
+        self._received = 0
+
+    @property
+    def origin(self) -> str:
+        """Identity of this worker; the pid changes across a fork."""
+        return f"{self._instance}:{os.getpid()}"
+
+    def subscribe(self, scope: str, handler: EvictionHandler) -> None:
+        """
+        Register a local tier to evict from when a scope is invalidated.
+
+        Args:
+            scope: Tier name used by publishers, e.g. "cache"
+            handler: Called with (keys, patterns) to evict
+        """
+        self._handlers.setdefault(scope, []).append(handler)
+
+    def encode(self, scope: str, keys: List[str], patterns: Optional[List[str]] = None) -> str:
+        """
+        Build an invalidation message, e.g. to publish inside a pipeline.
+
+        Args:
+            scope: Tier the keys belong to
+            keys: Exact keys to evict
+            patterns: Glob patterns to evict
+
+        Returns:
+            JSON message for the channel
+        """
+        self._published += 1
+        return json.dumps({
+            "origin": self.origin,
+            "scope": scope,
+            "keys": keys,
+            "patterns": patterns or [],
+        })
+
+    def _get_redis(self) -> Optional[aioredis.Redis]:
+        """
+        Return the bus's Redis client, creating it on first use.
+
+        It gets the same timeouts as CacheManager's clients, so a publish
+        to an unresponsive Redis fails fast and trips the breaker. Its pool
+        holds the listener's connection plus the publishers'.
+        """
+        if self._redis is None and settings.REDIS_URL and settings.CACHE_INVALIDATION_ENABLED:
+            self._redis = aioredis.Redis(connection_pool=aioredis.ConnectionPool.from_url(
+                settings.REDIS_URL,
+                max_connections=settings.REDIS_MAX_CONNECTIONS,
+                socket_timeout=settings.REDIS_SOCKET_TIMEOUT,
+                socket_connect_timeout=settings.REDIS_CONNECT_TIMEOUT,
+                health_check_interval=LISTEN_POLL_TIMEOUT,
+            ))
+        return self._redis
+
+    def evict_local(self, scope: str, keys: List[str], patterns: Optional[List[str]] = None) -> None:
+        """
+        Evict keys from this worker's tiers for a scope.
+
+        Args:
+            scope: Tier the keys belong to
+            keys: Exact keys to evict
+            patterns: Glob patterns to evict
+        """
+        for handler in self._handlers.get(scope, []):
+            try:
+                handler(keys, patterns or [])
+            except Exception as e:
+                logger.error(f"Error evicting {scope} keys: {str(e)}")
+
+    async def publish(self, scope: str, keys: List[str], patterns: Optional[List[str]] = None) -> None:
+        """
+        Evict keys locally and tell every other worker to evict them too.
+
+        Args:
+            scope: Tier the keys belong to
+            keys: Exact keys to evict
+            patterns: Glob patterns to evict
+        """
+        self.evict_local(scope, keys, patterns)
+        client = self._get_redis()
+        if client is None or not redis_breaker.allow():
+            return
+        try:
+            await client.publish(self.channel, self.encode(scope, keys, patterns))
+            redis_breaker.record_success()
+        except Exception as e:
+            logger.error(f"Error publishing cache invalidation: {str(e)}")
+            redis_breaker.record_failure(e)
+
+    def _handle(self, data: bytes) -> None:
+        """Apply an invalidation message received from another worker."""
+        message = json.loads(data)
+        if message.get("origin") == self.origin:
+            return
+        self._received += 1
+        self.evict_local(message["scope"], message.get("keys", []), message.get("patterns", []))
+
+    def _flush_local(self) -> None:
+        """Evict everything from every local tier."""
+        for scope in self._handlers:
+            self.evict_local(scope, [], ["*"])
+
+    async def _listen(self) -> None:
+        """Receive invalidations until stopped, resubscribing after failures."""
+        backoff = 1
+        missed_messages = False
+        while True:
+            pubsub = None
+            try:
+                pubsub = self._get_redis().pubsub(ignore_subscribe_messages=True)
+                await pubsub.subscribe(self.channel)
+                logger.info(f"Listening for cache invalidations on {self.channel}")
+                if missed_messages:
+                    logger.warning(
+                        "Flushing in-process caches after missed invalidations")
+                    self._flush_local()
+                backoff = 1
+
+                while True:
+                    message = await pubsub.get_message(
+                        ignore_subscribe_messages=True, timeout=LISTEN_POLL_TIMEOUT)
+                    if message is not None and message["type"] == "message":
+                        self._handle(message["data"])
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(
+                    f"Invalidation listener failed, retrying in {backoff}s: {str(e)}")
+                missed_messages = True
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, 30)
+            finally:
+                if pubsub is not None:
+                    try:
+                        await pubsub.aclose()
+                    except Exception:
+                        pass
+
+    async def start(self) -> None:
+        """Start the listener task on this worker's event loop."""
+        if self._listener is None and self._get_redis() is not None:
+            self._listener = asyncio.create_task(self._listen())
+
+    async def stop(self) -> None:
+        """Stop the listener and close the bus's Redis client."""
+        if self._listener is not None:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except asyncio.CancelledError:
+                pass
+            self._listener = None
+        if self._redis is not None:
+            await self._redis.aclose()
+            self._redis = None
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Report message counters.
+
+        Returns:
+            Dict with messages published by and received from other workers
+        """
+        return {"published": self._published, "received": self._received}
+
+
+# Create a singleton instance for global use
+invalidation_bus = InvalidationBus()
@@ -0,0 +1,242 @@
+import functools
+from enum import Enum
+from typing import Any, Awaitable, Callable, Dict, Optional, Type, Union
+from loguru import logger
+from pydantic import BaseModel
+from .cache_manager import cache_manager, CacheNamespace
+from .single_flight import single_flight as _single_flight
+
+# Builds the part of a cache key after the namespace from a call's arguments
+KeyBuilder = Callable[..., str]
+
+
+class ResultCodec:
+    """
+    Converts a function's result to the value stored in the cache and back.
+
+    The default stores results as they are, which suits anything the cache's
+    value codec can serialize (bytes, str, dicts and lists of plain values).
+    """
+
+    def dump(self, result: Any) -> Any:
+        """Convert a result to the value to cache."""
+        return result
+
+    def load(self, value: Any) -> Any:
+        """Convert a cached value back to a result."""
+        return value
+
+
+class ModelCodec(ResultCodec):
+    """
+    Caches pydantic models (including Beanie documents) as JSON-safe dicts.
+
+    Given a model class, cached values are validated back into it. Given
+    an allow-list of names to model classes, the result's name is stored
+    next to its data, so functions returning different models, such as
+    DBManager.find_by_id, can share it. Only listed classes are ever
+    instantiated from a cached value; an entry naming anything else is
+    treated as a miss.
+    """
+
+    def __init__(self, model: Union[Type[BaseModel], Dict[str, Type[BaseModel]]]):
+        """
+        Initialize the codec.
+
+        Args:
+            model: Model class every result is an instance of, or a mapping
+                of name to each model class a result may be
+        """
+        self.model = model if not isinstance(model, dict) else None
+        self.models = model if isinstance(model, dict) else {}
+        self._names = {model_class: name for name, model_class in self.models.items()}
+
+    def dump(self, result: BaseModel) -> Any:
+        data = result.model_dump(mode="json")
+        if self.model is not None:
+            return data
+        name = self._names.get(type(result))
+        if name is None:
+            raise TypeError(f"{type(result).__name__} is not an allowed cached model")
+        return {"model": name, "data": data}
+
+    def load(self, value: Any) -> Optional[BaseModel]:
+        if self.model is not None:
+            return self.model.model_validate(value)
+        model = self.models.get(value.get("model"))
+        if model is None:
+            logger.warning(f"Ignoring cached value of unknown model {value.get('model')}")
+            return None
+        return model.model_validate(value["data"])
+
+
+class CachedFunction:
+    """
+    An async function whose results are memoized in the CacheManager.
+
+    Each call builds a key from its arguments and returns the cached result
+    when there is one; otherwise it runs the function and caches a non-None
+    result. None is never cached, so functions can return None for "not
+    found" or "failed" without that sticking.
+
+    Used as a method decorator it binds like a function, and the bound
+    object also exposes cache_key() and invalidate() for the same arguments.
+    """
+
+    def __init__(
+        self,
+        func: Callable[..., Awaitable[Any]],
+        key: Optional[KeyBuilder],
+        namespace: Union[CacheNamespace, str],
+        ttl: Optional[int],
+        memory_ttl: Optional[int],
+        codec: Optional[ResultCodec],
+        single_flight: bool,
+        enabled: Optional[Callable[[], bool]],
+    ):
+        self.func = func
+        self.key = key
+        self.namespace = namespace.value if isinstance(namespace, Enum) else namespace
+        self.ttl = ttl
+        self.memory_ttl = memory_ttl
+        self.codec = codec or ResultCodec()
+        self.single_flight = single_flight
+        self.enabled = enabled
+        owner = func.__qualname__.rpartition(".")[0]
+        self._is_method = bool(owner) and not owner.endswith("<locals>")
+        functools.update_wrapper(self, func)
+
+    def __get__(self, instance: Any, owner: Optional[type] = None) -> Any:
+        if instance is None:
+            return self
+        return _BoundCachedFunction(self, instance)
+
+    def cache_key(self, *args: Any, **kwargs: Any) -> str:
+        """
+        Build the cache key for a call.
+
+        Without a key builder the key hashes the function's qualified name
+        and the repr of its arguments (skipping self), which is only stable
+        for arguments with a value-based repr.
+
+        Args:
+            *args: Positional arguments of the call
+            **kwargs: Keyword arguments of the call
+
+        Returns:
+            Full cache key, starting with the namespace
+        """
+        if self.key is not None:
+            return f"{self.namespace}:{self.key(*args, **kwargs)}"
+
+        if args and self._is_method:
+            args = args[1:]
+        call = repr((args, sorted(kwargs.items())))
+        name = f"{self.func.__module__}.{self.func.__qualname__}"
+        return f"{self.namespace}:{name}:{cache_manager.hash_content(call)}"
+
+    async def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        if self.enabled is not None and not self.enabled():
+            return await self.func(*args, **kwargs)
+
+        key = self.cache_key(*args, **kwargs)
+        cached = await self._lookup(key)
+        if cached is not None:
+            return cached
+
+        async def compute():
+            result = await self.func(*args, **kwargs)
+            if result is not None:
+                await cache_manager.aset(
+                    key, self.codec.dump(result), self.ttl, memory_ttl=self.memory_ttl)
+            return result
+
+        if self.single_flight:
+            return await _single_flight.do(key, compute, lookup=lambda: self._lookup(key))
+        return await compute()
+
+    async def _lookup(self, key: str) -> Optional[Any]:
+        """
+        Return the cached result under a key, or None.
+
+        A value the codec cannot load, such as one written before its model
+        changed, is deleted and treated as a miss.
+        """
+        value = await cache_manager.aget(key)
+        if value is None:
+            return None
+        try:
+            return self.codec.load(value)
+        except Exception as e:
+            logger.warning(f"Dropping undecodable cached value for {key}: {str(e)}")
+            await cache_manager.adelete(key)
+            return None
+
+    async def invalidate(self, *args: Any, **kwargs: Any) -> None:
+        """
+        Drop the cached result of a call in every worker.
+
+        Args:
+            *args: Positional arguments of the call
+            **kwargs: Keyword arguments of the call
+        """
+        await cache_manager.adelete(self.cache_key(*args, **kwargs))
+
+
+class _BoundCachedFunction:
+    """A CachedFunction bound to an instance, like a bound method."""
+
+    def __init__(self, cached_function: CachedFunction, instance: Any):
+        self._cached_function = cached_function
+        self._instance = instance
+        functools.update_wrapper(self, cached_function.func)
+
+    async def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        return await self._cached_function(self._instance, *args, **kwargs)
+
+    def cache_key(self, *args: Any, **kwargs: Any) -> str:
+        return self._cached_function.cache_key(self._instance, *args, **kwargs)
+
+    async def invalidate(self, *args: Any, **kwargs: Any) -> None:
+        await self._cached_function.invalidate(self._instance, *args, **kwargs)
+
+
+def cached(
+    namespace: Union[CacheNamespace, str],
+    key: Optional[KeyBuilder] = None,
+    ttl: Optional[int] = None,
+    memory_ttl: Optional[int] = None,
+    codec: Optional[ResultCodec] = None,
+    single_flight: bool = False,
+    enabled: Optional[Callable[[], bool]] = None,
+) -> Callable[[Callable[..., Awaitable[Any]]], CachedFunction]:
+    """
+    Memoize an async function in the two-level cache.
+
+    Example:
+        @cached(CacheNamespace.LINKEDIN_PAGE,
+                key=lambda self, url: cache_manager.hash_content(url), ttl=3600)
+        async def _fetch_page(self, url: str) -> str:
+            ...
+
+    Args:
+        namespace: First segment of the cache key, used to invalidate
+            every result of the function at once
+        key: Builds the rest of the key from the call's arguments (including
+            self for methods); defaults to a hash of the arguments
+        ttl: Seconds results live in Redis; defaults to the cache's TTL
+        memory_ttl: Seconds results live in process memory; defaults to ttl
+        codec: Converts results to cacheable values and back, e.g.
+            ModelCodec for pydantic models
+        single_flight: Whether concurrent misses for the same key, across
+            workers too, run the function only once
+        enabled: Called on every call; when it returns False the function
+            runs uncached, e.g. to honour a settings flag
+
+    Returns:
+        Decorator producing a CachedFunction
+    """
+    def decorator(func: Callable[..., Awaitable[Any]]) -> CachedFunction:
+        return CachedFunction(func, key, namespace, ttl, memory_ttl,
+                              codec, single_flight, enabled)
+    return decorator
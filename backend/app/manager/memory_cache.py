@@ -0,0 +1,282 @@
+import sys
+from fnmatch import fnmatchcase
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+from loguru import logger
+
+
+def estimate_size(value: Any) -> int:
+    """
+    Estimate the memory held by a cached value in bytes.
+
+    Strings and bytes count their length, containers the sum of their items
+    and numbers, booleans and None their object size, which is close enough
+    to enforce a byte budget without serializing. Only these types, the ones
+    the cache's value codec can serialize, are accepted; other objects could
+    hold any amount of memory behind a small shell, so they are rejected.
+
+    Args:
+        value: Value to measure
+
+    Returns:
+        Approximate size in bytes
+
+    Raises:
+        TypeError: If the value, or anything inside it, is of another type
+    """
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return len(value)
+    if isinstance(value, str):
+        return len(value)
+    if isinstance(value, dict):
+        return 64 + sum(estimate_size(k) + estimate_size(v) for k, v in value.items())
+    if isinstance(value, (list, tuple, set)):
+        return 56 + sum(estimate_size(item) for item in value)
+    if value is None or isinstance(value, (int, float)):
+        return sys.getsizeof(value)
+    raise TypeError(f"Cannot cache a value of type {type(value).__name__}")
+
+
+class MemoryCache:
+    """
+    Bounded in-process cache with LRU eviction and per-entry TTLs.
+
+    Entries are kept in an OrderedDict in least-recently-used order. Writes
+    evict from the cold end until both the entry count and the byte budget
+    fit, and a daemon thread periodically drops expired entries so they do
+    not linger until the same key is read again.
+    """
+
+    def __init__(
+        self,
+        max_entries: int,
+        max_bytes: int,
+        max_item_bytes: int,
+        sweep_interval: float = 60,
+        on_evict: Optional[Callable[[str, str], None]] = None,
+    ):
+        """
+        Initialize the cache. The sweeper thread starts on the first write.
+
+        Args:
+            max_entries: Maximum number of entries kept
+            max_bytes: Maximum estimated bytes held by all entries
+            max_item_bytes: Values larger than this are not cached in memory
+            sweep_interval: Seconds between background expiry sweeps
+            on_evict: Called with (key, reason) when an entry is dropped
+                for capacity ("capacity") or expiry ("expired")
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.max_item_bytes = max_item_bytes
+        self.sweep_interval = sweep_interval
+        self.on_evict = on_evict
+
+        # key -> (value, expiry timestamp, estimated size)
+        self._entries: "OrderedDict[str, Tuple[Any, float, int]]" = OrderedDict()
+        self._lock = threading.RLock()
+        self._bytes = 0
+
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+        self._rejections = 0
+
+        self._sweeper: Optional[threading.Thread] = None
+        self._stopped = threading.Event()
+
+    def _remove(self, key: str, reason: Optional[str] = None) -> None:
+        """Remove an entry and release its bytes; the lock must be held."""
+        _, _, size = self._entries.pop(key)
+        self._bytes -= size
+        if reason and self.on_evict:
+            self.on_evict(key, reason)
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Get a value and mark it as recently used.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value or None if missing or expired
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+
+            value, expiry, _ = entry
+            if expiry < time.time():
+                self._remove(key, "expired")
+                self._expirations += 1
+                self._misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def set(self, key: str, value: Any, ttl: float) -> bool:
+        """
+        Store a value, evicting least recently used entries to make room.
+
+        Args:
+            key: Cache key
+            value: Value to cache
+            ttl: Time-to-live in seconds
+
+        Returns:
+            True if the value was stored, False if it exceeds max_item_bytes
+            or is not a serializable value (see estimate_size)
+        """
+        try:
+            size = estimate_size(value)
+        except TypeError as e:
+            logger.warning(f"Not caching {key} in memory: {str(e)}")
+            size = None
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+            if size is None or size > self.max_item_bytes:
+                self._rejections += 1
+                return False
+
+            self._entries[key] = (value, time.time() + ttl, size)
+            self._bytes += size
+
+            while self._entries and (
+                len(self._entries) > self.max_entries or self._bytes > self.max_bytes
+            ):
+                oldest = next(iter(self._entries))
+                self._remove(oldest, "capacity")
+                self._evictions += 1
+
+        self._start_sweeper()
+        return True
+
+    def delete(self, key: str) -> None:
+        """
+        Delete a value if present.
+
+        Args:
+            key: Cache key
+        """
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def delete_matching(self, pattern: str) -> int:
+        """
+        Delete every entry whose key matches a glob pattern.
+
+        Args:
+            pattern: Glob pattern, as used by Redis SCAN MATCH
+
+        Returns:
+            Number of entries removed
+        """
+        with self._lock:
+            keys = [key for key in self._entries if fnmatchcase(key, pattern)]
+            for key in keys:
+                self._remove(key)
+        return len(keys)
+
+    def sweep(self) -> int:
+        """
+        Drop every expired entry.
+
+        Returns:
+            Number of entries removed
+        """
+        now = time.time()
+        with self._lock:
+            expired = [key for key, (_, expiry, _) in self._entries.items()
+                       if expiry < now]
+            for key in expired:
+                self._remove(key, "expired")
+            self._expirations += len(expired)
+        return len(expired)
+
+    def _sweep_loop(self) -> None:
+        """Sweep expired entries until the cache is stopped."""
+        while not self._stopped.wait(self.sweep_interval):
+            try:
+                removed = self.sweep()
+                if removed:
+                    logger.debug(
+                        f"Swept {removed} expired entries from memory cache")
+            except Exception as e:
+                logger.error(f"Error sweeping memory cache: {str(e)}")
+
+    def _start_sweeper(self) -> None:
+        """Start the background sweeper thread if it is not running."""
+        if self._sweeper is not None or self.sweep_interval <= 0:
+            return
+        with self._lock:
+            if self._sweeper is None:
+                self._stopped.clear()
+                self._sweeper = threading.Thread(
+                    target=self._sweep_loop, name="memory-cache-sweeper", daemon=True)
+                self._sweeper.start()
+
+    def stop(self) -> None:
+        """Stop the background sweeper thread."""
+        self._stopped.set()
+        if self._sweeper is not None:
+            self._sweeper.join(timeout=1)
+            self._sweeper = None
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Report size and effectiveness counters.
+
+        Returns:
+            Dict with entry and byte usage, limits, and hit/miss/eviction counts
+        """
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "expirations": self._expirations,
+                "rejections": self._rejections,
+            }
+
+    def usage_by_prefix(self, separator: str = ":") -> Dict[str, Tuple[int, int]]:
+        """
+        Report entries and bytes held per key prefix.
+
+        Args:
+            separator: Character ending the prefix, e.g. the namespace of
+                "parsed:job:<hash>"
+
+        Returns:
+            Mapping of prefix to (entries, estimated bytes)
+        """
+        usage: Dict[str, Tuple[int, int]] = {}
+        with self._lock:
+            for key, (_, _, size) in self._entries.items():
+                prefix = key.partition(separator)[0]
+                entries, total = usage.get(prefix, (0, 0))
+                usage[prefix] = (entries + 1, total + size)
+        return usage
+
+    def __len__(self) -> int:
+        return len(self._entries)
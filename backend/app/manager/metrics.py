@@ -0,0 +1,334 @@
+import bisect
+import threading
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# Prefix of every exported metric name
+METRICS_PREFIX = "tirenohire"
+
+# Upper bounds in seconds of the latency histogram buckets, from a memory
+# hit (microseconds) to a slow Redis round trip
+LATENCY_BUCKETS: Tuple[float, ...] = (
+    0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025,
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0,
+)
+
+
+def namespace_of(key: str) -> str:
+    """
+    Return the namespace of a cache key, its first segment.
+
+    Args:
+        key: Cache key such as "parsed:job:<hash>"
+
+    Returns:
+        Namespace such as "parsed"
+    """
+    return key.partition(":")[0]
+
+
+def _format_labels(names: Iterable[str], values: Iterable[str]) -> str:
+    """Render a Prometheus label set, escaping values."""
+    pairs = []
+    for name, value in zip(names, values):
+        value = str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+        pairs.append(f'{name}="{value}"')
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    """Render a sample value, without a trailing .0 for whole numbers."""
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+class Counter:
+    """A monotonically increasing metric with a fixed set of labels."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labels: Tuple[str, ...]):
+        self.name = f"{METRICS_PREFIX}_{name}"
+        self.documentation = documentation
+        self.labels = labels
+        self._values: Dict[Tuple[str, ...], float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, *labels: str, amount: float = 1) -> None:
+        """Add to the counter of a label set."""
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def values(self) -> Dict[Tuple[str, ...], float]:
+        """Return a copy of every label set's value."""
+        with self._lock:
+            return dict(self._values)
+
+    def render(self) -> List[str]:
+        """Render the counter in the Prometheus text format."""
+        return [f"{self.name}{_format_labels(self.labels, labels)} {_format_value(value)}"
+                for labels, value in sorted(self.values().items())]
+
+
+class Gauge(Counter):
+    """A metric set to its current value when it is collected."""
+
+    kind = "gauge"
+
+    def set_all(self, values: Dict[Tuple[str, ...], float]) -> None:
+        """Replace every label set's value."""
+        with self._lock:
+            self._values = dict(values)
+
+
+class Histogram:
+    """A latency distribution with cumulative buckets, per label set."""
+
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, labels: Tuple[str, ...],
+                 buckets: Tuple[float, ...] = LATENCY_BUCKETS):
+        self.name = f"{METRICS_PREFIX}_{name}"
+        self.documentation = documentation
+        self.labels = labels
+        self.buckets = buckets
+        # label set -> (per-bucket counts with a final +Inf bucket, sum)
+        self._series: Dict[Tuple[str, ...], Tuple[List[int], float]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, *labels: str, value: float) -> None:
+        """Record one observation for a label set."""
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            counts, total = self._series.get(labels, ([0] * (len(self.buckets) + 1), 0.0))
+            counts[index] += 1
+            self._series[labels] = (counts, total + value)
+
+    def summary(self) -> Dict[Tuple[str, ...], Dict[str, float]]:
+        """
+        Summarize every label set.
+
+        Returns:
+            Mapping of label set to its count, mean and estimated p50/p95/p99
+            (the upper bound of the bucket holding that quantile)
+        """
+        with self._lock:
+            series = {labels: (list(counts), total)
+                      for labels, (counts, total) in self._series.items()}
+
+        result = {}
+        for labels, (counts, total) in series.items():
+            count = sum(counts)
+            entry = {"count": count, "mean": total / count if count else 0.0}
+            for name, quantile in (("p50", 0.5), ("p95", 0.95), ("p99", 0.99)):
+                seen = 0
+                for index, bucket_count in enumerate(counts):
+                    seen += bucket_count
+                    if seen >= quantile * count:
+                        entry[name] = self.buckets[index] if index < len(self.buckets) \
+                            else float("inf")
+                        break
+            result[labels] = entry
+        return result
+
+    def render(self) -> List[str]:
+        """Render the histogram in the Prometheus text format."""
+        with self._lock:
+            series = sorted((labels, list(counts), total)
+                            for labels, (counts, total) in self._series.items())
+
+        lines = []
+        for labels, counts, total in series:
+            cumulative = 0
+            for bound, bucket_count in zip([*self.buckets, "+Inf"], counts):
+                cumulative += bucket_count
+                bucket_labels = _format_labels(
+                    [*self.labels, "le"], [*labels, bound if bound == "+Inf" else repr(bound)])
+                lines.append(f"{self.name}_bucket{bucket_labels} {cumulative}")
+            label_text = _format_labels(self.labels, labels)
+            lines.append(f"{self.name}_sum{label_text} {_format_value(total)}")
+            lines.append(f"{self.name}_count{label_text} {cumulative}")
+        return lines
+
+
+class CacheMetrics:
+    """
+    Counters and latency histograms for the cache, per namespace and tier.
+
+    Tiers are "memory" (the in-process L1) and "redis" (the shared L2).
+    Everything is kept in process, so each worker reports its own numbers;
+    a Prometheus scrape of every worker, or the admin endpoint on each,
+    gives the full picture.
+    """
+
+    def __init__(self):
+        """Create the cache's metrics."""
+        self.requests = Counter(
+            "cache_requests_total", "Cache lookups by namespace, tier and result.",
+            ("namespace", "tier", "result"))
+        self.stale = Counter(
+            "cache_stale_served_total",
+            "Cached entries served past their soft TTL while being revalidated.",
+            ("namespace",))
+        self.writes = Counter(
+            "cache_writes_total", "Entries written by namespace and tier.",
+            ("namespace", "tier"))
+        self.written_bytes = Counter(
+            "cache_written_bytes_total",
+            "Bytes written by namespace and tier (encoded size for Redis).",
+            ("namespace", "tier"))
+        self.evictions = Counter(
+            "cache_evictions_total",
+            "Entries dropped by namespace, tier and reason (capacity, expired, invalidated).",
+            ("namespace", "tier", "reason"))
+        self.stored_bytes = Gauge(
+            "cache_stored_bytes", "Estimated bytes held by namespace and tier.",
+            ("namespace", "tier"))
+        self.entries = Gauge(
+            "cache_entries", "Entries held by namespace and tier.",
+            ("namespace", "tier"))
+        self.latency = Histogram(
+            "cache_operation_seconds", "Latency of cache operations in seconds.",
+            ("operation", "namespace", "tier"))
+
+    def record_lookup(self, tier: str, hits: Iterable[str], misses: Iterable[str]) -> None:
+        """
+        Count the hits and misses of a lookup.
+
+        Args:
+            tier: Tier that was read
+            hits: Keys found
+            misses: Keys not found
+        """
+        for result, keys in (("hit", hits), ("miss", misses)):
+            for key in keys:
+                self.requests.inc(namespace_of(key), tier, result)
+
+    def record_write(self, tier: str, key: str, size: int) -> None:
+        """
+        Count a written entry and its size.
+
+        Args:
+            tier: Tier that was written
+            key: Cache key
+            size: Bytes written
+        """
+        namespace = namespace_of(key)
+        self.writes.inc(namespace, tier)
+        self.written_bytes.inc(namespace, tier, amount=size)
+
+    def record_eviction(self, tier: str, key: str, reason: str, count: int = 1) -> None:
+        """
+        Count entries dropped by a tier.
+
+        Args:
+            tier: Tier that dropped the entries
+            key: Cache key, or key pattern for an invalidation
+            reason: "capacity", "expired" or "invalidated"
+            count: Number of entries dropped
+        """
+        if count:
+            self.evictions.inc(namespace_of(key), tier, reason, amount=count)
+
+    def record_stale(self, key: str) -> None:
+        """
+        Count an entry served past its soft TTL.
+
+        Args:
+            key: Cache key of the stale entry
+        """
+        self.stale.inc(namespace_of(key))
+
+    def observe(self, operation: str, tier: str, keys: Iterable[str], seconds: float) -> None:
+        """
+        Record the latency of an operation once for each namespace it touched.
+
+        Args:
+            operation: "get", "set" or "delete"
+            tier: Tier the operation went to
+            keys: Cache keys involved
+            seconds: Duration of the operation
+        """
+        for namespace in {namespace_of(key) for key in keys}:
+            self.latency.observe(operation, namespace, tier, value=seconds)
+
+    def set_usage(self, tier: str, usage: Dict[str, Tuple[int, int]]) -> None:
+        """
+        Replace the stored entries and bytes gauges of a tier.
+
+        Args:
+            tier: Tier the usage is for
+            usage: Mapping of namespace to (entries, bytes)
+        """
+        self.entries.set_all({
+            (namespace, tier): entries for namespace, (entries, _) in usage.items()})
+        self.stored_bytes.set_all({
+            (namespace, tier): size for namespace, (_, size) in usage.items()})
+
+    def snapshot(self) -> Dict[str, Dict[str, Dict[str, object]]]:
+        """
+        Summarize the metrics per namespace and tier for the admin endpoint.
+
+        Returns:
+            Mapping of namespace to tier to its counters, hit ratio, usage
+            and latency summaries
+        """
+        report: Dict[str, Dict[str, Dict[str, object]]] = {}
+
+        def tier_of(namespace: str, tier: str) -> Dict[str, object]:
+            return report.setdefault(namespace, {}).setdefault(tier, {})
+
+        for (namespace, tier, result), value in self.requests.values().items():
+            tier_of(namespace, tier)["hits" if result == "hit" else "misses"] = int(value)
+        for (namespace, tier), value in self.writes.values().items():
+            tier_of(namespace, tier)["writes"] = int(value)
+        for (namespace, tier), value in self.written_bytes.values().items():
+            tier_of(namespace, tier)["written_bytes"] = int(value)
+        for (namespace, tier, reason), value in self.evictions.values().items():
+            tier_of(namespace, tier)[f"evictions_{reason}"] = int(value)
+        for (namespace, tier), value in self.entries.values().items():
+            tier_of(namespace, tier)["entries"] = int(value)
+        for (namespace, tier), value in self.stored_bytes.values().items():
+            tier_of(namespace, tier)["stored_bytes"] = int(value)
+        for (namespace,), value in self.stale.values().items():
+            report.setdefault(namespace, {})["stale_served"] = int(value)
+        for (operation, namespace, tier), summary in self.latency.summary().items():
+            tier_of(namespace, tier)[f"{operation}_latency"] = summary
+
+        for tiers in report.values():
+            for stats in tiers.values():
+                if isinstance(stats, dict) and ("hits" in stats or "misses" in stats):
+                    lookups = stats.get("hits", 0) + stats.get("misses", 0)
+                    stats["hit_ratio"] = round(stats.get("hits", 0) / lookups, 4)
+        return report
+
+    def metrics(self) -> List[object]:
+        """Return every metric, for the exposition."""
+        return [self.requests, self.stale, self.writes, self.written_bytes,
+                self.evictions, self.entries, self.stored_bytes, self.latency]
+
+
+def render_exposition(metrics: Iterable[object], extra: Optional[Dict[str, Tuple[str, str, float]]] = None) -> str:
+    """
+    Render metrics in the Prometheus text exposition format (version 0.0.4).
+
+    Args:
+        metrics: Counter, Gauge and Histogram instances
+        extra: Unlabelled samples to append, as name -> (type, help, value)
+
+    Returns:
+        Exposition text
+    """
+    lines: List[str] = []
+    for metric in metrics:
+        lines.append(f"# HELP {metric.name} {metric.documentation}")
+        lines.append(f"# TYPE {metric.name} {metric.kind}")
+        lines.extend(metric.render())
+    for name, (kind, documentation, value) in (extra or {}).items():
+        full_name = f"{METRICS_PREFIX}_{name}"
+        lines.append(f"# HELP {full_name} {documentation}")
+        lines.append(f"# TYPE {full_name} {kind}")
+        lines.append(f"{full_name} {_format_value(value)}")
+    return "\n".join(lines) + "\n"
+
+
+# Create a singleton instance for global use
+cache_metrics = CacheMetrics()
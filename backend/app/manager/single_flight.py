@@ -0,0 +1,157 @@
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional
+from loguru import logger
+from app.core.config import settings
+from .cache_manager import cache_manager
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent executions of the same expensive operation.
+
+    Within a worker, callers that arrive while an operation for the same key
+    is running await the in-flight task instead of starting their own.
+    Across workers, the first caller takes a Redis lease and becomes the
+    leader; callers on other workers poll a result lookup (usually the
+    parse cache) until the leader's result appears or its lease ends.
+    A burst of identical requests therefore costs one fetch, one
+    extraction and one LLM parse.
+    """
+
+    def __init__(
+        self,
+        lease_ttl: int = settings.SINGLE_FLIGHT_LEASE_TTL,
+        wait_timeout: float = settings.SINGLE_FLIGHT_WAIT_TIMEOUT,
+        poll_interval: float = settings.SINGLE_FLIGHT_POLL_INTERVAL,
+    ):
+        """
+        Initialize the coalescer.
+
+        Args:
+            lease_ttl: Seconds a leader's Redis lease lives without being
+                renewed; the leader renews it while it runs, so this bounds
+                how long followers wait for a leader that died
+            wait_timeout: Maximum seconds a follower waits for a leader
+            poll_interval: Seconds between a follower's result lookups
+        """
+        self.lease_ttl = lease_ttl
+        self.wait_timeout = wait_timeout
+        self.poll_interval = poll_interval
+        self._in_flight: Dict[str, asyncio.Task] = {}
+
+        self._executions = 0
+        self._coalesced = 0
+        self._remote_hits = 0
+
+    async def do(
+        self,
+        key: str,
+        func: Callable[[], Awaitable[Any]],
+        lookup: Optional[Callable[[], Awaitable[Optional[Any]]]] = None,
+    ) -> Any:
+        """
+        Run func once per key across concurrent callers.
+
+        The operation runs in its own task, so a leader whose request is
+        cancelled does not cancel the work other callers are waiting on.
+
+        Args:
+            key: Identity of the operation, e.g. a URL or content hash
+            func: Coroutine function performing the operation
+            lookup: Coroutine function returning the operation's result once
+                another worker has produced it, or None; without it only
+                callers within this worker are coalesced
+
+        Returns:
+            Result of the operation
+        """
+        task = self._in_flight.get(key)
+        if task is not None:
+            self._coalesced += 1
+            logger.info(f"Coalesced request for {key} with in-flight task")
+            return await asyncio.shield(task)
+
+        task = asyncio.create_task(self._run(key, func, lookup))
+        self._in_flight[key] = task
+        task.add_done_callback(lambda done: self._finish(key, done))
+        return await asyncio.shield(task)
+
+    def _finish(self, key: str, task: asyncio.Task) -> None:
+        """Forget a finished task and mark its exception as retrieved."""
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        if not task.cancelled():
+            task.exception()
+
+    async def _run(self, key: str, func: Callable[[], Awaitable[Any]], lookup) -> Any:
+        """
+        Run the operation as leader, or wait for the leader on another worker.
+
+        Args:
+            key: Identity of the operation
+            func: Coroutine function performing the operation
+            lookup: Coroutine function returning another worker's result
+
+        Returns:
+            Result of the operation
+        """
+        lease_token = None
+        if lookup is not None:
+            lease_token = await cache_manager.acquire_lease(key, self.lease_ttl)
+            if lease_token is None:
+                result = await self._wait_for_leader(key, lookup)
+                if result is not None:
+                    self._remote_hits += 1
+                    return result
+                logger.info(
+                    f"No result from leader for {key}, running it here")
+
+        self._executions += 1
+        if lease_token is None:
+            return await func()
+        async with cache_manager.hold_lease(key, lease_token, self.lease_ttl):
+            return await func()
+
+    async def _wait_for_leader(self, key: str, lookup) -> Optional[Any]:
+        """
+        Poll for the result of an operation another worker is running.
+
+        Args:
+            key: Identity of the operation
+            lookup: Coroutine function returning the result, or None
+
+        Returns:
+            The leader's result, or None if the leader's lease ended or the
+            wait timed out without one
+        """
+        logger.info(f"Waiting for another worker to finish {key}")
+        deadline = time.monotonic() + self.wait_timeout
+        while time.monotonic() < deadline:
+            await asyncio.sleep(self.poll_interval)
+            result = await lookup()
+            if result is not None:
+                return result
+            if not await cache_manager.lease_held(key):
+                # The leader finished or failed; its result may just have landed
+                return await lookup()
+        return None
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Report coalescing counters.
+
+        Returns:
+            Dict with executions, in-worker coalesced calls, results taken
+            from other workers, and operations currently in flight
+        """
+        return {
+            "executions": self._executions,
+            "coalesced": self._coalesced,
+            "remote_hits": self._remote_hits,
+            "in_flight": len(self._in_flight),
+        }
+
+
+# Create a singleton instance for global use
+single_flight = SingleFlight()
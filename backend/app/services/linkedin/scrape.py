@@ -6,7 +6,7 @@ from urllib.parse import urlencode
 from loguru import logger
 from pydantic import BaseModel
 from app.core.config import settings
-from app.manager import cache_manager
+from app.manager import cache_manager, cached, CacheNamespace
 
 
 class LinkedInJobPosting(BaseModel):
@@ -151,27 +151,17 @@ class LinkedInJobScraper:
 
         return f"{self.base_url}?{urlencode(url_params)}"
 
+    @cached(CacheNamespace.LINKEDIN_PAGE,
+            key=lambda self, url: cache_manager.hash_content(url),
+            ttl=3600,
+            single_flight=True,
+            enabled=lambda: settings.CACHE_URL_CONTENT)
     async def _fetch_page(self, url: str) -> str:
-        """Fetch a single page with error handling and caching"""
-
-        # Check cache first
-        cache_key = f"linkedin_page:{cache_manager.hash_content(url)}"
-        cached_content = cache_manager.get(cache_key)
-
-        if cached_content and settings.CACHE_URL_CONTENT:
-            logger.info(f"Cache hit for LinkedIn page: {url}")
-            return cached_content
-
+        """Fetch a single page with error handling, cached for an hour"""
         try:
             async with self.session.get(url) as response:
                 if response.status == 200:
-                    content = await response.text()
-
-                    # Cache the content for 1 hour
-                    if settings.CACHE_URL_CONTENT:
-                        cache_manager.set(cache_key, content, ttl=3600)
-
-                    return content
+                    return await response.text()
                 elif response.status == 429:
                     logger.warning("Rate limited by LinkedIn")
                     raise Exception("Rate limited by LinkedIn")
@@ -0,0 +1,124 @@
+"""
+Import-time profile for the backend.
+
+Imports a module in a fresh interpreter with ``python -X importtime`` and
+prints the modules with the highest cumulative import cost, the cost per
+top-level package, and the resident memory of the process after import.
+Run it from the backend directory and compare the output across releases
+to track worker cold-start time and per-worker memory:
+
+    python scripts/profile_imports.py
+    python scripts/profile_imports.py --module app.core.content_processor --top 40
+    python scripts/profile_imports.py --json > import_profile.json
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+from collections import defaultdict
+
+# Printed by the child after the import so memory is measured in-process
+_CHILD_CODE = """
+import importlib, resource, sys
+importlib.import_module({module!r})
+print(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+"""
+
+
+def run_profile(module: str) -> tuple[list[dict], int]:
+    """
+    Import a module in a child interpreter and collect its import timings.
+
+    Args:
+        module: Dotted name of the module to import
+
+    Returns:
+        Tuple of (timing rows, peak RSS of the child in KiB)
+    """
+    env = dict(os.environ)
+    env.setdefault("OPENAI_API_KEY", "profile-imports")
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c",
+            _CHILD_CODE.format(module=module)],
+        capture_output=True,
+        text=True,
+        env=env,
+    )
+    if result.returncode != 0:
+        sys.stderr.write(result.stderr)
+        raise SystemExit(f"Importing {module} failed")
+
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        rows.append({
+            "module": name.strip(),
+            "depth": (len(name) - len(name.lstrip())) // 2,
+            "self_ms": int(self_us) / 1000,
+            "cumulative_ms": int(cumulative_us) / 1000,
+        })
+
+    max_rss_kib = int(result.stdout.strip().splitlines()[-1])
+    return rows, max_rss_kib
+
+
+def summarize(rows: list[dict], top: int) -> dict:
+    """
+    Build the report from raw timing rows.
+
+    Args:
+        rows: Timing rows from run_profile
+        top: Number of modules to keep in the cumulative ranking
+
+    Returns:
+        Report with the total, the slowest modules and per-package totals
+    """
+    packages = defaultdict(float)
+    for row in rows:
+        packages[row["module"].split(".")[0]] += row["self_ms"]
+
+    # Top-level imports have no indentation; their cumulative times add up
+    total_ms = sum(row["cumulative_ms"] for row in rows if row["depth"] == 0)
+    return {
+        "total_ms": round(total_ms, 1),
+        "modules": sorted(rows, key=lambda r: r["cumulative_ms"], reverse=True)[:top],
+        "packages": dict(sorted(packages.items(), key=lambda i: i[1], reverse=True)[:top]),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--module", default="app.main",
+                        help="module to import (default: app.main)")
+    parser.add_argument("--top", type=int, default=25,
+                        help="number of entries to show per table")
+    parser.add_argument("--json", action="store_true",
+                        help="print the report as JSON")
+    args = parser.parse_args()
+
+    rows, max_rss_kib = run_profile(args.module)
+    report = summarize(rows, args.top)
+    report["module"] = args.module
+    report["max_rss_mib"] = round(max_rss_kib / 1024, 1)
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return
+
+    print(f"Import of {args.module}: {report['total_ms']:.0f} ms, "
+          f"peak RSS {report['max_rss_mib']} MiB\n")
+    print(f"{'cumulative ms':>14}  {'self ms':>9}  module")
+    for row in report["modules"]:
+        print(f"{row['cumulative_ms']:>14.1f}  {row['self_ms']:>9.1f}  {row['module']}")
+
+    print(f"\n{'self ms':>14}  package")
+    for package, self_ms in report["packages"].items():
+        print(f"{self_ms:>14.1f}  {package}")
+
+
+if __name__ == "__main__":
+    main()
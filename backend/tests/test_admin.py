@@ -0,0 +1,33 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from app.api.admin import router
+from app.core.config import settings
+from app.manager import cache_manager
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setattr(cache_manager, "_aredis", None)
+    monkeypatch.setattr(cache_manager, "_disk", None)
+    app = FastAPI()
+    app.include_router(router, prefix="/api/admin")
+    return TestClient(app)
+
+
+def test_admin_endpoints_are_hidden_without_a_token(client, monkeypatch):
+    monkeypatch.setattr(settings, "ADMIN_TOKEN", None)
+
+    assert client.get("/api/admin/cache").status_code == 404
+    assert client.get("/api/admin/metrics").status_code == 404
+
+
+def test_admin_endpoints_require_the_bearer_token(client, monkeypatch):
+    monkeypatch.setattr(settings, "ADMIN_TOKEN", "s3cret")
+
+    assert client.get("/api/admin/metrics").status_code == 401
+    assert client.get("/api/admin/metrics",
+                      headers={"Authorization": "Bearer wrong"}).status_code == 401
+    response = client.get("/api/admin/metrics", headers={"Authorization": "Bearer s3cret"})
+    assert response.status_code == 200
+    assert "redis_breaker_open" in response.text
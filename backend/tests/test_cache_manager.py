@@ -0,0 +1,81 @@
+import pytest
+from app.manager.cache_manager import CacheManager, CacheNamespace
+
+
+@pytest.fixture
+def memory_only_cache():
+    manager = CacheManager(ttl=60)
+    manager._redis = None
+    manager._aredis = None
+    manager._disk = None
+    yield manager
+    manager._memory_cache.stop()
+
+
+@pytest.mark.asyncio
+async def test_async_set_get_and_delete(memory_only_cache):
+    await memory_only_cache.aset("job", {"title": "Engineer"})
+    assert await memory_only_cache.aget("job") == {"title": "Engineer"}
+
+    await memory_only_cache.adelete("job")
+    assert await memory_only_cache.aget("job") is None
+
+
+@pytest.mark.asyncio
+async def test_async_url_content_round_trip(memory_only_cache):
+    url = "https://example.com/job.pdf"
+    content_hash = await memory_only_cache.acache_url_content(
+        url, b"%PDF-1.7", "application/pdf")
+
+    cached = await memory_only_cache.aget_url_content(url)
+    assert cached["content"] == b"%PDF-1.7"
+    assert cached["metadata"]["hash"] == content_hash
+    assert memory_only_cache.get_url_content_hash(url) == content_hash
+
+
+def test_tagged_values_round_trip(memory_only_cache):
+    for value in (b"%PDF-1.7", {"text": "Engineer", "page_count": 2}, "hash"):
+        assert memory_only_cache._decode(memory_only_cache._encode(value)) == value
+    assert memory_only_cache._decode(None) is None
+
+
+def test_get_many_falls_back_to_memory(memory_only_cache):
+    memory_only_cache.set_many({"a": 1, "b": b"two"})
+    assert memory_only_cache.get_many(["a", "b", "c"]) == {"a": 1, "b": b"two"}
+
+
+class _RecordingRedis:
+    """Minimal stand-in for the Redis client that records MGET calls"""
+
+    def __init__(self, store):
+        self.store = store
+        self.mget_calls = []
+
+    def mget(self, keys):
+        self.mget_calls.append(keys)
+        return [self.store.get(key) for key in keys]
+
+
+def test_memory_hit_skips_redis_and_redis_hit_is_promoted(memory_only_cache):
+    redis_stub = _RecordingRedis(
+        {memory_only_cache._redis_key("remote"): memory_only_cache._encode({"title": "Engineer"})})
+    memory_only_cache._redis = redis_stub
+    memory_only_cache._memory_cache.set("local", "value", 60)
+
+    assert memory_only_cache.get("local") == "value"
+    assert redis_stub.mget_calls == []
+
+    assert memory_only_cache.get("remote") == {"title": "Engineer"}
+    assert memory_only_cache.get("remote") == {"title": "Engineer"}
+    assert redis_stub.mget_calls == [[memory_only_cache._redis_key("remote")]]
+
+
+def test_invalidate_namespace_in_memory(memory_only_cache):
+    memory_only_cache.set_many({
+        "parsed:job:abc": {"title": "Engineer"},
+        "extracted:pdf-v2:abc": {"text": "..."},
+    })
+    memory_only_cache.invalidate(CacheNamespace.PARSED)
+
+    assert memory_only_cache.get("parsed:job:abc") is None
+    assert memory_only_cache.get("extracted:pdf-v2:abc") == {"text": "..."}
@@ -0,0 +1,174 @@
+import asyncio
+import json
+import pytest
+import pytest_asyncio
+from app.core.config import settings
+from app.manager.cache_manager import (
+    RELEASE_LEASE_SCRIPT, RENEW_LEASE_SCRIPT, URL_CONTENT_SCRIPT, CacheManager)
+from app.manager.circuit_breaker import CircuitBreaker
+from app.manager.invalidation import invalidation_bus
+
+fakeredis = pytest.importorskip("fakeredis")
+pytest.importorskip("lupa")  # fakeredis runs Lua scripts through lupa
+
+
+@pytest_asyncio.fixture
+async def redis_cache():
+    server = fakeredis.FakeServer()
+    manager = CacheManager(ttl=60)
+    manager._breaker = CircuitBreaker("test")
+    manager._disk = None
+    manager._redis = fakeredis.FakeRedis(server=server)
+    manager._aredis = fakeredis.aioredis.FakeRedis(server=server)
+    manager._url_content_script = manager._redis.register_script(URL_CONTENT_SCRIPT)
+    manager._aurl_content_script = manager._aredis.register_script(URL_CONTENT_SCRIPT)
+    manager._arelease_lease_script = manager._aredis.register_script(RELEASE_LEASE_SCRIPT)
+    manager._arenew_lease_script = manager._aredis.register_script(RENEW_LEASE_SCRIPT)
+    yield manager
+    await manager.close()
+
+
+@pytest.mark.asyncio
+async def test_url_content_is_resolved_by_one_script_call(redis_cache):
+    url = "https://example.com/job.pdf"
+    content = b"%PDF-1.7 " + b"x" * 4096  # large enough to be compressed
+    content_hash = await redis_cache.acache_url_content(url, content, "application/pdf")
+    redis_cache._memory_cache.clear()
+
+    calls = []
+    script = redis_cache._aurl_content_script
+
+    async def counting_script(**kwargs):
+        calls.append(kwargs)
+        return await script(**kwargs)
+
+    redis_cache._aurl_content_script = counting_script
+    cached = await redis_cache.aget_url_content(url)
+
+    assert cached["content"] == content
+    assert cached["metadata"]["hash"] == content_hash
+    assert len(calls) == 1
+    # Promoted, so the next read does not touch Redis
+    assert await redis_cache.aget_url_content(url) == cached
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_url_content_script_misses_without_a_complete_chain(redis_cache):
+    url = "https://example.com/job.pdf"
+    content_hash = await redis_cache.acache_url_content(url, b"%PDF-1.7", "application/pdf")
+    await redis_cache.adelete(f"content:{content_hash}")
+    redis_cache._memory_cache.clear()
+
+    assert await redis_cache.aget_url_content(url) is None
+    assert redis_cache.get_url_content("https://example.com/other.pdf") is None
+
+
+def test_sync_url_content_uses_the_script(redis_cache):
+    url = "https://example.com/job.html"
+    redis_cache.cache_url_content(url, b"<html></html>", "text/html")
+    redis_cache._memory_cache.clear()
+
+    assert redis_cache.get_url_content(url)["content"] == b"<html></html>"
+
+
+def _seed(manager):
+    manager.set_many({f"parsed:job:{number}": {"n": number} for number in range(5)})
+    manager.set("extracted:pdf-v2:abc", {"text": "Engineer"})
+    # Another deployment sharing the Redis
+    manager._redis.set("other-deployment:parsed:job:0", b"keep")
+
+
+@pytest.mark.asyncio
+async def test_async_invalidate_unlinks_only_this_namespace_in_batches(redis_cache, monkeypatch):
+    monkeypatch.setattr(settings, "CACHE_UNLINK_BATCH", 2)
+    monkeypatch.setattr(settings, "CACHE_SCAN_COUNT", 1)
+    _seed(redis_cache)
+    unlinked = []
+    unlink = redis_cache._aredis.unlink
+
+    async def recording_unlink(*keys):
+        unlinked.append(len(keys))
+        return await unlink(*keys)
+
+    redis_cache._aredis.unlink = recording_unlink
+    assert await redis_cache.ainvalidate("parsed") == 5
+
+    assert max(unlinked) <= 2
+    assert await redis_cache.aget("parsed:job:1") is None
+    assert await redis_cache.aget("extracted:pdf-v2:abc") == {"text": "Engineer"}
+    assert redis_cache._redis.get("other-deployment:parsed:job:0") == b"keep"
+
+
+@pytest.mark.asyncio
+async def test_async_invalidate_publishes_on_the_cache_client(redis_cache, monkeypatch):
+    async def unexpected_publish(*args):
+        raise AssertionError("published through the bus client")
+
+    monkeypatch.setattr(invalidation_bus, "publish", unexpected_publish)
+    pubsub = redis_cache._aredis.pubsub()
+    await pubsub.subscribe(invalidation_bus.channel)
+    await pubsub.get_message(timeout=1)  # subscribe confirmation
+
+    await redis_cache.ainvalidate("parsed", "job:*")
+
+    message = await pubsub.get_message(timeout=1)
+    assert json.loads(message["data"])["patterns"] == ["parsed:job:*"]
+    await pubsub.aclose()
+
+
+def test_sync_invalidate_with_a_pattern(redis_cache):
+    _seed(redis_cache)
+
+    assert redis_cache.invalidate("parsed", "job:[12]") == 2
+    redis_cache._memory_cache.clear()
+
+    assert sorted(redis_cache.get_many([f"parsed:job:{number}" for number in range(5)])) == [
+        "parsed:job:0", "parsed:job:3", "parsed:job:4"]
+    redis_cache.clear()
+    assert redis_cache.get("parsed:job:0") is None
+    assert redis_cache._redis.get("other-deployment:parsed:job:0") == b"keep"
+
+
+@pytest.mark.asyncio
+async def test_held_lease_outlives_its_ttl_and_is_released(redis_cache):
+    token = await redis_cache.acquire_lease("job:url:a", 1)
+
+    async with redis_cache.hold_lease("job:url:a", token, 1):
+        await asyncio.sleep(1.5)
+        assert await redis_cache.lease_held("job:url:a")
+        assert await redis_cache.acquire_lease("job:url:a", 1) is None
+
+    assert not await redis_cache.lease_held("job:url:a")
+
+
+@pytest.mark.asyncio
+async def test_lease_taken_over_by_another_worker_is_not_renewed(redis_cache):
+    token = await redis_cache.acquire_lease("job:url:b", 5)
+    await redis_cache._aredis.set(redis_cache._redis_key("lease:job:url:b"), "other", ex=5)
+
+    assert not await redis_cache.renew_lease("job:url:b", token, 60)
+    assert await redis_cache._aredis.ttl(redis_cache._redis_key("lease:job:url:b")) <= 5
+
+
+@pytest.mark.asyncio
+async def test_refresh_extends_url_content_without_rewriting_it(redis_cache):
+    url = "https://example.com/job.pdf"
+    content_hash = await redis_cache.acache_url_content(url, b"%PDF-1.7", "application/pdf", ttl=60)
+    metadata = await redis_cache.aget(f"meta:{content_hash}")
+    content_key = redis_cache._redis_key(f"content:{content_hash}")
+    pubsub = redis_cache._aredis.pubsub()
+    await pubsub.subscribe(invalidation_bus.channel)
+    await pubsub.get_message(timeout=1)  # subscribe confirmation
+
+    assert await redis_cache.arefresh_url_content(url, metadata, 600, {"etag": '"v2"'})
+
+    assert 60 < await redis_cache._aredis.ttl(content_key) <= 600
+    refreshed = await redis_cache.aget(f"meta:{content_hash}", use_redis=False)
+    assert refreshed["etag"] == '"v2"'
+    assert refreshed["cached_at"] > metadata["cached_at"]
+    assert await pubsub.get_message(timeout=0.1) is None
+    await pubsub.aclose()
+
+    await redis_cache._aredis.delete(content_key)
+    assert not await redis_cache.arefresh_url_content(url, metadata, 600)
@@ -0,0 +1,67 @@
+import time
+import pytest
+import redis
+from app.manager.cache_manager import CacheManager
+from app.manager.circuit_breaker import CircuitBreaker
+
+
+def test_opens_after_threshold_and_recovers_through_a_probe():
+    breaker = CircuitBreaker("test", failure_threshold=2, cooldown=0.05, max_cooldown=1)
+    outage = redis.exceptions.ConnectionError("refused")
+
+    breaker.record_failure(outage)
+    assert breaker.allow()
+    breaker.record_failure(outage)
+    assert breaker.state == CircuitBreaker.OPEN
+    assert not breaker.allow()
+
+    time.sleep(0.06)
+    assert breaker.allow()          # the probe
+    assert not breaker.allow()      # only one probe at a time
+    breaker.record_success()
+
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.stats()["opened"] == 1
+    assert breaker.stats()["skipped"] == 2
+
+
+def test_failed_probe_doubles_the_cooldown_and_other_errors_do_not_count():
+    breaker = CircuitBreaker("test", failure_threshold=1, cooldown=0.05, max_cooldown=0.08)
+
+    breaker.record_failure(redis.exceptions.ResponseError("WRONGTYPE"))
+    assert breaker.state == CircuitBreaker.CLOSED
+
+    breaker.record_failure(redis.exceptions.TimeoutError("timed out"))
+    time.sleep(0.06)
+    assert breaker.allow()
+    breaker.record_failure(redis.exceptions.TimeoutError("timed out"))
+
+    assert breaker.state == CircuitBreaker.OPEN
+    assert breaker.stats()["cooldown"] == 0.08
+
+
+class DownRedis:
+    def __init__(self):
+        self.calls = 0
+
+    async def mget(self, keys):
+        self.calls += 1
+        raise redis.exceptions.ConnectionError("Connection refused")
+
+
+@pytest.mark.asyncio
+async def test_cache_serves_memory_only_while_redis_is_down():
+    breaker = CircuitBreaker("test", failure_threshold=3, cooldown=60)
+    manager = CacheManager(ttl=60)
+    manager._breaker = breaker
+    manager._aredis = down = DownRedis()
+    manager._disk = None
+    manager._memory_cache.set("parsed:job:a", {"title": "Engineer"}, 60)
+
+    for _ in range(10):
+        assert await manager.aget("parsed:job:b") is None
+    assert await manager.aget("parsed:job:a") == {"title": "Engineer"}
+
+    assert down.calls == 3
+    assert breaker.state == CircuitBreaker.OPEN
+    manager._memory_cache.stop()
@@ -0,0 +1,38 @@
+import json
+import os
+import zlib
+from app.manager.codecs import build_value_codec
+
+
+def test_small_values_round_trip_uncompressed():
+    codec = build_value_codec(compress_threshold=1024, compression_level=3)
+    for value in (b"%PDF-1.7", {"title": "Engineer", "skills": ["Python"]}, "hash", 3):
+        payload = codec.encode(value)
+        assert payload[:1] in (b"b", b"j", b"o")
+        assert codec.decode(payload) == value
+
+
+def test_large_values_are_compressed():
+    codec = build_value_codec(compress_threshold=1024, compression_level=3)
+    value = {"text": "Senior Python engineer, remote. " * 500}
+    payload = codec.encode(value)
+
+    assert payload[:1] in (b"z", b"g")
+    assert len(payload) * 5 < len(json.dumps(value))
+    assert codec.decode(payload) == value
+
+
+def test_incompressible_bytes_are_stored_raw():
+    codec = build_value_codec(compress_threshold=16, compression_level=3)
+    content = os.urandom(4096)
+    assert codec.encode(content)[:1] == b"b"
+
+
+def test_decodes_entries_from_other_codecs():
+    codec = build_value_codec(compress_threshold=1024, compression_level=3)
+    legacy_json = b"j" + json.dumps({"title": "Engineer"}).encode("utf-8")
+    zlib_wrapped = b"g" + zlib.compress(legacy_json)
+
+    assert codec.decode(legacy_json) == {"title": "Engineer"}
+    assert codec.decode(zlib_wrapped) == {"title": "Engineer"}
+    assert codec.decode(b"?unknown") is None
@@ -0,0 +1,97 @@
+from app.core.compaction import TextCompactor
+from app.core.content_processor import DocumentChunk
+
+
+def test_collapses_whitespace_and_blank_lines():
+    compactor = TextCompactor(token_budget=0)
+    text = "Senior   Engineer\t Remote  \n\n\n\n  Python and Go  "
+    assert compactor.compact(text) == "Senior Engineer Remote\n\nPython and Go"
+
+
+def _join_pages(pages):
+    starts, offset = [], 0
+    for page in pages:
+        starts.append(offset)
+        offset += len(page) + 2
+    return "\n\n".join(pages), starts
+
+
+def test_drops_repeated_headers_and_page_numbers():
+    compactor = TextCompactor(token_budget=0)
+    pages = [f"Jane Doe - Resume\nExperience at company {i}\nPage {i} of 3" for i in range(1, 4)]
+    compacted = compactor.compact(*_join_pages(pages))
+
+    assert compacted.count("Jane Doe - Resume") == 1
+    assert "Page 2 of 3" not in compacted
+    assert "Experience at company 3" in compacted
+
+
+def test_keeps_repeated_lines_and_years_in_the_page_body():
+    compactor = TextCompactor(token_budget=0)
+    pages = [
+        "Jane Doe\nExperience\nSoftware Engineer\nAcme\n2019\nBuilt APIs\nMore detail\nMore detail 2\n1",
+        "Jane Doe\nSoftware Engineer\nGlobex\n2017\nSoftware Engineer\nInitech\nDetail\n2",
+    ]
+    compacted = compactor.compact(*_join_pages(pages))
+
+    assert compacted.count("Software Engineer") == 3
+    assert "2019" in compacted and "2017" in compacted
+    assert compacted.count("Jane Doe") == 1
+    assert "\n1\n" not in f"\n{compacted}\n" and not compacted.endswith("\n2")
+
+
+def test_without_page_offsets_nothing_is_treated_as_a_header():
+    compactor = TextCompactor(token_budget=0)
+    text = "Software Engineer\nAcme\n\nSoftware Engineer\nGlobex\n\nSoftware Engineer\nInitech"
+
+    assert compactor.compact(text).count("Software Engineer") == 3
+
+
+def test_drops_boilerplate_paragraphs():
+    compactor = TextCompactor(token_budget=0)
+    text = (
+        "We are hiring a backend engineer.\n\n"
+        "Acme is an equal opportunity employer and considers applicants "
+        "without regard to race or religion.\n\n"
+        "We use cookies to improve your experience. Accept all cookies."
+    )
+    assert compactor.compact(text, remove_boilerplate=True) == "We are hiring a backend engineer."
+    assert compactor.compact(text) == text
+
+
+def test_keeps_paragraphs_that_only_mention_boilerplate_terms():
+    compactor = TextCompactor(token_budget=0)
+    text = (
+        "Built the privacy policy service used by every product team. "
+        "Led a migration of 40 services to Kubernetes and cut costs by 30%.\n\n"
+        "All rights reserved."
+    )
+
+    assert compactor.compact(text, remove_boilerplate=True) == (
+        "Built the privacy policy service used by every product team. "
+        "Led a migration of 40 services to Kubernetes and cut costs by 30%.")
+
+
+def test_enforces_token_budget_at_paragraph_boundaries():
+    compactor = TextCompactor(token_budget=50)
+    paragraphs = [f"Paragraph {i} " + "word " * 30 for i in range(10)]
+    compacted = compactor.compact("\n\n".join(paragraphs))
+
+    assert compactor._count_tokens(compacted) <= 50
+    assert compacted.startswith("Paragraph 0")
+    assert "Paragraph 9" not in compacted
+
+
+def test_budget_cut_is_recorded_in_the_chunk_metadata():
+    compactor = TextCompactor(token_budget=50)
+    chunk = DocumentChunk(
+        content_hash="abc",
+        raw_text="\n\n".join(f"Paragraph {i} " + "word " * 30 for i in range(10)),
+        file_name="cv.pdf",
+        metadata=DocumentChunk.Metadata(page_count=1, chunk_count=1),
+    )
+
+    compacted = compactor.compact_document(chunk)
+
+    assert compactor._count_tokens(compacted) <= 50
+    assert chunk.metadata.truncated_tokens > 0
@@ -0,0 +1,29 @@
+import pytest
+from app.db.models import MatchAnalysisDB, ResumeDB
+from app.manager.db import db_manager
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("model, fields", [
+    (ResumeDB, {"content_hash": "abc", "name": "resume.pdf", "type": "file"}),
+    (MatchAnalysisDB, {"overall_score": 80, "summary": "Good fit"}),
+])
+async def test_model_saves_invalidate_cached_documents(model, fields, monkeypatch):
+    saved, invalidated = [], []
+
+    async def save(self):
+        saved.append(self)
+        return self
+
+    async def invalidate_cache(document):
+        invalidated.append(document)
+
+    monkeypatch.setattr(model, "save", save)
+    monkeypatch.setattr(db_manager, "_invalidate_cache", invalidate_cache)
+    document = model.model_construct(**fields)
+    updated_at = document.updated_at
+
+    await document.save_document()
+
+    assert saved == invalidated == [document]
+    assert document.updated_at > updated_at
@@ -0,0 +1,103 @@
+import os
+import time
+import pytest
+from app.core.config import settings
+from app.manager.cache_manager import CacheManager
+from app.manager.disk_cache import DiskCache
+
+
+def test_expired_entries_are_not_returned(tmp_path):
+    disk = DiskCache(str(tmp_path / "cache.sqlite3"), max_bytes=1024, max_item_bytes=512)
+    disk.set_many({"parsed:a": b"x" * 10}, ttl=0.05)
+    disk.set_many({"parsed:b": b"y" * 10}, ttl=60)
+
+    time.sleep(0.06)
+    assert disk.get_many(["parsed:a", "parsed:b"]) == {"parsed:b": b"y" * 10}
+    disk.close()
+
+
+def test_touch_extends_only_live_entries(tmp_path):
+    disk = DiskCache(str(tmp_path / "cache.sqlite3"), max_bytes=1024, max_item_bytes=512)
+    disk.set_many({"content:a": b"x" * 10}, ttl=0.05)
+
+    assert disk.touch_many(["content:a", "content:missing"], ttl=60) == 1
+    time.sleep(0.06)
+    assert disk.get_many(["content:a"]) == {"content:a": b"x" * 10}
+    disk.close()
+
+
+def test_least_recently_used_entries_are_evicted_past_the_budget(tmp_path):
+    disk = DiskCache(str(tmp_path / "cache.sqlite3"), max_bytes=1000, max_item_bytes=500)
+    disk.set_many({"a": b"a" * 300, "b": b"b" * 300}, ttl=60)
+    time.sleep(0.01)
+    disk.get_many(["a"])
+    time.sleep(0.01)
+    disk.set_many({"c": b"c" * 300, "too_big": b"x" * 600}, ttl=60)
+    time.sleep(0.01)
+    disk.set_many({"d": b"d" * 300}, ttl=60)
+
+    assert set(disk.get_many(["a", "b", "c", "d", "too_big"])) == {"a", "c", "d"}
+    assert disk.stats()["bytes"] <= 900
+    disk.close()
+
+
+@pytest.mark.asyncio
+async def test_cache_without_redis_survives_a_restart(tmp_path):
+    path = str(tmp_path / "cache.sqlite3")
+    manager = CacheManager(ttl=60)
+    manager._redis = manager._aredis = None
+    manager._disk = DiskCache(path, max_bytes=1024 * 1024, max_item_bytes=1024 * 1024)
+
+    await manager.aset("parsed:job:a", {"title": "Engineer"})
+    await manager.acache_url_content("https://example.com/cv.pdf", b"%PDF", "application/pdf")
+    manager._disk.close()
+
+    # A fresh worker starts with an empty memory tier
+    manager._memory_cache.clear()
+    manager._disk = DiskCache(path, max_bytes=1024 * 1024, max_item_bytes=1024 * 1024)
+
+    assert await manager.aget("parsed:job:a") == {"title": "Engineer"}
+    cached = await manager.aget_url_content("https://example.com/cv.pdf")
+    assert cached["content"] == b"%PDF"
+
+    await manager.adelete("parsed:job:a")
+    manager._memory_cache.clear()
+    assert await manager.aget("parsed:job:a") is None
+    await manager.close()
+
+
+@pytest.mark.asyncio
+async def test_disk_keys_are_scoped_to_the_deployment(tmp_path):
+    path = str(tmp_path / "cache.sqlite3")
+    manager = CacheManager(ttl=60)
+    manager._redis = manager._aredis = None
+    manager._disk = DiskCache(path, max_bytes=1024 * 1024, max_item_bytes=1024 * 1024)
+    other = DiskCache(path, max_bytes=1024 * 1024, max_item_bytes=1024 * 1024)
+    other.set_many({"other-deployment:parsed:job:a": b"keep"}, ttl=60)
+
+    await manager.aset("parsed:job:a", {"title": "Engineer"})
+    await manager.ainvalidate("parsed")
+
+    assert other.get_many(["other-deployment:parsed:job:a"]) == {
+        "other-deployment:parsed:job:a": b"keep"}
+    await manager.aset("parsed:job:b", {"title": "Engineer"})
+    assert list(other.get_many([manager._redis_key("parsed:job:b")])) == [
+        f"{settings.CACHE_KEY_PREFIX}:parsed:job:b"]
+    stats = await manager.astats()
+    assert stats["disk"]["entries"] == 2
+    other.close()
+    await manager.close()
+
+
+def test_cache_directory_is_private(tmp_path):
+    disk = DiskCache(str(tmp_path / "data" / "cache.sqlite3"), max_bytes=1024, max_item_bytes=512)
+    disk.set_many({"parsed:a": b"x"}, ttl=60)
+
+    assert (tmp_path / "data").stat().st_mode & 0o077 == 0
+    disk.close()
+
+
+@pytest.mark.skipif("DISK_CACHE_PATH" in os.environ, reason="DISK_CACHE_PATH is set")
+def test_disk_tier_is_on_by_default_even_with_redis():
+    assert settings.REDIS_URL
+    assert settings.DISK_CACHE_PATH == os.path.join(settings.DATA_DIR, "cache.sqlite3")
@@ -0,0 +1,43 @@
+import io
+import zipfile
+import pytest
+from app.core.extraction import DocumentFormat, sniff_format
+
+
+def _make_zip(entry_name: str) -> bytes:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        archive.writestr(entry_name, "<xml/>")
+    return buffer.getvalue()
+
+
+def test_pdf_magic_wins_over_content_type():
+    content = b"%PDF-1.7\n..."
+    assert sniff_format(content, "application/octet-stream") == DocumentFormat.PDF
+
+
+def test_docx_detected_from_zip_contents():
+    content = _make_zip("word/document.xml")
+    assert sniff_format(content, "application/octet-stream") == DocumentFormat.DOCX
+
+
+def test_html_error_page_behind_pdf_url():
+    content = b"<!DOCTYPE html><html><body>Not found</body></html>"
+    assert sniff_format(content, "application/pdf", "https://example.com/job.pdf") == DocumentFormat.HTML
+
+
+def test_falls_back_to_content_type_and_extension():
+    assert sniff_format(b"Senior Engineer", "text/plain") == DocumentFormat.TXT
+    assert sniff_format(b"Senior Engineer", "", "posting.txt") == DocumentFormat.TXT
+
+
+def test_non_docx_zip_is_rejected():
+    content = _make_zip("xl/workbook.xml")
+    with pytest.raises(ValueError):
+        sniff_format(content, "application/zip")
+
+
+def test_legacy_doc_is_rejected_even_with_doc_extension():
+    content = b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1" + b"\x00" * 512
+    with pytest.raises(ValueError, match="Legacy Word"):
+        sniff_format(content, "application/msword", "resume.doc")
@@ -0,0 +1,115 @@
+import io
+import pytest
+from fastapi import UploadFile
+from app.engine.jobs import JobEngine
+from app.engine.resume import ResumeEngine
+from app.manager import cache_manager
+from app.services.jobs import JobData
+from app.services.resume import ResumeData
+from .test_revalidation import job_page  # noqa: F401
+
+
+class Calls:
+    def __init__(self):
+        self.extracted = 0
+        self.parsed = 0
+        self.saved = 0
+
+
+@pytest.fixture
+def calls(monkeypatch):
+    monkeypatch.setattr(cache_manager, "_aredis", None)
+    monkeypatch.setattr(cache_manager, "_disk", None)
+    cache_manager._memory_cache.delete_matching("parsed:*")
+    cache_manager._memory_cache.delete_matching("extracted:*")
+    return Calls()
+
+
+def _instrument(engine, calls, monkeypatch, parse_name, parsed):
+    async def no_record(content_hash):
+        return None
+
+    async def parse(text):
+        calls.parsed += 1
+        return parsed
+
+    async def save(*args):
+        calls.saved += 1
+
+    monkeypatch.setattr(engine, "_find_from_db", no_record)
+    is_job = isinstance(engine, JobEngine)
+    monkeypatch.setattr(engine, "_save_job" if is_job else "_save_resume", save)
+    extractor = engine.job_extractor if is_job else engine.resume_extractor
+    monkeypatch.setattr(extractor, parse_name, parse)
+
+    processor = engine.content_processor
+    for name in ("process_upload", "process_fetched", "process_text"):
+        original = getattr(processor, name)
+
+        async def counted(*args, _original=original):
+            calls.extracted += 1
+            return await _original(*args)
+
+        monkeypatch.setattr(processor, name, counted)
+    return engine
+
+
+@pytest.fixture
+def job_engine(calls, monkeypatch):
+    return _instrument(JobEngine(), calls, monkeypatch, "parse_job_description",
+                       JobData(title="Backend Engineer", description="Build services"))
+
+
+@pytest.fixture
+def resume_engine(calls, monkeypatch):
+    return _instrument(ResumeEngine(), calls, monkeypatch, "parse_resume",
+                       ResumeData(contact_info={"name": "Ada Lovelace"}))
+
+
+def _upload(content: bytes) -> UploadFile:
+    return UploadFile(file=io.BytesIO(content), filename="document.txt")
+
+
+@pytest.mark.asyncio
+async def test_repeated_job_file_and_text_skip_extraction_and_parsing(job_engine, calls):
+    first = await job_engine.from_file(_upload(b"Backend Engineer, Python"))
+    second = await job_engine.from_file(_upload(b"Backend Engineer, Python"))
+    third = await job_engine.from_text("Backend Engineer, Go")
+    fourth = await job_engine.from_text("Backend Engineer, Go")
+
+    assert (calls.extracted, calls.parsed, calls.saved) == (2, 2, 2)
+    assert all(isinstance(job, JobData) for job in (first, second, third, fourth))
+    assert second.title == "Backend Engineer"
+
+
+@pytest.mark.asyncio
+async def test_repeated_job_url_skips_the_fetch_and_parsing(job_engine, calls, job_page):  # noqa: F811
+    first = await job_engine.from_url(job_page["url"])
+    second = await job_engine.from_url(job_page["url"])
+
+    assert (calls.extracted, calls.parsed) == (1, 1)
+    assert len(job_page["requests"]) == 1
+    assert isinstance(first, JobData) and isinstance(second, JobData)
+
+
+@pytest.mark.asyncio
+async def test_repeated_resume_file_and_url_return_resume_data(resume_engine, calls, job_page):  # noqa: F811
+    uploads = [await resume_engine.from_file(_upload(b"Ada Lovelace, engineer")) for _ in range(2)]
+    links = [await resume_engine.from_url(job_page["url"]) for _ in range(2)]
+
+    assert (calls.extracted, calls.parsed) == (2, 2)
+    assert all(isinstance(resume, ResumeData) for resume in uploads + links)
+    assert links[1].contact_info.name == "Ada Lovelace"
+
+
+@pytest.mark.asyncio
+async def test_stale_cached_parse_is_dropped_and_reparsed(job_engine, calls):
+    first = await job_engine.from_text("Backend Engineer, Rust")
+    content_hash = cache_manager.hash_content("Backend Engineer, Rust")
+    # Written before description became required
+    await cache_manager.aset(f"parsed:job:{content_hash}", {"title": "Backend Engineer"})
+
+    second = await job_engine.from_text("Backend Engineer, Rust")
+
+    assert calls.parsed == 2
+    assert second == first
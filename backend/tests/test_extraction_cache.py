@@ -0,0 +1,65 @@
+import hashlib
+import io
+import pytest
+from langchain_core.documents import Document
+from app.core.content_processor import ContentProcessor, FetchedDocument, IngestedUpload
+from app.core.extraction import DocumentFormat, extraction_executor, extractor_version
+from app.core.extraction import extractors
+from app.manager import cache_manager
+
+CONTENT = b"Backend Engineer\nPython, Postgres and Redis"
+CONTENT_HASH = hashlib.sha256(CONTENT).hexdigest()
+
+
+@pytest.fixture
+def extractions(monkeypatch):
+    monkeypatch.setattr(cache_manager, "_aredis", None)
+    monkeypatch.setattr(cache_manager, "_disk", None)
+    cache_manager._memory_cache.delete_matching("extracted:*")
+    calls = []
+
+    async def extract(source, document_format):
+        calls.append(document_format)
+        return [Document(page_content=CONTENT.decode())]
+
+    monkeypatch.setattr(extraction_executor, "extract", extract)
+    return calls
+
+
+def _upload() -> IngestedUpload:
+    return IngestedUpload(content_hash=CONTENT_HASH, file_name="posting.txt",
+                          content_type="text/plain", size=len(CONTENT),
+                          file=io.BytesIO(CONTENT))
+
+
+def _fetched() -> FetchedDocument:
+    return FetchedDocument(url="https://jobs.example.com/posting.txt", content=CONTENT,
+                           content_type="text/plain", content_hash=CONTENT_HASH)
+
+
+@pytest.mark.asyncio
+async def test_upload_url_and_text_share_one_extraction(extractions):
+    processor = ContentProcessor()
+
+    uploaded = await processor.process_upload(_upload())
+    fetched = await processor.process_fetched(_fetched())
+    typed = await processor.process_text(CONTENT.decode())
+
+    assert extractions == [DocumentFormat.TXT]
+    assert uploaded.raw_text == fetched.raw_text == typed.raw_text
+    key = f"extracted:{extractor_version(DocumentFormat.TXT)}:{CONTENT_HASH}"
+    assert cache_manager._memory_cache.get(key)["text"] == uploaded.raw_text
+
+
+@pytest.mark.asyncio
+async def test_bumping_the_extractor_version_misses_the_cache(extractions, monkeypatch):
+    processor = ContentProcessor()
+    await processor.process_upload(_upload())
+
+    versions = dict(extractors.EXTRACTOR_VERSIONS)
+    versions[DocumentFormat.TXT] += 1
+    monkeypatch.setattr(extractors, "EXTRACTOR_VERSIONS", versions)
+    await processor.process_fetched(_fetched())
+    await processor.process_upload(_upload())
+
+    assert extractions == [DocumentFormat.TXT, DocumentFormat.TXT]
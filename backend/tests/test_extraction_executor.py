@@ -0,0 +1,73 @@
+import asyncio
+import os
+import time
+import pytest
+from fastapi import HTTPException
+from app.core.extraction import DocumentFormat, ExtractionExecutor
+import app.core.extraction.executor as executor_module
+
+
+def _slow_extract(source, document_format):
+    time.sleep(0.5)
+    return []
+
+
+def _crash(source, document_format):
+    os._exit(1)
+
+
+def _echo(source, document_format):
+    return [source.decode()]
+
+
+@pytest.mark.asyncio
+async def test_full_queue_is_rejected_with_503(monkeypatch):
+    monkeypatch.setattr(executor_module, "extract_documents", _slow_extract)
+    executor = ExtractionExecutor(max_workers=0, max_queue=1, task_timeout=5)
+
+    first = asyncio.create_task(executor.extract(b"a", DocumentFormat.TXT))
+    await asyncio.sleep(0.05)
+    with pytest.raises(HTTPException) as error:
+        await executor.extract(b"b", DocumentFormat.TXT)
+
+    assert error.value.status_code == 503
+    assert await first == []
+
+
+@pytest.mark.asyncio
+async def test_timed_out_task_keeps_its_slot_until_the_worker_finishes(monkeypatch):
+    monkeypatch.setattr(executor_module, "extract_documents", _slow_extract)
+    executor = ExtractionExecutor(max_workers=1, max_queue=0, task_timeout=0.1)
+    try:
+        with pytest.raises(HTTPException) as error:
+            await executor.extract(b"<html/>", DocumentFormat.HTML)
+        assert error.value.status_code == 504
+
+        # The worker is still busy, so new work is turned away at once
+        with pytest.raises(HTTPException) as error:
+            await executor.extract(b"<html/>", DocumentFormat.HTML)
+        assert error.value.status_code == 503
+
+        for _ in range(50):
+            if executor._in_flight == 0:
+                break
+            await asyncio.sleep(0.1)
+        assert executor._in_flight == 0
+    finally:
+        executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_pool_is_restarted_after_a_worker_crash(monkeypatch):
+    executor = ExtractionExecutor(max_workers=1, max_queue=1, task_timeout=10)
+    try:
+        monkeypatch.setattr(executor_module, "extract_documents", _crash)
+        with pytest.raises(HTTPException) as error:
+            await executor.extract(b"<html/>", DocumentFormat.HTML)
+        assert error.value.status_code == 500
+        assert executor._in_flight == 0
+
+        monkeypatch.setattr(executor_module, "extract_documents", _echo)
+        assert await executor.extract(b"<html/>", DocumentFormat.HTML) == ["<html/>"]
+    finally:
+        executor.shutdown()
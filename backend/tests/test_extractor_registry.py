@@ -0,0 +1,53 @@
+import os
+import subprocess
+import sys
+import pytest
+from app.core.extraction import DocumentFormat, ExtractorRegistry
+
+HEAVY_MODULES = ("pypdf", "docx", "trafilatura", "unstructured")
+
+CHECK_IMPORTS = f"""
+import sys
+import app.main
+from app.core.extraction import DocumentFormat, extract_documents, extractor_registry
+
+heavy = {HEAVY_MODULES!r}
+print(sorted(name for name in heavy if name in sys.modules))
+extract_documents(b"Engineer", DocumentFormat.TXT)
+print(sorted(name for name in heavy if name in sys.modules))
+import io, docx
+buffer = io.BytesIO()
+docx.Document().save(buffer)
+extract_documents(buffer.getvalue(), DocumentFormat.DOCX)
+print(sorted(format.value for format in extractor_registry.loaded_formats()))
+"""
+
+
+def test_app_boots_without_importing_parsing_libraries():
+    backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    result = subprocess.run(
+        [sys.executable, "-c", CHECK_IMPORTS],
+        cwd=backend_dir,
+        env={**os.environ, "OPENAI_API_KEY": os.environ.get("OPENAI_API_KEY", "test")},
+        capture_output=True, text=True, timeout=120, check=True)
+
+    at_boot, after_text, loaded = result.stdout.strip().splitlines()[-3:]
+    assert at_boot == "[]"
+    assert after_text == "[]"
+    assert loaded == "['docx', 'txt']"
+
+
+def test_extractor_is_imported_on_first_use_and_reused():
+    registry = ExtractorRegistry()
+    registry.register(DocumentFormat.TXT, "json:dumps")
+
+    assert registry.loaded_formats() == []
+    extractor = registry.get(DocumentFormat.TXT)
+    assert extractor("x") == '"x"'
+    assert registry.get(DocumentFormat.TXT) is extractor
+    assert registry.loaded_formats() == [DocumentFormat.TXT]
+
+
+def test_unregistered_format_is_rejected():
+    with pytest.raises(ValueError):
+        ExtractorRegistry().get(DocumentFormat.PDF)
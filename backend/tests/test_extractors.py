@@ -0,0 +1,73 @@
+import io
+import tempfile
+import docx
+import pytest
+from app.core.extraction import DocumentFormat, extract_documents
+
+
+def make_pdf(pages: list[str]) -> bytes:
+    """Build a minimal PDF with one line of Helvetica text per page."""
+    objects = ["<< /Type /Catalog /Pages 2 0 R >>", None,
+               "<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"]
+    kids = []
+    for text in pages:
+        stream = f"BT /F1 12 Tf 72 720 Td ({text}) Tj ET"
+        objects.append(f"<< /Length {len(stream)} >>\nstream\n{stream}\nendstream")
+        objects.append(
+            "<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            f"/Resources << /Font << /F1 3 0 R >> >> /Contents {len(objects)} 0 R >>")
+        kids.append(f"{len(objects)} 0 R")
+    objects[1] = f"<< /Type /Pages /Kids [{' '.join(kids)}] /Count {len(kids)} >>"
+
+    output = io.BytesIO()
+    output.write(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(output.tell())
+        output.write(f"{number} 0 obj\n{body}\nendobj\n".encode("latin-1"))
+    xref = output.tell()
+    output.write(f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode())
+    for offset in offsets:
+        output.write(f"{offset:010d} 00000 n \n".encode())
+    output.write(
+        f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n".encode())
+    return output.getvalue()
+
+
+def _make_docx() -> bytes:
+    document = docx.Document()
+    document.add_paragraph("Jane Doe")
+    table = document.add_table(rows=1, cols=2)
+    table.rows[0].cells[0].text = "Python"
+    table.rows[0].cells[1].text = "5 years"
+    document.add_paragraph("References on request")
+    buffer = io.BytesIO()
+    document.save(buffer)
+    return buffer.getvalue()
+
+
+def test_pdf_is_extracted_from_bytes_one_document_per_page():
+    documents = extract_documents(make_pdf(["Jane Doe", "Experience"]), DocumentFormat.PDF)
+
+    assert [document.page_content.strip() for document in documents] == ["Jane Doe", "Experience"]
+    assert [document.metadata["page"] for document in documents] == [0, 1]
+
+
+def test_docx_paragraphs_and_tables_are_extracted_in_document_order():
+    documents = extract_documents(_make_docx(), DocumentFormat.DOCX)
+
+    assert documents[0].page_content == "Jane Doe\nPython\t5 years\nReferences on request"
+
+
+@pytest.mark.parametrize("document_format, content", [
+    (DocumentFormat.TXT, "Senior Engineer – Zürich".encode("utf-8")),
+    (DocumentFormat.DOCX, _make_docx()),
+])
+def test_file_objects_are_read_in_place_from_any_position(document_format, content):
+    with tempfile.SpooledTemporaryFile() as spooled:
+        spooled.write(content)
+        # Left at the end, as after hashing an upload
+        from_file = extract_documents(spooled, document_format)
+
+    assert from_file == extract_documents(content, document_format)
+    assert from_file[0].page_content
@@ -0,0 +1,47 @@
+import sys
+import types
+import pytest
+from app.core.extraction.html import extract_html
+
+
+ARTICLE = (
+    "<html><head><title>Backend Engineer</title></head><body>"
+    "<nav><a href='/'>Home</a><a href='/jobs'>Jobs</a></nav>"
+    "<article><h1>Backend Engineer</h1>"
+    + "".join(
+        f"<p>Responsibility {number}: design, build and operate Python services "
+        f"that process millions of documents every day.</p>"
+        for number in range(6))
+    + "</article><footer>Copyright Example Corp</footer></body></html>"
+).encode()
+
+
+@pytest.fixture
+def unstructured_html(monkeypatch):
+    calls = []
+
+    def partition_html(file):
+        calls.append(file.read())
+        return ["Backend Engineer", "Apply by email"]
+
+    module = types.ModuleType("unstructured.partition.html")
+    module.partition_html = partition_html
+    monkeypatch.setitem(sys.modules, "unstructured.partition.html", module)
+    return calls
+
+
+def test_main_content_comes_from_trafilatura(unstructured_html):
+    text = extract_html(ARTICLE)[0].page_content
+
+    assert "Responsibility 5" in text
+    assert "Copyright" not in text
+    assert unstructured_html == []
+
+
+def test_thin_pages_fall_back_to_unstructured(unstructured_html):
+    page = b"<html><body><div>Backend Engineer</div><div>Apply by email</div></body></html>"
+
+    text = extract_html(page)[0].page_content
+
+    assert text == "Backend Engineer\n\nApply by email"
+    assert unstructured_html == [page]
@@ -0,0 +1,63 @@
+import pytest
+import pytest_asyncio
+from aiohttp import web
+from fastapi import HTTPException
+from app.core.http_client import HttpFetcher
+
+
+@pytest_asyncio.fixture
+async def server_url():
+    async def small(request):
+        return web.Response(body=b"hello world", content_type="text/html")
+
+    async def large(request):
+        return web.Response(body=b"x" * 2048, content_type="application/pdf")
+
+    async def missing(request):
+        return web.Response(status=404)
+
+    app = web.Application()
+    app.router.add_get("/small", small)
+    app.router.add_get("/large", large)
+    app.router.add_get("/missing", missing)
+
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    yield f"http://127.0.0.1:{port}"
+    await runner.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_fetch_returns_body_and_content_type(server_url):
+    fetcher = HttpFetcher(max_size=1024)
+    try:
+        result = await fetcher.fetch(f"{server_url}/small")
+        assert result.content == b"hello world"
+        assert result.content_type.startswith("text/html")
+    finally:
+        await fetcher.close()
+
+
+@pytest.mark.asyncio
+async def test_fetch_rejects_oversized_body(server_url):
+    fetcher = HttpFetcher(max_size=1024)
+    try:
+        with pytest.raises(HTTPException) as excinfo:
+            await fetcher.fetch(f"{server_url}/large")
+        assert excinfo.value.status_code == 413
+    finally:
+        await fetcher.close()
+
+
+@pytest.mark.asyncio
+async def test_fetch_maps_upstream_errors(server_url):
+    fetcher = HttpFetcher(max_size=1024)
+    try:
+        with pytest.raises(HTTPException) as excinfo:
+            await fetcher.fetch(f"{server_url}/missing")
+        assert excinfo.value.status_code == 502
+    finally:
+        await fetcher.close()
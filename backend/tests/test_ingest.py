@@ -0,0 +1,58 @@
+import hashlib
+import io
+import pytest
+from fastapi import HTTPException, UploadFile
+from app.core.config import settings
+from app.core.content_processor import ContentProcessor
+
+
+class CountingFile(io.BytesIO):
+    def __init__(self, content: bytes):
+        super().__init__(content)
+        self.reads = []
+
+    def read(self, size=-1):
+        chunk = super().read(size)
+        self.reads.append(len(chunk))
+        return chunk
+
+
+@pytest.mark.asyncio
+async def test_upload_is_hashed_in_chunks_and_rewound(monkeypatch):
+    monkeypatch.setattr(settings, "UPLOAD_CHUNK_SIZE", 1000)
+    content = b"resume line\n" * 500
+    file = CountingFile(content)
+    upload = UploadFile(file=file, filename="resume.txt")
+
+    ingested = await ContentProcessor().ingest_file(upload)
+
+    assert ingested.content_hash == hashlib.sha256(content).hexdigest()
+    assert ingested.size == len(content)
+    assert max(file.reads) == 1000
+    assert file.tell() == 0
+
+
+@pytest.mark.asyncio
+async def test_oversized_upload_is_rejected_before_reading_it_all(monkeypatch):
+    monkeypatch.setattr(settings, "MAX_UPLOAD_SIZE", 2500)
+    monkeypatch.setattr(settings, "UPLOAD_CHUNK_SIZE", 1000)
+    file = CountingFile(b"x" * 10_000)
+
+    with pytest.raises(HTTPException) as error:
+        await ContentProcessor().ingest_file(UploadFile(file=file, filename="big.pdf"))
+
+    assert error.value.status_code == 413
+    assert sum(file.reads) == 3000
+
+
+@pytest.mark.asyncio
+async def test_declared_size_over_the_limit_is_rejected_without_reading(monkeypatch):
+    monkeypatch.setattr(settings, "MAX_UPLOAD_SIZE", 2500)
+    file = CountingFile(b"x" * 10_000)
+
+    with pytest.raises(HTTPException) as error:
+        await ContentProcessor().ingest_file(
+            UploadFile(file=file, filename="big.pdf", size=10_000))
+
+    assert error.value.status_code == 413
+    assert file.reads == []
@@ -0,0 +1,75 @@
+import asyncio
+import json
+import pytest
+from app.core.config import settings
+from app.manager import invalidation
+from app.manager.invalidation import InvalidationBus
+
+
+def _bus_with_tier():
+    bus = InvalidationBus(channel="test:invalidate")
+    tier = {"parsed:job:a": 1, "parsed:job:b": 2, "extracted:pdf-v2:a": 3}
+
+    def evict(keys, patterns):
+        for key in keys:
+            tier.pop(key, None)
+        for pattern in patterns:
+            prefix = pattern.rstrip("*")
+            for key in [key for key in tier if key.startswith(prefix)]:
+                del tier[key]
+
+    bus.subscribe("cache", evict)
+    return bus, tier
+
+
+def test_messages_from_other_workers_evict_keys_and_patterns():
+    bus, tier = _bus_with_tier()
+    other_worker = InvalidationBus(channel="test:invalidate")
+
+    bus._handle(other_worker.encode("cache", ["extracted:pdf-v2:a"], ["parsed:*"]).encode())
+
+    assert tier == {}
+    assert bus.stats()["received"] == 1
+
+
+def test_own_messages_and_other_scopes_are_ignored():
+    bus, tier = _bus_with_tier()
+
+    bus._handle(bus.encode("cache", ["parsed:job:a"]).encode())
+    bus._handle(json.dumps({"origin": "other", "scope": "db", "keys": ["parsed:job:b"]}).encode())
+
+    assert set(tier) == {"parsed:job:a", "parsed:job:b", "extracted:pdf-v2:a"}
+
+
+def test_bus_client_uses_the_redis_timeouts(monkeypatch):
+    monkeypatch.setattr(settings, "REDIS_URL", "redis://localhost:6379/0")
+    monkeypatch.setattr(settings, "CACHE_INVALIDATION_ENABLED", True)
+
+    pool = InvalidationBus(channel="test:invalidate")._get_redis().connection_pool
+
+    assert pool.connection_kwargs["socket_timeout"] == settings.REDIS_SOCKET_TIMEOUT
+    assert pool.connection_kwargs["socket_connect_timeout"] == settings.REDIS_CONNECT_TIMEOUT
+    assert pool.max_connections == settings.REDIS_MAX_CONNECTIONS
+
+
+@pytest.mark.asyncio
+async def test_listener_keeps_polling_a_quiet_channel(monkeypatch):
+    fakeredis = pytest.importorskip("fakeredis")
+    monkeypatch.setattr(invalidation, "LISTEN_POLL_TIMEOUT", 0.05)
+    server = fakeredis.FakeServer()
+    bus, tier = _bus_with_tier()
+    bus._redis = fakeredis.aioredis.FakeRedis(server=server)
+    await bus.start()
+    await asyncio.sleep(0.2)
+
+    other_worker = InvalidationBus(channel="test:invalidate")
+    other_worker._redis = fakeredis.aioredis.FakeRedis(server=server)
+    await other_worker.publish("cache", ["parsed:job:a"])
+    for _ in range(50):
+        if "parsed:job:a" not in tier:
+            break
+        await asyncio.sleep(0.02)
+
+    assert set(tier) == {"parsed:job:b", "extracted:pdf-v2:a"}
+    await bus.stop()
+    await other_worker.stop()
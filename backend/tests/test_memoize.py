@@ -0,0 +1,119 @@
+import asyncio
+import pytest
+from pydantic import BaseModel
+from app.manager import cache_manager, cached, ModelCodec
+
+
+class Posting(BaseModel):
+    title: str
+    skills: list[str]
+
+
+@pytest.fixture(autouse=True)
+def memory_only(monkeypatch):
+    monkeypatch.setattr(cache_manager, "_aredis", None)
+    monkeypatch.setattr(cache_manager, "_disk", None)
+    cache_manager._memory_cache.clear()
+
+
+class Scraper:
+    def __init__(self):
+        self.calls = 0
+
+    @cached("test", key=lambda self, url: url, codec=ModelCodec(Posting))
+    async def fetch(self, url: str) -> Posting:
+        self.calls += 1
+        await asyncio.sleep(0.01)
+        return Posting(title=url, skills=["python"])
+
+    @cached("test", single_flight=True)
+    async def parse(self, text: str) -> dict:
+        self.calls += 1
+        await asyncio.sleep(0.05)
+        return {"text": text}
+
+
+@pytest.mark.asyncio
+async def test_method_results_are_memoized_and_decoded():
+    scraper = Scraper()
+
+    first = await scraper.fetch("a")
+    second = await scraper.fetch("a")
+
+    assert scraper.calls == 1
+    assert second == first
+    assert isinstance(second, Posting)
+    assert scraper.fetch.cache_key("a") == "test:a"
+    assert cache_manager._memory_cache.get("test:a") == {"title": "a", "skills": ["python"]}
+
+
+@pytest.mark.asyncio
+async def test_invalidate_forces_recomputation():
+    scraper = Scraper()
+
+    await scraper.fetch("b")
+    await scraper.fetch.invalidate("b")
+    await scraper.fetch("b")
+
+    assert scraper.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_single_flight_runs_concurrent_misses_once():
+    scraper = Scraper()
+
+    results = await asyncio.gather(*(scraper.parse("resume") for _ in range(5)))
+
+    assert scraper.calls == 1
+    assert results == [{"text": "resume"}] * 5
+
+
+@pytest.mark.asyncio
+async def test_none_is_not_cached_and_disabled_calls_bypass_the_cache():
+    calls = 0
+    enabled = True
+
+    @cached("test", enabled=lambda: enabled)
+    async def lookup(value):
+        nonlocal calls
+        calls += 1
+        return None if value == "missing" else value
+
+    await lookup("missing")
+    await lookup("missing")
+    assert calls == 2
+
+    await lookup("found")
+    await lookup("found")
+    assert calls == 3
+
+    enabled = False
+    await lookup("found")
+    assert calls == 4
+
+
+class Company(BaseModel):
+    name: str
+
+
+def test_model_codec_only_loads_allowed_models():
+    codec = ModelCodec({"Posting": Posting})
+    posting = Posting(title="Engineer", skills=["python"])
+
+    assert codec.load(codec.dump(posting)) == posting
+    assert codec.load({"model": "os:system", "data": {}}) is None
+    with pytest.raises(TypeError):
+        codec.dump(Company(name="Example"))
+
+
+@pytest.mark.asyncio
+async def test_stale_cached_value_is_dropped_and_recomputed():
+    scraper = Scraper()
+    # Written before Posting gained its skills field
+    cache_manager._memory_cache.set("test:c", {"title": "c"}, 60)
+
+    result = await scraper.fetch("c")
+
+    assert scraper.calls == 1
+    assert result == Posting(title="c", skills=["python"])
+    assert cache_manager._memory_cache.get("test:c") == {"title": "c", "skills": ["python"]}
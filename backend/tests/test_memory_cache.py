@@ -0,0 +1,58 @@
+import time
+from app.manager.memory_cache import MemoryCache
+
+
+def _cache(**overrides) -> MemoryCache:
+    options = dict(max_entries=3, max_bytes=1000, max_item_bytes=500, sweep_interval=0)
+    options.update(overrides)
+    return MemoryCache(**options)
+
+
+def test_evicts_least_recently_used_entry():
+    cache = _cache()
+    for key in ("a", "b", "c"):
+        cache.set(key, key, ttl=60)
+    cache.get("a")
+    cache.set("d", "d", ttl=60)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == "a"
+    assert cache.stats()["evictions"] == 1
+
+
+def test_enforces_byte_budget_and_item_limit():
+    cache = _cache(max_entries=100)
+    cache.set("a", b"x" * 400, ttl=60)
+    cache.set("b", b"x" * 400, ttl=60)
+    cache.set("c", b"x" * 400, ttl=60)
+
+    assert cache.get("a") is None
+    assert cache.stats()["bytes"] == 800
+    assert cache.set("huge", b"x" * 600, ttl=60) is False
+    assert cache.get("huge") is None
+
+
+def test_sweep_drops_expired_entries():
+    cache = _cache()
+    cache.set("short", "value", ttl=0.01)
+    cache.set("long", "value", ttl=60)
+    time.sleep(0.02)
+
+    assert cache.sweep() == 1
+    assert len(cache) == 1
+    assert cache.get("long") == "value"
+
+
+def test_values_that_cannot_be_serialized_are_rejected():
+    class Parsed:
+        def __init__(self):
+            self.text = "x" * 10_000
+
+    cache = _cache()
+    cache.set("a", {"title": "Engineer", "years": 5, "remote": True, "salary": None}, ttl=60)
+    cache.set("b", "stale", ttl=60)
+
+    assert cache.set("b", Parsed(), ttl=60) is False
+    assert cache.get("b") is None
+    assert cache.get("a")["years"] == 5
+    assert cache.stats()["rejections"] == 1
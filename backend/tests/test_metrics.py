@@ -0,0 +1,55 @@
+import pytest
+from app.manager import cache_manager
+from app.manager.metrics import CacheMetrics, render_exposition
+
+
+def test_snapshot_reports_hit_ratio_and_latency_per_namespace_and_tier():
+    metrics = CacheMetrics()
+    metrics.record_lookup("memory", hits=["parsed:job:a"], misses=["parsed:job:b", "url:x"])
+    metrics.record_lookup("redis", hits=["parsed:job:b"], misses=[])
+    metrics.record_write("redis", "parsed:job:b", 512)
+    metrics.record_eviction("memory", "parsed:job:a", "capacity")
+    metrics.record_stale("url:x")
+    metrics.observe("get", "redis", ["parsed:job:b"], 0.002)
+
+    report = metrics.snapshot()
+
+    assert report["parsed"]["memory"]["hit_ratio"] == 0.5
+    assert report["parsed"]["memory"]["evictions_capacity"] == 1
+    assert report["parsed"]["redis"]["written_bytes"] == 512
+    assert report["parsed"]["redis"]["get_latency"]["p99"] == 0.0025
+    assert report["url"]["memory"]["misses"] == 1
+    assert report["url"]["stale_served"] == 1
+
+
+def test_exposition_renders_counters_and_cumulative_histograms():
+    metrics = CacheMetrics()
+    metrics.record_lookup("memory", hits=["parsed:a"], misses=[])
+    metrics.observe("get", "memory", ["parsed:a"], 0.00002)
+    metrics.observe("get", "memory", ["parsed:a"], 0.3)
+
+    text = render_exposition(metrics.metrics(), {"up": ("gauge", "Worker is up.", 1)})
+
+    assert "# TYPE tirenohire_cache_requests_total counter" in text
+    assert 'tirenohire_cache_requests_total{namespace="parsed",tier="memory",result="hit"} 1' in text
+    assert 'tirenohire_cache_operation_seconds_bucket{operation="get",namespace="parsed",tier="memory",le="5e-05"} 1' in text
+    assert 'tirenohire_cache_operation_seconds_bucket{operation="get",namespace="parsed",tier="memory",le="+Inf"} 2' in text
+    assert 'tirenohire_cache_operation_seconds_count{operation="get",namespace="parsed",tier="memory"} 2' in text
+    assert text.endswith("tirenohire_up 1\n")
+
+
+@pytest.mark.asyncio
+async def test_cache_manager_records_lookups_and_memory_usage(monkeypatch):
+    monkeypatch.setattr(cache_manager, "_aredis", None)
+    monkeypatch.setattr(cache_manager, "_disk", None)
+    cache_manager._memory_cache.clear()
+
+    await cache_manager.aset("extracted:txt-v2:metrics", {"text": "x" * 100})
+    await cache_manager.aget("extracted:txt-v2:metrics")
+    await cache_manager.aget("extracted:txt-v2:missing")
+
+    stats = cache_manager.stats()["namespaces"]["extracted"]["memory"]
+    assert stats["hits"] >= 1
+    assert stats["misses"] >= 1
+    assert stats["entries"] == 1
+    assert stats["stored_bytes"] > 100
@@ -0,0 +1,69 @@
+import pytest
+from fastapi import HTTPException
+from app.core.http_client import FetchError
+from app.core.negative_cache import NegativeCache
+from app.manager import cache_manager
+
+
+@pytest.fixture
+def failures(monkeypatch):
+    monkeypatch.setattr(cache_manager, "_aredis", None)
+    monkeypatch.setattr(cache_manager, "_disk", None)
+    cache_manager._memory_cache.delete_matching("failure:*")
+    return NegativeCache(max_ttl=86400, host_failure_threshold=2, host_backoff=30, max_host_backoff=900)
+
+
+@pytest.mark.asyncio
+async def test_failed_url_is_skipped_with_its_original_status(failures):
+    url = "https://jobs.example.com/dead"
+    assert await failures.check(url) is False
+
+    await failures.record_failure(url, FetchError(
+        status_code=502, detail="Upstream returned HTTP 404", reason="not_found", upstream_status=404))
+
+    with pytest.raises(HTTPException) as error:
+        await failures.check(url)
+    assert error.value.status_code == 502
+    assert "Retry-After" in error.value.headers
+
+
+@pytest.mark.asyncio
+async def test_backoff_doubles_with_each_failure(failures):
+    url = "https://jobs.example.com/flaky"
+    error = FetchError(status_code=502, detail="Upstream returned HTTP 404", reason="not_found")
+
+    await failures.record_failure(url, error)
+    first = cache_manager.get(failures._url_key(url), use_redis=False)
+    await failures.record_failure(url, error)
+    second = cache_manager.get(failures._url_key(url), use_redis=False)
+
+    assert second["failures"] == 2
+    assert second["until"] - first["until"] == pytest.approx(3600, abs=5)
+
+
+@pytest.mark.asyncio
+async def test_host_backed_off_after_repeated_timeouts(failures):
+    for path in ("a", "b"):
+        await failures.record_failure(
+            f"https://slow.example.com/{path}",
+            FetchError(status_code=504, detail="Timed out", reason="timeout"))
+
+    with pytest.raises(HTTPException) as error:
+        await failures.check("https://slow.example.com/other")
+    assert error.value.status_code == 503
+
+    await failures.record_success("https://slow.example.com/other")
+    assert await failures.check("https://slow.example.com/other") is False
+
+
+@pytest.mark.asyncio
+async def test_content_check_only_rejects_failures_of_the_document(failures):
+    await failures.record_failure("https://jobs.example.com/scan.bin", HTTPException(
+        status_code=415, detail="Unsupported document format"))
+    await failures.record_failure("https://jobs.example.com/moved", FetchError(
+        status_code=502, detail="Upstream returned HTTP 404", reason="not_found"))
+
+    with pytest.raises(HTTPException) as error:
+        await failures.check_content("https://jobs.example.com/scan.bin")
+    assert error.value.status_code == 415
+    assert await failures.check_content("https://jobs.example.com/moved") is None
@@ -0,0 +1,93 @@
+import io
+import os
+import time
+import pytest
+from pypdf import PageObject, PdfReader
+from app.core.config import settings
+from app.core.extraction import DocumentFormat, ExtractionExecutor
+from app.core.extraction import pdf
+from app.core.extraction.pdf import extract_or_split_pdf, extract_pdf_pages, split_pdf
+from .test_extractors import make_pdf
+
+
+PAGES = [f"Page {number}" for number in range(7)]
+
+
+def test_split_pdf_keeps_only_each_parts_pages():
+    parts = split_pdf(make_pdf(PAGES), pages_per_part=3, max_pages=100)
+
+    assert [len(PdfReader(io.BytesIO(part)).pages) for part in parts] == [3, 3, 1]
+    assert PdfReader(io.BytesIO(parts[1])).pages[0].extract_text().strip() == "Page 3"
+
+
+def test_short_pdf_is_extracted_and_long_pdf_split_with_its_page_count():
+    page_count, documents, parts = extract_or_split_pdf(make_pdf(PAGES[:3]), 4, 2, 100)
+    assert (page_count, len(documents), parts) == (3, 3, [])
+
+    page_count, documents, parts = extract_or_split_pdf(make_pdf(PAGES), 4, 2, 5)
+    assert (page_count, documents) == (7, [])
+    assert [len(PdfReader(io.BytesIO(part)).pages) for part in parts] == [2, 2, 1]
+
+
+@pytest.mark.asyncio
+async def test_short_pdf_is_extracted_by_a_single_worker(monkeypatch):
+    web_process = os.getpid()
+    reader = pdf.PdfReader
+
+    def worker_only_reader(*args, **kwargs):
+        assert os.getpid() != web_process, "PDF parsed in the web process"
+        return reader(*args, **kwargs)
+
+    monkeypatch.setattr(pdf, "PdfReader", worker_only_reader)
+    executor = ExtractionExecutor(max_workers=2, max_queue=1, task_timeout=30)
+    try:
+        documents = await executor.extract(make_pdf(PAGES[:3]), DocumentFormat.PDF)
+    finally:
+        executor.shutdown()
+
+    assert [document.page_content.strip() for document in documents] == PAGES[:3]
+
+
+@pytest.mark.asyncio
+async def test_long_pdf_is_extracted_in_parallel_batches_in_page_order(monkeypatch):
+    monkeypatch.setattr(settings, "PDF_PARALLEL_MIN_PAGES", 4)
+    monkeypatch.setattr(settings, "PDF_PAGES_PER_TASK", 2)
+    executor = ExtractionExecutor(max_workers=2, max_queue=1, task_timeout=30)
+    try:
+        documents = await executor.extract(make_pdf(PAGES), DocumentFormat.PDF)
+    finally:
+        executor.shutdown()
+
+    assert [document.page_content.strip() for document in documents] == PAGES
+    assert [document.metadata["page"] for document in documents] == list(range(7))
+
+
+@pytest.mark.asyncio
+async def test_pages_beyond_the_cap_are_dropped(monkeypatch):
+    monkeypatch.setattr(settings, "PDF_MAX_PAGES", 5)
+    monkeypatch.setattr(settings, "PDF_PARALLEL_MIN_PAGES", 4)
+    monkeypatch.setattr(settings, "PDF_PAGES_PER_TASK", 2)
+    executor = ExtractionExecutor(max_workers=2, max_queue=1, task_timeout=30)
+    try:
+        documents = await executor.extract(make_pdf(PAGES), DocumentFormat.PDF)
+    finally:
+        executor.shutdown()
+
+    assert [document.page_content.strip() for document in documents] == PAGES[:5]
+
+
+def test_slow_page_is_skipped_after_the_page_timeout(monkeypatch):
+    extract_text = PageObject.extract_text
+
+    def hang_on_second_page(page, *args, **kwargs):
+        text = extract_text(page, *args, **kwargs)
+        if "Page 1" in text:
+            time.sleep(5)
+        return text
+
+    monkeypatch.setattr(PageObject, "extract_text", hang_on_second_page)
+    started = time.perf_counter()
+    documents = extract_pdf_pages(make_pdf(PAGES[:3]), 0, 3, page_timeout=0.2)
+
+    assert time.perf_counter() - started < 2
+    assert [document.page_content.strip() for document in documents] == ["Page 0", "", "Page 2"]
@@ -0,0 +1,129 @@
+import asyncio
+import pytest
+import pytest_asyncio
+from aiohttp import web
+from app.core.config import settings
+from app.core.content_processor import ContentProcessor
+from app.core.http_client import http_fetcher
+from app.manager import cache_manager
+
+
+@pytest_asyncio.fixture
+async def job_page():
+    state = {"body": b"Senior Engineer", "etag": '"v1"', "requests": [], "not_modified": 0}
+
+    async def page(request):
+        state["requests"].append(request.headers.get("If-None-Match"))
+        if request.headers.get("If-None-Match") == state["etag"]:
+            state["not_modified"] += 1
+            return web.Response(status=304, headers={"ETag": state["etag"]})
+        return web.Response(body=state["body"], content_type="text/plain",
+                            headers={"ETag": state["etag"]})
+
+    app = web.Application()
+    app.router.add_get("/job", page)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    state["url"] = f"http://127.0.0.1:{port}/job"
+    yield state
+    await http_fetcher.close()
+    await runner.cleanup()
+
+
+@pytest.fixture
+def stale_immediately(monkeypatch):
+    monkeypatch.setattr(cache_manager, "_aredis", None)
+    monkeypatch.setattr(cache_manager, "_disk", None)
+    monkeypatch.setattr(settings, "URL_CONTENT_SOFT_TTL", 0)
+
+
+async def _drain():
+    await asyncio.gather(*ContentProcessor._revalidations.values())
+
+
+@pytest.mark.asyncio
+async def test_stale_content_is_served_then_revalidated_with_304(job_page, stale_immediately):
+    processor = ContentProcessor()
+    first = await processor.fetch_url(job_page["url"])
+    second = await processor.fetch_url(job_page["url"])
+    await _drain()
+
+    assert second.content == first.content == b"Senior Engineer"
+    assert job_page["requests"] == [None, '"v1"']
+    assert job_page["not_modified"] == 1
+
+
+@pytest.mark.asyncio
+async def test_changed_content_is_handed_to_the_callback(job_page, stale_immediately):
+    processor = ContentProcessor()
+    first = await processor.fetch_url(job_page["url"])
+    job_page.update(body=b"Staff Engineer", etag='"v2"')
+
+    changed = []
+
+    async def on_change(fetched):
+        changed.append(fetched)
+
+    await processor.revalidate_if_stale(job_page["url"], first.content_hash, on_change)
+    await _drain()
+
+    assert [fetched.content for fetched in changed] == [b"Staff Engineer"]
+    assert await processor.cached_url_hash(job_page["url"]) == changed[0].content_hash
+
+
+@pytest.mark.asyncio
+async def test_concurrent_stale_hits_start_one_revalidation(job_page, stale_immediately, monkeypatch):
+    processor = ContentProcessor()
+    await processor.fetch_url(job_page["url"])
+    leases = []
+    acquire_lease = cache_manager.acquire_lease
+
+    async def counting_acquire(name, ttl):
+        leases.append(name)
+        return await acquire_lease(name, ttl)
+
+    monkeypatch.setattr(cache_manager, "acquire_lease", counting_acquire)
+    await asyncio.gather(*(processor.fetch_url(job_page["url"]) for _ in range(5)))
+    await _drain()
+
+    assert len(leases) == 1
+    assert job_page["requests"] == [None, '"v1"']
+
+
+@pytest.mark.asyncio
+async def test_not_modified_refreshes_metadata_without_rewriting_content(job_page, stale_immediately, monkeypatch):
+    processor = ContentProcessor()
+    first = await processor.fetch_url(job_page["url"])
+    cached_at = (await cache_manager.aget(f"meta:{first.content_hash}"))["cached_at"]
+    writes = []
+
+    async def recording_set_many(entries, *args, **kwargs):
+        writes.extend(entries)
+
+    monkeypatch.setattr(cache_manager, "aset_many", recording_set_many)
+    await processor.fetch_url(job_page["url"])
+    await _drain()
+
+    assert job_page["not_modified"] == 1
+    assert writes == []
+    assert (await cache_manager.aget(f"meta:{first.content_hash}"))["cached_at"] > cached_at
+
+
+@pytest.mark.asyncio
+async def test_fetch_url_hands_changed_content_to_the_callback(job_page, stale_immediately):
+    processor = ContentProcessor()
+    await processor.fetch_url(job_page["url"])
+    job_page.update(body=b"Staff Engineer", etag='"v2"')
+    changed = []
+
+    async def on_change(fetched):
+        changed.append(fetched.content)
+
+    served = await processor.fetch_url(job_page["url"], on_change)
+    await _drain()
+
+    assert served.content == b"Senior Engineer"
+    assert changed == [b"Staff Engineer"]
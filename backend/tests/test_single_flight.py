@@ -0,0 +1,68 @@
+import asyncio
+import pytest
+from app.manager import cache_manager
+from app.manager.single_flight import SingleFlight
+
+
+@pytest.fixture
+def coalescer(monkeypatch):
+    monkeypatch.setattr(cache_manager, "_aredis", None)
+    monkeypatch.setattr(cache_manager, "_disk", None)
+    return SingleFlight(lease_ttl=5, wait_timeout=1, poll_interval=0.01)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_callers_share_one_execution(coalescer):
+    calls = 0
+
+    async def parse():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.05)
+        return {"title": "Engineer"}
+
+    results = await asyncio.gather(*(coalescer.do("job:url:a", parse) for _ in range(5)))
+
+    assert calls == 1
+    assert results == [{"title": "Engineer"}] * 5
+    assert coalescer.stats()["coalesced"] == 4
+    assert coalescer.stats()["in_flight"] == 0
+
+
+@pytest.mark.asyncio
+async def test_failure_reaches_every_caller_and_frees_the_key(coalescer):
+    async def fail():
+        await asyncio.sleep(0.01)
+        raise ValueError("parse failed")
+
+    results = await asyncio.gather(
+        *(coalescer.do("job:url:b", fail) for _ in range(3)), return_exceptions=True)
+    assert all(isinstance(result, ValueError) for result in results)
+
+    async def succeed():
+        return "ok"
+
+    assert await coalescer.do("job:url:b", succeed) == "ok"
+
+
+@pytest.mark.asyncio
+async def test_follower_takes_result_from_other_worker(coalescer, monkeypatch):
+    async def lease_taken(name, ttl):
+        return None
+
+    async def lease_held(name):
+        return True
+
+    monkeypatch.setattr(cache_manager, "acquire_lease", lease_taken)
+    monkeypatch.setattr(cache_manager, "lease_held", lease_held)
+
+    lookups = iter([None, None, {"title": "Engineer"}])
+
+    async def lookup():
+        return next(lookups)
+
+    async def parse():
+        raise AssertionError("follower must not parse")
+
+    assert await coalescer.do("job:url:c", parse, lookup) == {"title": "Engineer"}
+    assert coalescer.stats()["remote_hits"] == 1
@@ -0,0 +1,52 @@
+import pytest
+from fastapi import HTTPException
+from app.core.content_processor import ContentProcessor, FetchedDocument
+from app.core.negative_cache import negative_cache
+from app.manager import cache_manager
+
+
+@pytest.fixture
+def processor(monkeypatch):
+    monkeypatch.setattr(cache_manager, "_aredis", None)
+    monkeypatch.setattr(cache_manager, "_disk", None)
+    cache_manager._memory_cache.delete_matching("failure:*")
+    return ContentProcessor()
+
+
+def _fetched(url, content, content_type="text/plain"):
+    return FetchedDocument(url=url, content=content, content_type=content_type,
+                           content_hash=cache_manager.hash_content(content))
+
+
+@pytest.mark.asyncio
+async def test_extraction_bug_is_a_500_and_not_negative_cached(processor, monkeypatch):
+    async def broken_extract(*args):
+        raise ValueError("bad offset")
+
+    monkeypatch.setattr(processor, "_extract_document", broken_extract)
+    url = "https://jobs.example.com/bug"
+
+    with pytest.raises(HTTPException) as error:
+        await processor.process_fetched(_fetched(url, b"Engineer"))
+
+    assert error.value.status_code == 500
+    assert await negative_cache.check(url) is False
+
+
+@pytest.mark.asyncio
+async def test_unsupported_cached_url_is_rejected_before_its_content_is_read(processor, monkeypatch):
+    url = "https://jobs.example.com/scan.bin"
+    content = b"\x00\x01binary"
+    await cache_manager.acache_url_content(url, content, "application/octet-stream")
+
+    with pytest.raises(HTTPException) as error:
+        await processor.process_fetched(_fetched(url, content, "application/octet-stream"))
+    assert error.value.status_code == 415
+
+    async def unexpected_read(url):
+        raise AssertionError("cached content read for a rejected URL")
+
+    monkeypatch.setattr(cache_manager, "aget_url_content", unexpected_read)
+    with pytest.raises(HTTPException) as error:
+        await processor.fetch_url(url)
+    assert error.value.status_code == 415